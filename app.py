@@ -10,26 +10,113 @@ from PyQt5.QtWidgets import (
     QLabel, QPushButton, QSlider, QSpinBox, QDoubleSpinBox, QCheckBox,
     QRadioButton, QButtonGroup, QGroupBox, QFileDialog, QScrollArea,
     QFrame, QComboBox, QProgressBar, QMessageBox, QSplitter,
-    QGridLayout, QSizePolicy
+    QGridLayout, QSizePolicy, QToolButton
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer, QObject, QUrl
+from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer, QObject, QUrl, QSignalBlocker, QMutex, QWaitCondition
 from PyQt5.QtGui import QPixmap, QImage, QFont, QIcon
 from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent
 import cv2
 import numpy as np
-from PIL import Image
 import os
 import threading
 from pathlib import Path
-from audio_analysis import AudioAnalyzer
-from video_processor import VideoProcessor
-from image_to_video import ImageToVideoProcessor
+# audio_analysis (scipy/numba), video_processor and image_to_video are imported
+# where they are used, so the window is up before those libraries load
+from status_messages import STATUS_MESSAGES
 from custom_modals import CustomMessageBox, CustomQuestion
 import tempfile
 import subprocess
 import shutil
 import random
 import time
+import queue
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict, deque
+
+# Webcam capture sizes offered in the webcam controls (None = camera default)
+WEBCAM_RESOLUTIONS = [
+    ("Camera default", None),
+    ("480p (fastest)", (640, 480)),
+    ("720p", (1280, 720)),
+    ("1080p", (1920, 1080)),
+]
+
+# Most queued webcam frames skipped before a read when the camera ignores
+# CAP_PROP_BUFFERSIZE (more would block waiting for frames not yet captured)
+WEBCAM_MAX_STALE_FRAMES = 3
+
+# Qt >= 5.14 can wrap OpenCV's BGR frames directly, without a BGR -> RGB pass
+QIMAGE_HAS_BGR888 = hasattr(QImage, 'Format_BGR888')
+
+# Stylesheet shared by every control group box
+GROUPBOX_STYLE = """
+    QGroupBox {
+        font-weight: bold;
+        border: 2px solid #ccc;
+        border-radius: 5px;
+        margin-top: 10px;
+        padding-top: 10px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+    }
+"""
+
+# Minimum gap between the end of one interactive preview render and the next
+PREVIEW_THROTTLE_MS = 50
+
+# Progress, status text and processing frames sent by worker threads are
+# applied to the widgets at most once per this interval
+STATUS_FLUSH_MS = 100
+
+# Preview resolution factor while an effect slider is being dragged
+DRAG_PREVIEW_SCALE = 0.5
+
+# Recently loaded videos whose captures stay open for switching back
+VIDEO_CAPTURE_POOL_SIZE = 2
+
+# Drift between the local audio clock and the media player that triggers a resync
+AUDIO_RESYNC_MS = 50
+
+# Webcam frames that may wait for the recording encoder before new ones are dropped
+RECORDING_QUEUE_SIZE = 4
+
+# Forward slider moves up to this many frames are decoded with grab() rather
+# than a keyframe seek
+SCRUB_GRAB_LIMIT = 30
+
+# File extensions (lowercase) picked up by folder mode
+FOLDER_IMAGE_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg', '.bmp', '.tiff', '.webp'})
+
+# Threads decoding and fitting folder-mode images in parallel
+FOLDER_LOAD_WORKERS = 8
+
+# Frames FramePrefetcher decodes ahead of the frame slider (~6 MB each at 1080p)
+VIDEO_PREFETCH_FRAMES = 12
+
+# Frames buffered between decode, effects and encode during renders
+RENDER_QUEUE_FRAMES = 8
+
+# Frequency bands in mixer column order (also the packed band-energy column order)
+MIXER_BANDS = ('sub_bass', 'bass', 'mid', 'treble', 'high_treble')
+
+# Artistic effects driven by the frequency mixer, in weight-matrix row order
+ARTISTIC_EFFECTS = (
+    'pixel_sort', 'kaleidoscope', 'wave_distortion', 'vhs',
+    'posterization', 'edge_detection', 'data_corruption', 'scan_lines',
+)
+# Matching VideoProcessor.apply_effects keyword names
+ARTISTIC_INTENSITY_KEYS = tuple(f"{effect}_intensity" for effect in ARTISTIC_EFFECTS)
+
+# Slider value label text indexed by slider value, built once instead of
+# formatted on every tick: hundredths (0-200, zoom and the 0-1 sliders),
+# tenths of a degree (rotation, 0-150) and mixer weights (0-100, one decimal)
+HUNDREDTHS_TEXT = tuple(f"{i / 100:.2f}" for i in range(201))
+ROTATION_TEXT = tuple(f"{i / 10:.2f}°" for i in range(151))
+MIX_WEIGHT_TEXT = tuple(f"{i / 100:.1f}" for i in range(101))
 
 
 def get_ffmpeg_path() -> str:
@@ -99,6 +186,28 @@ def resource_path(relative_name: str) -> str:
     return os.path.join(os.path.dirname(os.path.abspath(__file__)), relative_name)
 
 
+@functools.lru_cache(maxsize=None)
+def logo_pixmap(width: int = 0, height: int = 0) -> QPixmap:
+    """
+    The SoundReactive logo, optionally scaled to fit width x height.
+    
+    The PNG is decoded once per process and each scaled size is made once,
+    so the splash screen and the main window header share one decode.
+    Returns a null QPixmap if the logo file is missing or unreadable.
+    Requires a QApplication.
+    """
+    if width and height:
+        source = logo_pixmap()
+        if source.isNull():
+            return source
+        return source.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    logo_path = resource_path("SoundReactive_Logo_Transparent_BG.png")
+    if not os.path.exists(logo_path):
+        print(f"Logo not found at: {logo_path}")
+        return QPixmap()
+    return QPixmap(logo_path)
+
+
 class ProcessingSignals(QObject):
     """Signals for thread-safe GUI updates"""
     progress_update = pyqtSignal(int, str)  # progress_percent, status_message
@@ -106,6 +215,395 @@ class ProcessingSignals(QObject):
     analysis_progress = pyqtSignal(str)  # analysis status message
 
 
+class WebcamWorker(QThread):
+    """
+    Webcam capture + effect loop
+    
+    Frames are decoded into one of three preallocated slots and only the slot
+    index is sent to the GUI, so no frame array is allocated or handed across
+    the signal boundary per frame. The GUI reads the most recently published
+    slot while holding lock, and the worker publishes under the same lock, so
+    it can't move on to refill that slot mid-read. The raw camera frame for
+    the preview modes is copied into the preallocated raw_frame, also under
+    lock; the GUI snapshots it only when it needs it.
+    
+    With drain_stale set (camera ignored CAP_PROP_BUFFERSIZE=1), frames that
+    queued up in the driver while the previous frame was being processed are
+    grabbed and discarded before each read, so the effects always run on the
+    newest frame instead of one that is several frames old.
+    
+    Like PreviewWorker, this thread never reads widgets or effect state: the
+    GUI thread computes the effect parameters for the audio clock on every
+    published frame and hands them over with set_effect_kwargs().
+    """
+    frame_ready = pyqtSignal(int)  # slot index in buffers
+    
+    def __init__(self, gui, cap, width, height, drain_stale=False):
+        super().__init__(gui)
+        self.gui = gui
+        self.cap = cap
+        self.drain_stale = drain_stale
+        self.buffers = [np.empty((height, width, 3), dtype=np.uint8) for _ in range(3)]
+        self.raw_frame = np.empty((height, width, 3), dtype=np.uint8)
+        self.lock = threading.Lock()
+        self.write_idx = 0
+        self.latest_idx = -1
+        self.start_time = time.time()
+        # Latest apply_effects arguments from the GUI thread (None: show raw frames)
+        self._effect_kwargs = None
+        self._running = True
+    
+    def stop(self):
+        """Ask the capture loop to exit (pair with wait())"""
+        self._running = False
+    
+    def set_effect_kwargs(self, effect_kwargs):
+        """Use these effect parameters from the next frame on (called from the GUI thread)"""
+        self._effect_kwargs = effect_kwargs
+    
+    def run(self):
+        gui = self.gui
+        last_read = None
+        
+        while self._running and self.cap.isOpened():
+            if self.drain_stale and last_read is not None:
+                # Frames captured while we were busy are already queued; skip them
+                stale = int((time.perf_counter() - last_read) * gui.fps)
+                for _ in range(min(stale, WEBCAM_MAX_STALE_FRAMES)):
+                    if not self.cap.grab():
+                        break
+            
+            slot = self.buffers[self.write_idx]
+            ret, frame = self.cap.read(slot)
+            if not ret:
+                break
+            last_read = time.perf_counter()
+            if frame is not slot:
+                # Camera changed resolution; adopt the new frame as this slot
+                self.buffers[self.write_idx] = slot = frame
+            
+            # Keep the raw frame for the preview modes (the slot receives the
+            # processed frame)
+            with self.lock:
+                if self.raw_frame.shape != slot.shape:
+                    self.raw_frame = np.empty_like(slot)
+                np.copyto(self.raw_frame, slot)
+            
+            # Apply effects once the GUI has sent parameters (audio loaded and analyzed)
+            effect_kwargs = self._effect_kwargs
+            if effect_kwargs is not None:
+                try:
+                    processed_frame = gui._effects_processor().apply_effects(slot, **effect_kwargs)
+                except Exception:
+                    # If effects fail, use original frame
+                    processed_frame = slot
+                if processed_frame is not slot:
+                    if processed_frame.shape == slot.shape:
+                        np.copyto(slot, processed_frame)
+                    else:
+                        self.buffers[self.write_idx] = slot = processed_frame
+            
+            # Publish the slot and move on to the next one
+            with self.lock:
+                self.latest_idx = self.write_idx
+            self.frame_ready.emit(self.write_idx)
+            self.write_idx = (self.write_idx + 1) % len(self.buffers)
+            
+            # Hand the frame to the recording thread if active (never blocks on the encoder)
+            if gui.is_recording and gui.recording_writer and gui._queue_recording_frame(slot):
+                gui.recording_frame_count += 1
+                
+                # Update status with recording info
+                if gui.recording_frame_count % 30 == 0:  # Every second
+                    duration = gui.recording_frame_count / gui.fps
+                    message = f"{gui.recording_status_message} - {duration:.1f}s"
+                    gui.processing_signals.progress_update.emit(
+                        int((duration / 60) * 100) if duration < 60 else 99, message
+                    )
+            
+            # Control frame rate (roughly)
+            time.sleep(max(0.001, 1.0 / gui.fps - 0.01))  # Small buffer for processing time
+
+
+class PreviewWorker(QThread):
+    """
+    Preview effects renderer
+    
+    The GUI thread gathers the effect parameters (reading the widgets and
+    advancing the smoothing state) and submits them with the display-sized
+    frame; this thread runs the effects and hands the result back through
+    frame_ready. Requests go into a single slot: one submitted while a render
+    is in progress replaces any request still waiting, so the thread always
+    moves on to the newest state and the GUI never waits for a render.
+    """
+    frame_ready = pyqtSignal(object, float, int)  # frame, max_scale, request id
+    
+    def __init__(self, gui):
+        super().__init__(gui)
+        self.gui = gui
+        # Memoized effect stages for the preview frame (see VideoProcessor._run_stages)
+        self.stage_cache = {}
+        self._mutex = QMutex()
+        self._wake = QWaitCondition()
+        self._pending = None
+        self._running = True
+    
+    def submit(self, request_id, frame, effect_kwargs, side_by_side, max_scale):
+        """
+        Queue a render, replacing any request that hasn't started yet
+        
+        Args:
+            request_id: Echoed back with the result
+            frame: Display-sized BGR frame (never modified)
+            effect_kwargs: VideoProcessor.apply_effects arguments, or None
+            side_by_side: Show the original frame left of the processed one
+            max_scale: Passed through to _show_preview_frame
+        """
+        self._mutex.lock()
+        try:
+            self._pending = (request_id, frame, effect_kwargs, side_by_side, max_scale)
+            self._wake.wakeOne()
+        finally:
+            self._mutex.unlock()
+    
+    def stop(self):
+        """Ask the render loop to exit (pair with wait())"""
+        self._mutex.lock()
+        try:
+            self._running = False
+            self._wake.wakeOne()
+        finally:
+            self._mutex.unlock()
+    
+    def run(self):
+        while True:
+            self._mutex.lock()
+            try:
+                while self._running and self._pending is None:
+                    self._wake.wait(self._mutex)
+                if not self._running:
+                    return
+                request, self._pending = self._pending, None
+            finally:
+                self._mutex.unlock()
+            
+            request_id, frame, effect_kwargs, side_by_side, max_scale = request
+            try:
+                if effect_kwargs is None:
+                    processed = frame
+                else:
+                    processed = self.gui._effects_processor().apply_effects(
+                        frame, stage_cache=self.stage_cache, **effect_kwargs)
+            except Exception as e:
+                print(f"Preview render failed: {e}")
+                continue
+            # Side-by-side panes are scaled straight into the display buffer
+            display_frame = (frame, processed) if side_by_side else processed
+            self.frame_ready.emit(display_frame, max_scale, request_id)
+
+
+class FramePrefetcher(QThread):
+    """
+    Decode-ahead for frame slider moves in video mode
+    
+    Reads the video sequentially on its own capture, keeping up to
+    VIDEO_PREFETCH_FRAMES frames following the one last shown, so stepping
+    forward through the video takes frames that are already decoded. take()
+    drops frames the slider has moved past; when the requested frame lies
+    behind the decoder or further ahead than SCRUB_GRAB_LIMIT, the decoder is
+    restarted just after it. Frames between the decoder and the slider are
+    skipped with grab().
+    """
+    
+    def __init__(self, gui, path, start_idx):
+        super().__init__(gui)
+        self.path = path
+        self.frames = deque()  # (frame_idx, frame), consecutive
+        self._mutex = QMutex()
+        self._wake = QWaitCondition()
+        self._seek = start_idx  # Frame to restart decoding at, if any
+        self._wanted = start_idx  # First frame the GUI may still ask for
+        self._pos = None  # Next frame the decoder will read
+        self._at_end = False
+        self._running = True
+    
+    def take(self, idx):
+        """
+        Pop frame idx if it has been decoded already
+        
+        Args:
+            idx: Frame index the GUI is moving to
+        
+        Returns:
+            BGR frame, or None if the caller has to decode it
+        """
+        self._mutex.lock()
+        try:
+            while self.frames and self.frames[0][0] < idx:
+                self.frames.popleft()
+            frame = self.frames.popleft()[1] if self.frames and self.frames[0][0] == idx else None
+            self._wanted = idx + 1
+            if frame is None and not (self._pos is not None
+                                      and 0 <= self._wanted - self._pos <= SCRUB_GRAB_LIMIT):
+                self._seek = self._wanted
+                self.frames.clear()
+            self._wake.wakeOne()
+            return frame
+        finally:
+            self._mutex.unlock()
+    
+    def stop(self):
+        """Ask the decode loop to exit (pair with wait())"""
+        self._mutex.lock()
+        try:
+            self._running = False
+            self._wake.wakeOne()
+        finally:
+            self._mutex.unlock()
+    
+    def run(self):
+        cap = cv2.VideoCapture(self.path)
+        try:
+            while True:
+                self._mutex.lock()
+                try:
+                    while self._running and self._seek is None and (
+                            self._at_end or len(self.frames) >= VIDEO_PREFETCH_FRAMES):
+                        self._wake.wait(self._mutex)
+                    if not self._running:
+                        return
+                    seek, self._seek = self._seek, None
+                    if seek is not None:
+                        self._pos = seek
+                        self._at_end = False
+                    pos = self._pos
+                    skip = pos < self._wanted
+                finally:
+                    self._mutex.unlock()
+                
+                if seek is not None:
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, seek)
+                if skip:
+                    ret, frame = cap.grab(), None
+                else:
+                    ret, frame = cap.read()
+                
+                self._mutex.lock()
+                try:
+                    # A restart requested during the read invalidates this frame
+                    if self._seek is None:
+                        if not ret:
+                            self._at_end = True
+                        else:
+                            if frame is not None:
+                                self.frames.append((pos, frame))
+                            self._pos = pos + 1
+                finally:
+                    self._mutex.unlock()
+        finally:
+            cap.release()
+
+
+def iter_frames_ahead(cap, max_frames=None):
+    """
+    Yield frames read from cap, decoded ahead on a background thread
+    
+    Up to RENDER_QUEUE_FRAMES frames are decoded while the caller applies
+    effects to the current one. The decoder thread is stopped and joined
+    when iteration ends (also on break or an exception), so cap can be used
+    again afterwards.
+    
+    Args:
+        cap: Opened cv2.VideoCapture
+        max_frames: Stop after this many frames (None reads to the end)
+    """
+    frames = queue.Queue(maxsize=RENDER_QUEUE_FRAMES)
+    stop = threading.Event()
+    
+    def put(item):
+        while not stop.is_set():
+            try:
+                frames.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+    
+    def decode():
+        count = 0
+        while not stop.is_set() and (max_frames is None or count < max_frames):
+            ret, frame = cap.read()
+            if not ret:
+                break
+            put(frame)
+            count += 1
+        put(None)
+    
+    thread = threading.Thread(target=decode, daemon=True)
+    thread.start()
+    try:
+        while True:
+            frame = frames.get()
+            if frame is None:
+                return
+            yield frame
+    finally:
+        stop.set()
+        thread.join()
+
+
+class BackgroundFrameWriter:
+    """
+    cv2.VideoWriter-style wrapper that writes frames on a background thread
+    
+    write() only queues the frame (blocking once RENDER_QUEUE_FRAMES are
+    waiting), so encoding overlaps with effect processing. Frames must not
+    be modified after they are written. An encoder error is raised by the
+    next write() or by release(), whichever comes first, and only once.
+    """
+    
+    def __init__(self, writer):
+        self._writer = writer
+        self._frames = queue.Queue(maxsize=RENDER_QUEUE_FRAMES)
+        self._error = None
+        self._error_raised = False
+        self._thread = threading.Thread(target=self._drain, daemon=True)
+        self._thread.start()
+    
+    def isOpened(self):
+        return self._writer.isOpened()
+    
+    def write(self, frame):
+        self._raise_error()
+        self._frames.put(frame)
+    
+    def release(self):
+        """Write the queued frames, then release the wrapped writer"""
+        self._frames.put(None)
+        self._thread.join()
+        try:
+            self._raise_error()
+        finally:
+            # Always release, so a failed encode can't leak the ffmpeg process
+            self._writer.release()
+    
+    def _raise_error(self):
+        if self._error is not None and not self._error_raised:
+            self._error_raised = True
+            raise self._error
+    
+    def _drain(self):
+        while True:
+            frame = self._frames.get()
+            if frame is None:
+                return
+            if self._error is None:
+                try:
+                    self._writer.write(frame)
+                except Exception as e:
+                    # Keep draining so write() never blocks; write()/release() re-raise
+                    self._error = e
+
+
 class SoundReactiveSplash(QWidget):
     """
     Animated splash screen shown while the main window loads.
@@ -133,13 +631,9 @@ class SoundReactiveSplash(QWidget):
 
         # Logo pixmap
         self._logo_pixmap: QPixmap | None = None
-        logo_path = resource_path("SoundReactive_Logo_Transparent_BG.png")
-        if os.path.exists(logo_path):
-            px = QPixmap(logo_path)
-            if not px.isNull():
-                self._logo_pixmap = px.scaled(
-                    200, 200, Qt.KeepAspectRatio, Qt.SmoothTransformation
-                )
+        px = logo_pixmap(200, 200)
+        if not px.isNull():
+            self._logo_pixmap = px
 
         # Fade-in + pulse timer (60 fps)
         self._anim_timer = QTimer(self)
@@ -274,8 +768,9 @@ class SoundReactiveGUI(QMainWindow):
         ]
         for _icon_path in _icon_candidates:
             if os.path.exists(_icon_path):
-                self.setWindowIcon(QIcon(_icon_path))
-                QApplication.setWindowIcon(QIcon(_icon_path))
+                _icon = QIcon(_icon_path)
+                self.setWindowIcon(_icon)
+                QApplication.setWindowIcon(_icon)
                 break
         
         # Application state
@@ -283,21 +778,33 @@ class SoundReactiveGUI(QMainWindow):
         self.image_path = None
         self.image_folder_path = None
         self.image_list = []  # List of images for folder mode
+        # Folder images fitted to the output size: ((image_list, width, height), images)
+        self._folder_images = (None, None)
+        self._folder_images_lock = threading.Lock()
         self.audio_path = None
         self.video_cap = None
+        self._cap_pool = OrderedDict()  # (path, mtime, size) -> open VideoCapture, LRU order
         self.webcam_cap = None
         self.is_recording = False
         self.recording_writer = None
-        self.webcam_thread = None
+        self.webcam_worker = None
         self.recording_output_path = None
         self.recording_start_time = None
         self.recording_frame_count = 0
+        self.recording_status_message = None  # Picked once per recording
+        self._rec_queue = None  # Frames waiting for the recording encoder
+        self._rec_free = None  # Preallocated frames available to the queue
+        self._rec_thread = None
         
         # Audio player for webcam mode
         self.audio_player = None
         self.audio_position = 0  # Current audio position in milliseconds
         self.audio_loop_count = 0  # Track how many times audio has looped
+        # time.monotonic() at which playback was at position 0 (None = not playing)
+        self._audio_t0 = None
         self.current_frame_idx = 0
+        self._last_decoded_idx = None  # Frame the video capture last decoded
+        self._frame_prefetcher = None  # FramePrefetcher for the loaded video
         self.total_frames = 0
         self.fps = 30.0
         self.current_frame = None
@@ -306,163 +813,79 @@ class SoundReactiveGUI(QMainWindow):
         self.frame_times = None
         self.bass_beat_frames = None
         self.snare_hit_frames = None
+        # Packed copies of the above for per-frame lookups (see _bind_analysis)
+        self._band_energies = None  # (n_frames, len(MIXER_BANDS)) float32
+        # _band_energies resampled per video frame, and the (source, fps,
+        # total_frames) it was built for (see _frame_band_energies)
+        self._frame_bands = None
+        self._frame_bands_key = (None, None, None)
+        self._bass_beat_times = np.empty(0, dtype=np.float32)
+        self._snare_hit_times = np.empty(0, dtype=np.float32)
         self.mode = "video"
         self.logo_photo = None
-        self.prev_effect_intensities = {}
+        # Smoothed artistic intensities (ARTISTIC_EFFECTS order) and which
+        # effects have been seeded yet
+        self._prev_intensities = np.zeros(len(ARTISTIC_EFFECTS), dtype=np.float32)
+        self._prev_seeded = np.zeros(len(ARTISTIC_EFFECTS), dtype=bool)
         self.effect_smoothing_factor = 0.3
         self.width = None
         self.height = None
         self.audio_duration = None
+        # Throttles bursts of slider/checkbox changes into at most one preview
+        # render per PREVIEW_THROTTLE_MS (see update_preview)
+        self._preview_dirty_timer = QTimer(self)
+        self._preview_dirty_timer.setSingleShot(True)
+        self._preview_dirty_timer.timeout.connect(self._do_update_preview)
+        self._preview_rendered_at = 0.0  # time.monotonic() when the last render finished
+        self._slider_dragging = False  # An effect slider is held: render draft previews
+        
+        # Preview effects run on a worker thread; results of superseded
+        # requests are dropped by id (see _render_preview)
+        self._preview_worker = PreviewWorker(self)
+        self._preview_worker.frame_ready.connect(self._on_preview_ready)
+        self._preview_worker.start()
+        self._preview_request_id = 0
+        # Start the effects' parallel runtime on this thread once the window is up
+        QTimer.singleShot(0, self._start_effects_runtime)
+        # Display-sized copy of current_frame: (frame, size, scaled)
+        self._preview_source_cache = (None, None, None)
+        
+        # Reusable preview buffers (see _show_preview_frame)
+        self._preview_scaled = None
+        self._preview_display = None
+        self._preview_qimage = None
+        # Frame and label size of the last _show_preview_frame call
+        self._preview_shown_frame = None
+        self._preview_shown_size = None
         
         # Processing signals for thread-safe updates
         self.processing_signals = ProcessingSignals()
         self.processing_signals.progress_update.connect(self._update_progress)
         self.processing_signals.frame_update.connect(self._update_frame_preview)
         self.processing_signals.analysis_progress.connect(self._update_analysis_status)
-        
-        # ====================================================================
-        # STATUS MESSAGES - Add your own custom messages here!
-        # ====================================================================
-        # These messages are randomly selected during processing to provide
-        # engaging feedback. Add your own messages to any category by simply
-        # adding them to the list. The more messages, the more variety!
-        # ====================================================================
-        self.status_messages = {
-            'audio_extraction': [
-                "Extracting audio from video...",
-                "Separating audio track...",
-                "Preparing audio for analysis...",
-                "Isolating sound frequencies...",
-                "Extracting audio from video... gently, so it doesn’t scream.",
-                "Separating sound from vision like a very polite divorce.",
-                "Convincing the audio track to come out on its own.",
-                "Removing sound from pictures, which were clearly very attached.",
-                "Liberating audio from its visual obligations.",
-                "Peeling off the soundtrack without damaging the spacetime continuum.",
-                "Listening very carefully while pretending this is difficult."
-            ],
-            'audio_analysis': [
-                "Analyzing frequency spectrum...",
-                "Detecting beats and rhythms...",
-                "Mapping audio to visual effects...",
-                "Computing energy curves...",
-                "Identifying bass drops and snare hits...",
-                "Breaking down frequency bands...",
-                "Calculating audio reactivity...",
-                "Finding the perfect sync points...",
-                "Analyzing frequency spectrum like it owes us money.",
-                "Listening to the music with a furrowed digital brow.",
-                "Detecting beats, rhythms, and questionable artistic decisions.",
-                "Mapping sound waves while nodding thoughtfully.",
-                "Identifying bass drops and moments of existential crisis.",
-                "Breaking audio into frequencies, none of which asked for this.",
-                "Calculating audio reactivity using advanced maths and mild optimism.",
-                "Searching for sync points where everything briefly makes sense.",
-                "Pretending to understand music theory.",
-                "Measuring vibes with highly scientific enthusiasm."
-            ],
-            'processing_start': [
-                "Initializing video processing...",
-                "Setting up effect pipeline...",
-                "Preparing to transform your media...",
-                "Loading transformation engine...",
-                "Ready to create magic...",
-                "Initializing video processing. This may involve drama.",
-                "Starting the transformation engine. No refunds.",
-                "Preparing to bend reality slightly.",
-                "Booting up the creative machinery. Please stand back.",
-                "Aligning bits, bytes, and expectations.",
-                "Checking if the laws of physics are negotiable today.",
-                "Warming up the pixels. They respond better that way.",
-                "Everything is ready. Confidence is simulated."
-            ],
-            'processing_frame': [
-                "Applying audio-reactive effects...",
-                "Syncing visuals with music...",
-                "Creating dynamic transformations...",
-                "Morphing frames to the beat...",
-                "Blending frequencies into visuals...",
-                "Transforming pixels to music...",
-                "Making your image dance...",
-                "Weaving audio into visuals...",
-                "Painting with sound waves...",
-                "Bringing static to life...",
-                "Channeling the rhythm...",
-                "Translating frequencies to motion...",
-                "Applying audio-reactive effects with reckless precision.",
-                "Syncing visuals to music, because silence is awkward.",
-                "Making pixels dance despite their lack of limbs.",
-                "Translating sound into motion using questionable logic.",
-                "Convincing frames to feel the rhythm.",
-                "Blending frequencies into visuals like a confused DJ.",
-                "Turning static images into overachievers.",
-                "Channeling rhythm through entirely innocent pixels.",
-                "Painting with sound, without a license.",
-                "Bending frames to the beat. They resist at first.",
-                "Creating motion where none was previously agreed upon.",
-                "Encouraging visuals to express themselves musically."
-            ],
-            'merging': [
-                "Merging audio and video...",
-                "Synchronizing final output...",
-                "Combining audio-reactive visuals...",
-                "Finalizing your creation...",
-                "Putting it all together..."
-                "Merging audio and video in holy matrimony.",
-                "Reuniting sound and vision after their trial separation.",
-                "Synchronizing everything and hoping no one notices the seams.",
-                "Combining parts into something greater than their regrets.",
-                "Stitching reality back together.",
-                "Final assembly underway. Fingers crossed.",
-                "Aligning timelines like a responsible time traveller."
-            ],
-            'complete': [
-                "Processing complete!",
-                "Your audio-reactive video is ready!",
-                "Transformation finished successfully!",
-                "Your masterpiece is complete!",
-                "Ready to share your creation!",
-                "Processing complete. Nobody panicked. Much.",
-                "Your audio-reactive video is ready and surprisingly coherent.",
-                "Transformation finished. Reality remains intact.",
-                "Your masterpiece is complete. Define masterpiece loosely.",
-                "All done. We are as surprised as you are.",
-                "Finished successfully. Please admire responsibly.",
-                "Creation complete. Applause is optional but encouraged."
-            ],
-            'folder_loading': [
-                "Loading images from folder...",
-                "Preparing image gallery...",
-                "Scanning folder for images...",
-                "Organizing your image collection...",
-                "Loading images from folder. One by one, patiently.",
-                "Scanning folder for images and judging filenames silently.",
-                "Preparing image gallery with curatorial confidence.",
-                "Organizing images into something resembling order.",
-                "Counting images and pretending it matters.",
-                "Locating pictures that thought they were hidden.",
-                "Opening the folder of many visual possibilities."
-            ],
-            'webcam_starting': [
-                "Starting webcam...",
-                "Awakening the camera...",
-                "Asking the webcam nicely to cooperate...",
-                "Initializing visual capture device...",
-                "Preparing to see what you see..."
-            ],
-            'webcam_recording': [
-                "Recording your performance...",
-                "Capturing the moment...",
-                "Saving frames for posterity...",
-                "Documenting reality with effects...",
-                "Creating your audio-reactive masterpiece..."
-            ]
-        }
+        # Latest values waiting for the next flush (see _flush_status)
+        self._status_flush_timer = QTimer(self)
+        self._status_flush_timer.setSingleShot(True)
+        self._status_flush_timer.setInterval(STATUS_FLUSH_MS)
+        self._status_flush_timer.timeout.connect(self._flush_status)
+        self._pending_percent = None
+        self._pending_message = None
+        self._pending_preview_frame = None
+        
+        # Progress text, shared by every window (see status_messages.py)
+        self.status_messages = STATUS_MESSAGES
         
         # Natural motion persistent drift state (for preview smoothing)
         self._nm_ad_smooth_x = 0.0
         self._nm_ad_smooth_y = 0.0
 
+        # get_effect_parameters() memo; _params_version is bumped whenever the
+        # analysis or mixer weights change
+        self._params_version = 0
+        self._params_cache_key = None
+        self._params_cache_val = None
+        self._processor = None  # Shared effects VideoProcessor (see _effects_processor)
+        
         # Initialize frequency weights (using regular floats, not tk.DoubleVar)
         self.init_frequency_weights()
         
@@ -514,6 +937,27 @@ class SoundReactiveGUI(QMainWindow):
             'mid': 0.3, 'treble': 0.5,
             'high_treble': 0.0
         }
+        self._rebuild_weight_matrix()
+    
+    def _rebuild_weight_matrix(self):
+        """
+        Pack the effect_*_weights dicts into one normalized weight matrix
+        
+        Row i holds ARTISTIC_EFFECTS[i]'s band weights (MIXER_BANDS order)
+        divided by their total, so a single matrix-vector product yields every
+        effect's weighted band mix. Rows whose weights sum to zero stay zero
+        (the effect gets no intensity).
+        """
+        weight_mat = np.array(
+            [[getattr(self, f"{effect}_weights")[band] for band in MIXER_BANDS]
+             for effect in ARTISTIC_EFFECTS],
+            dtype=np.float32,
+        )
+        totals = weight_mat.sum(axis=1, keepdims=True)
+        self._weight_mat = np.divide(weight_mat, totals,
+                                     out=np.zeros_like(weight_mat),
+                                     where=totals >= 1e-8)
+        self._params_version += 1
     
     def create_ui(self):
         """Create the main user interface"""
@@ -565,6 +1009,13 @@ class SoundReactiveGUI(QMainWindow):
 
         main_layout.addWidget(splitter, stretch=1)
         
+        # Draft previews while any effect slider is held (the frame slider
+        # defers decoding to release instead, see on_frame_change)
+        for slider in self.findChildren(QSlider):
+            if slider is not self.frame_slider:
+                slider.sliderPressed.connect(self._on_slider_pressed)
+                slider.sliderReleased.connect(self._on_slider_released)
+        
         print("PyQt5 UI created successfully")
     
     def create_header(self):
@@ -658,20 +1109,7 @@ class SoundReactiveGUI(QMainWindow):
         """Create file selection controls"""
         print("  Creating file controls...")
         group = QGroupBox("Input Files")
-        group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #ccc;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """)
+        group.setStyleSheet(GROUPBOX_STYLE)
         layout = QVBoxLayout()
         layout.setSpacing(8)
         
@@ -733,6 +1171,12 @@ class SoundReactiveGUI(QMainWindow):
         self.webcam_controls_layout = QHBoxLayout(self.webcam_controls_frame)
         self.webcam_controls_frame.setVisible(False)
         
+        self.webcam_resolution_combo = QComboBox()
+        for label, size in WEBCAM_RESOLUTIONS:
+            self.webcam_resolution_combo.addItem(label, size)
+        self.webcam_resolution_combo.setToolTip("Capture resolution - lower resolutions give higher frame rates")
+        self.webcam_controls_layout.addWidget(self.webcam_resolution_combo)
+        
         self.start_webcam_btn = QPushButton("Start Webcam")
         self.start_webcam_btn.clicked.connect(self.start_webcam)
         self.webcam_controls_layout.addWidget(self.start_webcam_btn)
@@ -782,20 +1226,7 @@ class SoundReactiveGUI(QMainWindow):
         """Create basic effect controls"""
         print("  Creating basic controls...")
         group = QGroupBox("Basic Effects")
-        group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #ccc;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """)
+        group.setStyleSheet(GROUPBOX_STYLE)
         layout = QVBoxLayout()
         layout.setSpacing(8)
         
@@ -840,6 +1271,7 @@ class SoundReactiveGUI(QMainWindow):
         self.frame_slider.setMaximum(0)
         self.frame_slider.setMinimumHeight(30)  # Make slider taller/more visible
         self.frame_slider.valueChanged.connect(self.on_frame_change)
+        self.frame_slider.sliderReleased.connect(self._commit_frame_change)
         frame_slider_row.addWidget(self.frame_slider)
         self.frame_label = QLabel("0 / 0")
         self.frame_label.setFixedWidth(100)
@@ -856,20 +1288,7 @@ class SoundReactiveGUI(QMainWindow):
         """Create advanced effect controls"""
         print("  Creating advanced controls...")
         group = QGroupBox("Advanced Effects")
-        group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #ccc;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """)
+        group.setStyleSheet(GROUPBOX_STYLE)
         layout = QVBoxLayout()
         layout.setSpacing(8)
         
@@ -918,18 +1337,23 @@ class SoundReactiveGUI(QMainWindow):
         # Effect toggles
         self.color_grading_check = QCheckBox("Color Grading")
         self.color_grading_check.setChecked(True)
-        self.color_grading_check.toggled.connect(self.update_preview)
+        self.color_grading_check.clicked.connect(self.update_preview)
         layout.addWidget(self.color_grading_check)
         
         self.blur_check = QCheckBox("Blur")
-        self.blur_check.toggled.connect(self.update_preview)
+        self.blur_check.clicked.connect(self.update_preview)
         layout.addWidget(self.blur_check)
         
         self.brightness_check = QCheckBox("Brightness")
         self.brightness_check.setChecked(True)
-        self.brightness_check.toggled.connect(self.update_preview)
+        self.brightness_check.clicked.connect(self.update_preview)
         layout.addWidget(self.brightness_check)
         
+        self.full_res_preview_check = QCheckBox("Preview at full resolution")
+        self.full_res_preview_check.setToolTip("Run preview effects on the original frame size instead of the display size (slower, exact)")
+        self.full_res_preview_check.clicked.connect(self.update_preview)
+        layout.addWidget(self.full_res_preview_check)
+        
         # Hue shift
         hue_layout = QHBoxLayout()
         hue_layout.addWidget(QLabel("Hue Shift:"))
@@ -952,20 +1376,7 @@ class SoundReactiveGUI(QMainWindow):
         """Create layer blending controls"""
         print("  Creating layer blending controls...")
         group = QGroupBox("Layer Blending")
-        group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #ccc;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """)
+        group.setStyleSheet(GROUPBOX_STYLE)
         layout = QVBoxLayout()
         layout.setSpacing(8)
         
@@ -1004,20 +1415,7 @@ class SoundReactiveGUI(QMainWindow):
         """Create artistic effect controls with frequency mixing"""
         print("  Creating effect controls...")
         group = QGroupBox("Artistic Effects")
-        group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #ccc;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """)
+        group.setStyleSheet(GROUPBOX_STYLE)
         layout = QVBoxLayout()
         layout.setSpacing(6)
         
@@ -1035,7 +1433,7 @@ class SoundReactiveGUI(QMainWindow):
         self.effect_checks = {}
         for effect_name, effect_key in effects:
             check = QCheckBox(effect_name)
-            check.toggled.connect(self.update_preview)
+            check.clicked.connect(self.update_preview)
             layout.addWidget(check)
             self.effect_checks[effect_key] = check
         
@@ -1062,20 +1460,7 @@ class SoundReactiveGUI(QMainWindow):
         """Create Natural Movement controls group"""
         print("  Creating natural motion controls...")
         group = QGroupBox("Natural Movement")
-        group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #ccc;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """)
+        group.setStyleSheet(GROUPBOX_STYLE)
         layout = QVBoxLayout()
         layout.setSpacing(8)
 
@@ -1108,7 +1493,7 @@ class SoundReactiveGUI(QMainWindow):
 
         # ── 1. Ken Burns ───────────────────────────────────────────────────
         self.ken_burns_check = QCheckBox("Ken Burns (slow pan & zoom)")
-        self.ken_burns_check.toggled.connect(self.update_preview)
+        self.ken_burns_check.clicked.connect(self.update_preview)
         layout.addWidget(self.ken_burns_check)
 
         layout.addLayout(_slider_row(
@@ -1122,7 +1507,7 @@ class SoundReactiveGUI(QMainWindow):
 
         # ── 2. Noise Drift ─────────────────────────────────────────────────
         self.noise_drift_check = QCheckBox("Organic Noise Drift")
-        self.noise_drift_check.toggled.connect(self.update_preview)
+        self.noise_drift_check.clicked.connect(self.update_preview)
         layout.addWidget(self.noise_drift_check)
 
         layout.addLayout(_slider_row(
@@ -1132,7 +1517,7 @@ class SoundReactiveGUI(QMainWindow):
 
         # ── 3. Breathing Pulse ─────────────────────────────────────────────
         self.breathing_check = QCheckBox("Breathing Pulse")
-        self.breathing_check.toggled.connect(self.update_preview)
+        self.breathing_check.clicked.connect(self.update_preview)
         layout.addWidget(self.breathing_check)
 
         layout.addLayout(_slider_row(
@@ -1142,7 +1527,7 @@ class SoundReactiveGUI(QMainWindow):
 
         # ── 4. Audio-Modulated Drift ───────────────────────────────────────
         self.audio_drift_check = QCheckBox("Audio-Modulated Drift")
-        self.audio_drift_check.toggled.connect(self.update_preview)
+        self.audio_drift_check.clicked.connect(self.update_preview)
         layout.addWidget(self.audio_drift_check)
 
         layout.addLayout(_slider_row(
@@ -1150,7 +1535,7 @@ class SoundReactiveGUI(QMainWindow):
 
         # ── 5. Rotation Sway ───────────────────────────────────────────────
         self.sway_check = QCheckBox("Rotation Sway")
-        self.sway_check.toggled.connect(self.update_preview)
+        self.sway_check.clicked.connect(self.update_preview)
         layout.addWidget(self.sway_check)
 
         layout.addLayout(_slider_row(
@@ -1306,88 +1691,119 @@ class SoundReactiveGUI(QMainWindow):
         self.freq_sliders = {}
         self.freq_labels = {}
         
+        # Fonts shared by every effect row
+        effect_font = QFont()
+        effect_font.setBold(True)
+        effect_font.setPointSize(8)
+        self._band_font = QFont("Helvetica", 7)
+        
         for effect_key, effect_name, weights in effects:
-            # Effect name label
-            effect_label = QLabel(f"{effect_name}:")
-            effect_font = QFont()
-            effect_font.setBold(True)
-            effect_font.setPointSize(8)
-            effect_label.setFont(effect_font)
-            parent_layout.addWidget(effect_label)
+            # The effect name expands its band sliders, which are only built
+            # the first time they are shown
+            toggle = QToolButton()
+            toggle.setText(f"{effect_name}:")
+            toggle.setFont(effect_font)
+            toggle.setCheckable(True)
+            toggle.setArrowType(Qt.RightArrow)
+            toggle.setToolButtonStyle(Qt.ToolButtonTextBesideIcon)
+            toggle.setAutoRaise(True)
+            parent_layout.addWidget(toggle)
             
             # Frequency bands frame
             freq_frame = QFrame()
-            freq_layout = QHBoxLayout(freq_frame)
-            freq_layout.setContentsMargins(20, 0, 0, 5)
-            freq_layout.setSpacing(5)
-            
-            bands = [
-                ('sub_bass', 'Sub-B'),
-                ('bass', 'Bass'),
-                ('mid', 'Mid'),
-                ('treble', 'Treb'),
-                ('high_treble', 'H-Treb')
-            ]
-            
-            for band_key, band_label in bands:
-                # Band container
-                band_container = QFrame()
-                band_layout = QVBoxLayout(band_container)
-                band_layout.setContentsMargins(0, 0, 0, 0)
-                band_layout.setSpacing(2)
-                
-                # Band label
-                band_label_widget = QLabel(band_label)
-                band_label_widget.setFont(QFont("Helvetica", 7))
-                band_layout.addWidget(band_label_widget)
-                
-                # Slider
-                slider = QSlider(Qt.Horizontal)
-                slider.setMinimum(0)
-                slider.setMaximum(100)  # 0.0-1.0 in hundredths
-                slider.setValue(int(weights[band_key] * 100))
-                slider.setMaximumWidth(80)
-                
-                # Store slider reference
-                if effect_key not in self.freq_sliders:
-                    self.freq_sliders[effect_key] = {}
-                self.freq_sliders[effect_key][band_key] = slider
-                
-                # Connect to update function (using lambda with default args to capture loop variables)
-                def make_handler(e, b):
-                    return lambda val: self.on_frequency_weight_change(e, b, val)
-                slider.valueChanged.connect(make_handler(effect_key, band_key))
-                band_layout.addWidget(slider)
-                
-                # Value label
-                value_label = QLabel(f"{weights[band_key]:.1f}")
-                value_label.setFont(QFont("Helvetica", 7))
-                value_label.setFixedWidth(35)
-                value_label.setAlignment(Qt.AlignCenter)
-                band_layout.addWidget(value_label)
-                
-                # Store label reference
-                if effect_key not in self.freq_labels:
-                    self.freq_labels[effect_key] = {}
-                self.freq_labels[effect_key][band_key] = value_label
-                
-                freq_layout.addWidget(band_container)
-            
-            freq_layout.addStretch()
+            freq_frame.setVisible(False)
             parent_layout.addWidget(freq_frame)
+            
+            toggle.toggled.connect(functools.partial(
+                self._toggle_band_controls, effect_key, weights, toggle, freq_frame))
         
         print("    Frequency mixing controls created")
     
+    def _toggle_band_controls(self, effect_key, weights, toggle, freq_frame, expanded):
+        """Show or hide an effect's band sliders, building them on first expansion"""
+        if expanded and effect_key not in self.freq_sliders:
+            self._build_band_controls(effect_key, weights, freq_frame)
+        toggle.setArrowType(Qt.DownArrow if expanded else Qt.RightArrow)
+        freq_frame.setVisible(expanded)
+    
+    def _build_band_controls(self, effect_key, weights, freq_frame):
+        """
+        Create one effect's five band weight sliders inside freq_frame
+        
+        Args:
+            effect_key: Artistic effect the sliders mix for
+            weights: The effect's band weight dict (edited in place)
+            freq_frame: Empty frame to lay the sliders out in
+        """
+        freq_layout = QHBoxLayout(freq_frame)
+        freq_layout.setContentsMargins(20, 0, 0, 5)
+        freq_layout.setSpacing(5)
+        
+        bands = [
+            ('sub_bass', 'Sub-B'),
+            ('bass', 'Bass'),
+            ('mid', 'Mid'),
+            ('treble', 'Treb'),
+            ('high_treble', 'H-Treb')
+        ]
+        
+        self.freq_sliders[effect_key] = {}
+        self.freq_labels[effect_key] = {}
+        for band_key, band_label in bands:
+            # Band container
+            band_container = QFrame()
+            band_layout = QVBoxLayout(band_container)
+            band_layout.setContentsMargins(0, 0, 0, 0)
+            band_layout.setSpacing(2)
+            
+            # Band label
+            band_label_widget = QLabel(band_label)
+            band_label_widget.setFont(self._band_font)
+            band_layout.addWidget(band_label_widget)
+            
+            # Slider
+            slider = QSlider(Qt.Horizontal)
+            slider.setMinimum(0)
+            slider.setMaximum(100)  # 0.0-1.0 in hundredths
+            slider.setValue(int(weights[band_key] * 100))
+            slider.setMaximumWidth(80)
+            self.freq_sliders[effect_key][band_key] = slider
+            
+            # All mixer sliders share one slot, which reads the keys back from the sender
+            slider.setProperty('effect_key', effect_key)
+            slider.setProperty('band_key', band_key)
+            slider.valueChanged.connect(self._on_freq_slider_change)
+            slider.sliderPressed.connect(self._on_slider_pressed)
+            slider.sliderReleased.connect(self._on_slider_released)
+            band_layout.addWidget(slider)
+            
+            # Value label
+            value_label = QLabel(f"{weights[band_key]:.1f}")
+            value_label.setFont(self._band_font)
+            value_label.setFixedWidth(35)
+            value_label.setAlignment(Qt.AlignCenter)
+            band_layout.addWidget(value_label)
+            
+            # Store label reference (freq_labels also keeps the wrapper alive)
+            self.freq_labels[effect_key][band_key] = value_label
+            slider.setProperty('value_label', value_label)
+            
+            freq_layout.addWidget(band_container)
+        
+        freq_layout.addStretch()
+    
+    def _on_freq_slider_change(self, value):
+        """valueChanged slot shared by every frequency mixing slider"""
+        slider = self.sender()
+        slider.property('value_label').setText(MIX_WEIGHT_TEXT[value])
+        self.on_frequency_weight_change(slider.property('effect_key'), slider.property('band_key'), value)
+    
     def on_frequency_weight_change(self, effect_key, band_key, value):
-        """Handle frequency weight changes"""
+        """Handle frequency weight changes (the slider's value label is updated by the caller)"""
         # Update the weight value
-        weight_value = value / 100.0
         weights = getattr(self, f"{effect_key}_weights")
-        weights[band_key] = weight_value
-        
-        # Update label
-        if effect_key in self.freq_labels and band_key in self.freq_labels[effect_key]:
-            self.freq_labels[effect_key][band_key].setText(f"{weight_value:.1f}")
+        weights[band_key] = value / 100.0
+        self._rebuild_weight_matrix()
         
         # Update preview
         self.update_preview()
@@ -1402,19 +1818,14 @@ class SoundReactiveGUI(QMainWindow):
     
     def load_logo(self):
         """Load application logo"""
-        logo_path = resource_path("SoundReactive_Logo_Transparent_BG.png")
-        if os.path.exists(logo_path):
-            try:
-                pixmap = QPixmap(logo_path)
-                if not pixmap.isNull():
-                    # Scale to match header logo label size
-                    scaled_pixmap = pixmap.scaled(80, 48, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                    self.logo_label.setPixmap(scaled_pixmap)
-                    self.logo_label.setText("")  # clear placeholder text
-            except Exception as e:
-                print(f"Could not load logo: {e}")
-        else:
-            print(f"Logo not found at: {logo_path}")
+        try:
+            # Scaled to match header logo label size (decode shared with the splash)
+            scaled_pixmap = logo_pixmap(80, 48)
+            if not scaled_pixmap.isNull():
+                self.logo_label.setPixmap(scaled_pixmap)
+                self.logo_label.setText("")  # clear placeholder text
+        except Exception as e:
+            print(f"Could not load logo: {e}")
     
     def show_about_dialog(self):
         """Show About dialog with app information"""
@@ -1485,30 +1896,62 @@ class SoundReactiveGUI(QMainWindow):
             self.webcam_controls_frame.setVisible(True)
     
     def on_zoom_change(self, value):
-        self.zoom_label.setText(f"{value / 100:.2f}")
+        self.zoom_label.setText(HUNDREDTHS_TEXT[value])
         self.update_preview()
     
     def on_rotation_change(self, value):
-        self.rotation_label.setText(f"{value / 10:.2f}°")
+        self.rotation_label.setText(ROTATION_TEXT[value])
         self.update_preview()
     
     def on_effect_smoothing_change(self, value):
-        self.effect_smoothing_label.setText(f"{value / 100:.2f}")
+        self.effect_smoothing_label.setText(HUNDREDTHS_TEXT[value])
         self.effect_smoothing_factor = value / 100
         self.update_preview()
     
+    def _reset_frame_slider(self):
+        """Range the frame slider over total_frames and rewind it to frame 0
+        
+        Signals are blocked while the range and value are set: a shrinking
+        maximum clamps the old value and would otherwise seek the freshly
+        opened source to a stale frame before the rewind.
+        """
+        with QSignalBlocker(self.frame_slider):
+            self.frame_slider.setMaximum(max(0, self.total_frames - 1))
+            self.frame_slider.setValue(0)
+        self.update_frame_label()
+    
     def on_frame_change(self, value):
+        # While the handle is dragged only the frame counter follows it; the
+        # frame is decoded and rendered once on release (_commit_frame_change).
+        # Clicks, wheel and keyboard steps arrive with the slider up and load
+        # the frame right away.
+        if self.frame_slider.isSliderDown():
+            self.update_frame_label(value)
+            return
+        self._load_frame(value)
+    
+    def _commit_frame_change(self):
+        """Load the frame the slider was dragged to"""
+        self._load_frame(self.frame_slider.value())
+    
+    def _load_frame(self, value):
+        """Make frame `value` the current frame and refresh the preview"""
         if value != self.current_frame_idx:
             self.current_frame_idx = value
             
             if self.mode == "video" and self.video_cap and self.video_cap.isOpened():
-                self.video_cap.set(cv2.CAP_PROP_POS_FRAMES, value)
-                ret, frame = self.video_cap.read()
+                frame = self._frame_prefetcher.take(value) if self._frame_prefetcher else None
+                if frame is not None:
+                    ret = True
+                else:
+                    ret, frame = self._seek_to(value)
                 if ret:
                     self.current_frame = frame
                     self.update_preview()
             elif self.mode == "image" and self.base_image is not None:
-                self.current_frame = self.base_image.copy()
+                # Effects never modify their input; sharing the array also keeps
+                # the preview caches (keyed on frame identity) valid across frames
+                self.current_frame = self.base_image
                 self.update_preview()
             elif self.mode == "folder" and self.image_list and self.audio_duration:
                 # Calculate which image to show based on current frame
@@ -1518,22 +1961,104 @@ class SoundReactiveGUI(QMainWindow):
                 image_index = int(current_time / duration_per_image)
                 image_index = min(image_index, num_images - 1)
                 
-                # Load and resize the appropriate image
-                img = cv2.imread(self.image_list[image_index])
-                if img is not None:
-                    resized = self._resize_image_to_fit(img, self.width, self.height)
+                # Use the preloaded image; decode it here until the preload is done
+                key, images = self._folder_images
+                if key == self._folder_images_key():
+                    resized = images[image_index]
+                else:
+                    img = cv2.imread(self.image_list[image_index])
+                    resized = self._resize_image_to_fit(img, self.width, self.height) if img is not None else None
+                if resized is not None:
                     self.current_frame = resized
                     self.base_image = resized  # Update base image for effects
                     self.update_preview()
         
         self.update_frame_label()
     
+    def _open_video_capture(self, path):
+        """
+        Open a video, reusing a pooled capture of the same unchanged file
+        
+        Switching back to a recently loaded video rewinds its existing
+        capture instead of paying the demuxer/decoder setup again. Up to
+        VIDEO_CAPTURE_POOL_SIZE captures stay open; the least recently used
+        one is released when a new file is opened.
+        
+        Args:
+            path: Video file path
+        
+        Returns:
+            cv2.VideoCapture (check isOpened(); failed opens aren't pooled)
+        """
+        stat = os.stat(path)
+        key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+        cap = self._cap_pool.get(key)
+        if cap is not None:
+            self._cap_pool.move_to_end(key)
+            cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            return cap
+        
+        cap = cv2.VideoCapture(path)
+        if not cap.isOpened():
+            return cap
+        self._cap_pool[key] = cap
+        while len(self._cap_pool) > VIDEO_CAPTURE_POOL_SIZE:
+            _, evicted = self._cap_pool.popitem(last=False)
+            evicted.release()
+        return cap
+    
+    def _release_video_capture(self, cap):
+        """Drop a capture from the pool and release it"""
+        for key, pooled in list(self._cap_pool.items()):
+            if pooled is cap:
+                del self._cap_pool[key]
+        cap.release()
+    
+    def closeEvent(self, event):
+        """Stop the worker threads and release pooled video captures on window close"""
+        self._preview_worker.stop()
+        self._preview_worker.wait()
+        self._stop_frame_prefetcher()
+        for cap in self._cap_pool.values():
+            cap.release()
+        self._cap_pool.clear()
+        self.video_cap = None
+        super().closeEvent(event)
+    
+    def _stop_frame_prefetcher(self):
+        """Stop the loaded video's decode-ahead thread, if any"""
+        if self._frame_prefetcher is not None:
+            self._frame_prefetcher.stop()
+            self._frame_prefetcher.wait()
+            self._frame_prefetcher = None
+    
+    def _seek_to(self, idx):
+        """
+        Read frame idx from the loaded video
+        
+        Short forward moves grab() (demux/decode without the BGR conversion)
+        through the in-between frames and retrieve() only the target one; any
+        other move falls back to a CAP_PROP_POS_FRAMES seek.
+        """
+        delta = idx - self._last_decoded_idx if self._last_decoded_idx is not None else 0
+        if 0 < delta <= SCRUB_GRAB_LIMIT:
+            for _ in range(delta - 1):
+                if not self.video_cap.grab():
+                    break
+            ret = self.video_cap.grab()
+            frame = self.video_cap.retrieve()[1] if ret else None
+        else:
+            self.video_cap.set(cv2.CAP_PROP_POS_FRAMES, idx)
+            ret, frame = self.video_cap.read()
+        self._last_decoded_idx = idx if ret else None
+        return ret, frame
+    
     def on_intensity_change(self, value):
-        self.intensity_label.setText(f"{value / 100:.2f}")
+        self.intensity_label.setText(HUNDREDTHS_TEXT[value])
         self.update_preview()
     
     def on_smoothness_change(self, value):
-        self.smoothness_label.setText(f"{value / 100:.2f}")
+        self.smoothness_label.setText(HUNDREDTHS_TEXT[value])
         self.effect_smoothing_factor = value / 100
         self.update_preview()
     
@@ -1542,60 +2067,147 @@ class SoundReactiveGUI(QMainWindow):
         self.update_preview()
     
     def on_opacity_change(self, value):
-        self.opacity_label.setText(f"{value / 100:.2f}")
+        self.opacity_label.setText(HUNDREDTHS_TEXT[value])
         self.update_preview()
     
-    def update_frame_label(self):
-        self.frame_label.setText(f"{self.current_frame_idx} / {max(0, self.total_frames - 1)}")
+    def update_frame_label(self, frame_idx=None):
+        if frame_idx is None:
+            frame_idx = self.current_frame_idx
+        self.frame_label.setText(f"{frame_idx} / {max(0, self.total_frames - 1)}")
     
-    def mix_frequency_bands(self, sub_bass, bass, mid, treble, high_treble, weights):
-        """Mix frequency bands with given weights"""
-        w_sub_bass = weights['sub_bass']
-        w_bass = weights['bass']
-        w_mid = weights['mid']
-        w_treble = weights['treble']
-        w_high_treble = weights['high_treble']
-        
-        total_weight = w_sub_bass + w_bass + w_mid + w_treble + w_high_treble
-        if total_weight < 1e-8:
-            return 0.0
+    def apply_temporal_smoothing(self, current, active):
+        """
+        Exponentially smooth artistic effect intensities across frames
         
-        mixed = (sub_bass * w_sub_bass + bass * w_bass + mid * w_mid + 
-                 treble * w_treble + high_treble * w_high_treble) / total_weight
-        return np.clip(mixed, 0.0, 1.0)
-    
-    def apply_temporal_smoothing(self, effect_name, current_intensity):
-        """Apply temporal smoothing to effect intensity"""
-        if effect_name not in self.prev_effect_intensities:
-            self.prev_effect_intensities[effect_name] = current_intensity
-            return current_intensity
+        Args:
+            current: Raw intensities, one per ARTISTIC_EFFECTS entry
+            active: Mask of effects that are on this frame; only these update
+                their smoothing state, the rest come back as 0.0
         
+        Returns:
+            Smoothed intensities (float32 array)
+        """
+        prev = self._prev_intensities
         alpha = 1.0 - self.effect_smoothing_factor
-        smoothed = alpha * current_intensity + (1.0 - alpha) * self.prev_effect_intensities[effect_name]
-        self.prev_effect_intensities[effect_name] = smoothed
+        # An effect's first active frame seeds its state with the raw value
+        smoothed = np.where(self._prev_seeded, prev + alpha * (current - prev), current)
+        np.copyto(prev, smoothed, where=active)
+        self._prev_seeded |= active
+        smoothed[~active] = 0.0
         return smoothed
     
+    def mix_artistic_intensities(self, band_values, intensity_sens):
+        """
+        Compute all artistic effect intensities for one frame
+        
+        Args:
+            band_values: Band energies in MIXER_BANDS order
+            intensity_sens: Intensity sensitivity (0-1)
+        
+        Returns:
+            Dict of '<effect>_intensity' values for VideoProcessor.apply_effects
+        """
+        # np.minimum/np.maximum in place: np.clip's dispatch overhead dominates on 8 values
+        mixed = self._weight_mat @ np.asarray(band_values, dtype=np.float32)
+        np.minimum(np.maximum(mixed, 0.0, out=mixed), 1.0, out=mixed)
+        enabled = np.array([self.effect_checks[effect].isChecked() for effect in ARTISTIC_EFFECTS])
+        active = enabled & (mixed > 1e-8)
+        
+        current = np.minimum(mixed * (0.5 + intensity_sens * 0.5), 1.0)
+        smoothed = self.apply_temporal_smoothing(current, active)
+        return dict(zip(ARTISTIC_INTENSITY_KEYS, smoothed.tolist()))
+    
+    def _bind_analysis(self, analyzer, energy_curves, frame_times):
+        """
+        Store analysis results, plus packed copies for per-frame lookups
+        
+        Besides the public energy_curves/frame_times/beat frames, the display
+        bands are packed frame-major into one float32 (n_frames, n_bands)
+        array so a lookup reads a single contiguous row pair, and beat/snare
+        frame indices are resolved to times once instead of on every frame.
+        """
+        frame_times = np.ascontiguousarray(frame_times, dtype=np.float32)
+        bass_beat_frames = getattr(analyzer, 'bass_beat_frames', None)
+        snare_hit_frames = getattr(analyzer, 'snare_hit_frames', None)
+        
+        band_energies = np.zeros((len(frame_times), len(MIXER_BANDS)), dtype=np.float32)
+        for i, band in enumerate(MIXER_BANDS):
+            if band in energy_curves:
+                band_energies[:, i] = energy_curves[band]
+        
+        def beat_times(frames):
+            if frames is None or len(frames) == 0 or len(frame_times) == 0:
+                return np.empty(0, dtype=np.float32)
+            return np.sort(frame_times[frames])
+        
+        self._band_energies = band_energies
+        self._bass_beat_times = beat_times(bass_beat_frames)
+        self._snare_hit_times = beat_times(snare_hit_frames)
+        self.energy_curves = energy_curves
+        self.frame_times = frame_times
+        self.bass_beat_frames = bass_beat_frames
+        self.snare_hit_frames = snare_hit_frames
+        self._params_version += 1
+    
+    def _frame_band_energies(self, frame_idx):
+        """
+        Clipped band energies (MIXER_BANDS order) at video frame frame_idx
+        
+        The packed analysis curves are resampled to the current fps once
+        (again only when the analysis, fps or frame count changes), so a
+        per-frame lookup is a single row read. The table covers the whole
+        analysis, so later frames read its last row, like np.interp clamping.
+        """
+        source, fps, total_frames = self._frame_bands_key
+        if source is not self._band_energies or fps != self.fps or total_frames != self.total_frames:
+            times = self.frame_times
+            n = max(self.total_frames, int(np.ceil(float(times[-1]) * self.fps)) + 1)
+            t = np.arange(n) / self.fps
+            table = np.empty((n, len(MIXER_BANDS)), dtype=np.float32)
+            for i in range(len(MIXER_BANDS)):
+                table[:, i] = np.interp(t, times, self._band_energies[:, i])
+            np.clip(table, 0.0, 1.0, out=table)
+            self._frame_bands = table
+            self._frame_bands_key = (self._band_energies, self.fps, self.total_frames)
+        return self._frame_bands[min(max(frame_idx, 0), len(self._frame_bands) - 1)]
+    
+    def _effect_params_key(self, nm_params):
+        """Everything get_effect_parameters() reads, as a comparable tuple"""
+        return (
+            self._params_version, self.current_frame_idx, self.fps, self.total_frames,
+            self.intensity_slider.value(), self.zoom_slider.value(),
+            self.rotation_slider.value(), self.hue_slider.value(),
+            self.color_grading_check.isChecked(), self.brightness_check.isChecked(),
+            self.blur_check.isChecked(),
+            tuple(self.effect_checks[effect].isChecked() for effect in ARTISTIC_EFFECTS),
+            self.effect_smoothing_factor,
+            tuple(nm_params.values()),
+        )
+    
     def get_effect_parameters(self):
-        """Get current effect parameters based on audio analysis"""
+        """
+        Get current effect parameters based on audio analysis
+        
+        Re-rendering an unchanged frame/control state (e.g. switching preview
+        mode) reuses the previous result instead of recomputing it, which also
+        keeps the temporal smoothing state from advancing on repeat renders.
+        """
         if self.current_frame is None:
             return None
         
+        nm_params = self.get_natural_motion_params()
+        key = self._effect_params_key(nm_params)
+        if key == self._params_cache_key:
+            return self._params_cache_val
+        
+        from video_processor import VideoProcessor
+        
         current_time = self.current_frame_idx / self.fps
         
-        if not self.energy_curves or self.frame_times is None or len(self.frame_times) == 0:
+        if not self.energy_curves or self._band_energies is None or len(self.frame_times) == 0:
             sub_bass = bass = mid = treble = high_treble = 0.5
         else:
-            sub_bass = np.interp(current_time, self.frame_times, self.energy_curves.get('sub_bass', np.zeros(len(self.frame_times))))
-            bass = np.interp(current_time, self.frame_times, self.energy_curves.get('bass', np.zeros(len(self.frame_times))))
-            mid = np.interp(current_time, self.frame_times, self.energy_curves.get('mid', np.zeros(len(self.frame_times))))
-            treble = np.interp(current_time, self.frame_times, self.energy_curves.get('treble', np.zeros(len(self.frame_times))))
-            high_treble = np.interp(current_time, self.frame_times, self.energy_curves.get('high_treble', np.zeros(len(self.frame_times))))
-            
-            sub_bass = np.clip(sub_bass, 0.0, 1.0)
-            bass = np.clip(bass, 0.0, 1.0)
-            mid = np.clip(mid, 0.0, 1.0)
-            treble = np.clip(treble, 0.0, 1.0)
-            high_treble = np.clip(high_treble, 0.0, 1.0)
+            sub_bass, bass, mid, treble, high_treble = self._frame_band_energies(self.current_frame_idx).tolist()
         
         intensity_sens = self.intensity_slider.value() / 100.0
         zoom_val = self.zoom_slider.value() / 100.0
@@ -1604,10 +2216,8 @@ class SoundReactiveGUI(QMainWindow):
         # Calculate zoom (beat-triggered)
         zoom = 1.0
         current_time = self.current_frame_idx / self.fps
-        if self.bass_beat_frames is not None and len(self.bass_beat_frames) > 0 and len(self.frame_times) > 0:
-            bass_beat_times = self.frame_times[self.bass_beat_frames]
-            time_distances = np.abs(bass_beat_times - current_time)
-            nearest_beat_distance = np.min(time_distances) if len(time_distances) > 0 else float('inf')
+        if len(self._bass_beat_times) > 0:
+            nearest_beat_distance = VideoProcessor.nearest_event_distance(self._bass_beat_times, current_time)
             beat_window = 0.2
             if nearest_beat_distance <= beat_window:
                 beat_proximity = 1.0 - (nearest_beat_distance / beat_window)
@@ -1631,10 +2241,8 @@ class SoundReactiveGUI(QMainWindow):
         brightness = 1.0 + ((bass + mid) * 0.3) if self.brightness_check.isChecked() else 1.0
         
         # Snare flash
-        if self.snare_hit_frames is not None and len(self.snare_hit_frames) > 0 and len(self.frame_times) > 0:
-            snare_hit_times = self.frame_times[self.snare_hit_frames]
-            snare_time_distances = np.abs(snare_hit_times - current_time)
-            nearest_snare_distance = np.min(snare_time_distances) if len(snare_time_distances) > 0 else float('inf')
+        if len(self._snare_hit_times) > 0:
+            nearest_snare_distance = VideoProcessor.nearest_event_distance(self._snare_hit_times, current_time)
             snare_window = 0.15
             if nearest_snare_distance <= snare_window:
                 snare_proximity = 1.0 - (nearest_snare_distance / snare_window)
@@ -1646,72 +2254,10 @@ class SoundReactiveGUI(QMainWindow):
         blur_intensity = bass * 0.5 if self.blur_check.isChecked() else 0.0
         
         # Artistic effects
-        pixel_sort_intensity = 0.0
-        if self.effect_checks['pixel_sort'].isChecked():
-            base_intensity = self.mix_frequency_bands(sub_bass, bass, mid, treble, high_treble, self.pixel_sort_weights)
-            if base_intensity > 1e-8:
-                pixel_sort_intensity = base_intensity * (0.5 + intensity_sens * 0.5)
-                pixel_sort_intensity = np.clip(pixel_sort_intensity, 0.0, 1.0)
-                pixel_sort_intensity = self.apply_temporal_smoothing('pixel_sort', pixel_sort_intensity)
-        
-        kaleidoscope_intensity = 0.0
-        if self.effect_checks['kaleidoscope'].isChecked():
-            base_intensity = self.mix_frequency_bands(sub_bass, bass, mid, treble, high_treble, self.kaleidoscope_weights)
-            if base_intensity > 1e-8:
-                kaleidoscope_intensity = base_intensity * (0.5 + intensity_sens * 0.5)
-                kaleidoscope_intensity = np.clip(kaleidoscope_intensity, 0.0, 1.0)
-                kaleidoscope_intensity = self.apply_temporal_smoothing('kaleidoscope', kaleidoscope_intensity)
-        
-        wave_distortion_intensity = 0.0
-        if self.effect_checks['wave_distortion'].isChecked():
-            base_intensity = self.mix_frequency_bands(sub_bass, bass, mid, treble, high_treble, self.wave_distortion_weights)
-            if base_intensity > 1e-8:
-                wave_distortion_intensity = base_intensity * (0.5 + intensity_sens * 0.5)
-                wave_distortion_intensity = np.clip(wave_distortion_intensity, 0.0, 1.0)
-                wave_distortion_intensity = self.apply_temporal_smoothing('wave_distortion', wave_distortion_intensity)
-        
-        vhs_intensity = 0.0
-        if self.effect_checks['vhs'].isChecked():
-            base_intensity = self.mix_frequency_bands(sub_bass, bass, mid, treble, high_treble, self.vhs_weights)
-            if base_intensity > 1e-8:
-                vhs_intensity = base_intensity * (0.5 + intensity_sens * 0.5)
-                vhs_intensity = np.clip(vhs_intensity, 0.0, 1.0)
-                vhs_intensity = self.apply_temporal_smoothing('vhs', vhs_intensity)
-        
-        posterization_intensity = 0.0
-        if self.effect_checks['posterization'].isChecked():
-            base_intensity = self.mix_frequency_bands(sub_bass, bass, mid, treble, high_treble, self.posterization_weights)
-            if base_intensity > 1e-8:
-                posterization_intensity = base_intensity * (0.5 + intensity_sens * 0.5)
-                posterization_intensity = np.clip(posterization_intensity, 0.0, 1.0)
-                posterization_intensity = self.apply_temporal_smoothing('posterization', posterization_intensity)
-        
-        edge_detection_intensity = 0.0
-        if self.effect_checks['edge_detection'].isChecked():
-            base_intensity = self.mix_frequency_bands(sub_bass, bass, mid, treble, high_treble, self.edge_detection_weights)
-            if base_intensity > 1e-8:
-                edge_detection_intensity = base_intensity * (0.5 + intensity_sens * 0.5)
-                edge_detection_intensity = np.clip(edge_detection_intensity, 0.0, 1.0)
-                edge_detection_intensity = self.apply_temporal_smoothing('edge_detection', edge_detection_intensity)
-        
-        data_corruption_intensity = 0.0
-        if self.effect_checks['data_corruption'].isChecked():
-            base_intensity = self.mix_frequency_bands(sub_bass, bass, mid, treble, high_treble, self.data_corruption_weights)
-            if base_intensity > 1e-8:
-                data_corruption_intensity = base_intensity * (0.5 + intensity_sens * 0.5)
-                data_corruption_intensity = np.clip(data_corruption_intensity, 0.0, 1.0)
-                data_corruption_intensity = self.apply_temporal_smoothing('data_corruption', data_corruption_intensity)
-        
-        scan_lines_intensity = 0.0
-        if self.effect_checks['scan_lines'].isChecked():
-            base_intensity = self.mix_frequency_bands(sub_bass, bass, mid, treble, high_treble, self.scan_lines_weights)
-            if base_intensity > 1e-8:
-                scan_lines_intensity = base_intensity * (0.5 + intensity_sens * 0.5)
-                scan_lines_intensity = np.clip(scan_lines_intensity, 0.0, 1.0)
-                scan_lines_intensity = self.apply_temporal_smoothing('scan_lines', scan_lines_intensity)
+        artistic = self.mix_artistic_intensities(
+            (sub_bass, bass, mid, treble, high_treble), intensity_sens)
         
         # ── Natural motion for this preview frame ──────────────────────────────
-        nm_params = self.get_natural_motion_params()
         total_frames = max(self.total_frames, 1)
         nm = VideoProcessor.compute_natural_motion(
             frame_idx=self.current_frame_idx,
@@ -1726,42 +2272,62 @@ class SoundReactiveGUI(QMainWindow):
         self._nm_ad_smooth_x = nm['audio_drift_smoothed_x']
         self._nm_ad_smooth_y = nm['audio_drift_smoothed_y']
 
-        return {
+        params = {
             'zoom': zoom, 'rotation': rotation, 'hue_shift': hue_shift,
             'saturation': saturation, 'brightness': brightness,
             'blur_intensity': blur_intensity,
-            'pixel_sort_intensity': pixel_sort_intensity,
-            'kaleidoscope_intensity': kaleidoscope_intensity,
-            'wave_distortion_intensity': wave_distortion_intensity,
-            'vhs_intensity': vhs_intensity,
-            'posterization_intensity': posterization_intensity,
-            'edge_detection_intensity': edge_detection_intensity,
-            'data_corruption_intensity': data_corruption_intensity,
-            'scan_lines_intensity': scan_lines_intensity,
+            **artistic,
             # Natural motion offsets
             'natural_zoom_offset': nm['zoom_offset'],
             'natural_pan_x': nm['pan_x'],
             'natural_pan_y': nm['pan_y'],
             'natural_rotation_offset': nm['rotation_offset'],
         }
+        self._params_cache_key = key
+        self._params_cache_val = params
+        return params
     
-    def apply_effects_to_frame(self, frame):
-        """Apply effects to a frame"""
+    def _effects_processor(self):
+        """
+        VideoProcessor shared by every preview/webcam effect call
+        
+        Effect methods only read fps from the instance, so one bare instance
+        (no video opened) is created lazily and kept instead of one per frame.
+        """
+        if self._processor is None:
+            from video_processor import VideoProcessor
+            self._processor = VideoProcessor.__new__(VideoProcessor)
+        self._processor.fps = self.fps
+        return self._processor
+    
+    def _start_effects_runtime(self):
+        """Start numba's parallel runtime on the GUI thread (see start_parallel_runtime)"""
+        from video_processor import start_parallel_runtime
+        start_parallel_runtime()
+    
+    def apply_effects_to_frame(self, frame, stage_cache=None):
+        """Apply effects to a frame (stage_cache: see VideoProcessor._run_stages)"""
         if frame is None:
             return None
         
-        params = self.get_effect_parameters()
-        if params is None:
+        effect_kwargs = self._effect_kwargs()
+        if effect_kwargs is None:
             return frame
         
-        processor = VideoProcessor.__new__(VideoProcessor)
-        processor.fps = self.fps
+        return self._effects_processor().apply_effects(frame, stage_cache=stage_cache, **effect_kwargs)
+    
+    def _effect_kwargs(self):
+        """
+        VideoProcessor.apply_effects arguments for the current frame
         
-        blend_mode = self.blend_mode_combo.currentText().lower()
-        layer_opacity = self.opacity_slider.value() / 100.0
+        Returns:
+            Keyword arguments (without the frame), or None before analysis
+        """
+        params = self.get_effect_parameters()
+        if params is None:
+            return None
         
-        return processor.apply_effects(
-            frame,
+        return dict(
             zoom=params['zoom'],
             rotation=params['rotation'],
             hue_shift=params['hue_shift'],
@@ -1770,17 +2336,10 @@ class SoundReactiveGUI(QMainWindow):
             blur_intensity=params['blur_intensity'],
             glitch_intensity=0.0,
             artifacts_intensity=0.0,
-            pixel_sort_intensity=params['pixel_sort_intensity'],
-            kaleidoscope_intensity=params['kaleidoscope_intensity'],
-            wave_distortion_intensity=params['wave_distortion_intensity'],
-            vhs_intensity=params['vhs_intensity'],
-            posterization_intensity=params['posterization_intensity'],
-            edge_detection_intensity=params['edge_detection_intensity'],
-            data_corruption_intensity=params['data_corruption_intensity'],
-            scan_lines_intensity=params['scan_lines_intensity'],
+            **{key: params[key] for key in ARTISTIC_INTENSITY_KEYS},
             effect_mode="direct",
-            blend_mode=blend_mode,
-            layer_opacity=layer_opacity,
+            blend_mode=self.blend_mode_combo.currentText().lower(),
+            layer_opacity=self.opacity_slider.value() / 100.0,
             natural_zoom_offset=params.get('natural_zoom_offset', 0.0),
             natural_pan_x=params.get('natural_pan_x', 0.0),
             natural_pan_y=params.get('natural_pan_y', 0.0),
@@ -1788,9 +2347,42 @@ class SoundReactiveGUI(QMainWindow):
         )
     
     def update_preview(self):
+        """
+        Schedule a preview update
+        
+        Dragging a slider fires many valueChanged signals per second but only
+        the latest value matters. The first change after an idle period
+        renders on the next event loop pass; changes arriving while a render
+        is pending are folded into it, and a new render starts no sooner than
+        PREVIEW_THROTTLE_MS after the previous one finished, leaving the event
+        loop time to keep up with the mouse. Value labels are updated by the
+        slider handlers directly, so only the render is throttled.
+        """
+        if not self._preview_dirty_timer.isActive():
+            idle_ms = (time.monotonic() - self._preview_rendered_at) * 1000.0
+            self._preview_dirty_timer.start(int(max(0.0, PREVIEW_THROTTLE_MS - idle_ms)))
+    
+    def _do_update_preview(self):
         """Update preview display"""
+        try:
+            self._render_preview()
+        finally:
+            self._preview_rendered_at = time.monotonic()
+    
+    def _render_preview(self):
+        """
+        Render the current frame in the selected preview mode
+        
+        The original frame is shown right away; processed modes hand the
+        frame and effect parameters to the preview worker and return, and
+        _on_preview_ready shows the result. Each request gets a new id so
+        a result that arrives after a newer request was made is dropped.
+        """
+        self._preview_request_id += 1
+        self._snapshot_webcam_frame()
         if self.current_frame is None:
             self.preview_label.setText("No video loaded")
+            self._preview_shown_frame = None
             return
         
         mode = "original"
@@ -1799,31 +2391,68 @@ class SoundReactiveGUI(QMainWindow):
         elif self.preview_side_by_side_radio.isChecked():
             mode = "sidebyside"
         
+        # While a slider is dragged, effects run at DRAG_PREVIEW_SCALE and the
+        # result is scaled back up; the release renders at full preview size
+        draft = (self._slider_dragging and mode != "original"
+                 and not self.full_res_preview_check.isChecked())
+        frame = self._preview_source(panes=2 if mode == "sidebyside" else 1, draft=draft)
+        max_scale = 1.0 / DRAG_PREVIEW_SCALE if draft else 1.0
         if mode == "original":
-            display_frame = self.current_frame.copy()
-        elif mode == "processed":
-            display_frame = self.apply_effects_to_frame(self.current_frame.copy())
-        else:  # sidebyside
-            original = self.current_frame.copy()
-            processed = self.apply_effects_to_frame(self.current_frame.copy())
-            display_frame = np.hstack([original, processed])
+            # Effect controls don't change the original view; only redisplay
+            # when the frame or the label size changed since it was shown
+            if (frame is not self._preview_shown_frame
+                    or self.preview_label.size() != self._preview_shown_size):
+                self._show_preview_frame(frame, max_scale=max_scale)
+            return
         
-        # Convert BGR to RGB
-        display_frame = cv2.cvtColor(display_frame, cv2.COLOR_BGR2RGB)
+        # Effects never modify their input, so the preview frame is passed as-is;
+        # that keeps its identity stable for the per-stage cache
+        self._preview_worker.submit(self._preview_request_id, frame, self._effect_kwargs(),
+                                    mode == "sidebyside", max_scale)
+    
+    def _on_preview_ready(self, frame, max_scale, request_id):
+        """Show a frame rendered by the preview worker unless it is outdated"""
+        if request_id == self._preview_request_id:
+            self._show_preview_frame(frame, max_scale=max_scale)
+    
+    def _on_slider_pressed(self):
+        self._slider_dragging = True
+    
+    def _on_slider_released(self):
+        self._slider_dragging = False
+        self.update_preview()
+    
+    def _preview_source(self, panes=1, draft=False):
+        """
+        Current frame scaled down to the size it will be displayed at
         
-        # Resize for display
-        h, w = display_frame.shape[:2]
-        label_size = self.preview_label.size()
-        scale = min(label_size.width() / w, label_size.height() / h, 1.0)
-        new_w = int(w * scale)
-        new_h = int(h * scale)
+        Effects cost is proportional to pixel count, so interactive previews
+        run on a display-sized copy (kept until the frame or label size
+        changes). Rendering always uses the original frames; the "Preview at
+        full resolution" option skips the downscale for an exact preview.
+        
+        Args:
+            panes: Frames shown side by side in the preview label
+            draft: Shrink a further DRAG_PREVIEW_SCALE (slider drags)
+        """
+        frame = self.current_frame
+        if self.full_res_preview_check.isChecked():
+            return frame
         
-        display_frame = cv2.resize(display_frame, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
+        h, w = frame.shape[:2]
+        label_size = self.preview_label.size()
+        scale = min(label_size.width() / (w * panes), label_size.height() / h, 1.0)
+        if draft:
+            scale *= DRAG_PREVIEW_SCALE
+        size = (max(1, int(w * scale)), max(1, int(h * scale)))
+        if size == (w, h):
+            return frame
         
-        # Convert to QPixmap
-        q_image = QImage(display_frame.data, new_w, new_h, new_w * 3, QImage.Format_RGB888)
-        pixmap = QPixmap.fromImage(q_image)
-        self.preview_label.setPixmap(pixmap)
+        cached_frame, cached_size, scaled = self._preview_source_cache
+        if cached_frame is not frame or cached_size != size:
+            scaled = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+            self._preview_source_cache = (frame, size, scaled)
+        return scaled
     
     def load_video(self):
         """Load video file with enhanced feedback and validation"""
@@ -1860,16 +2489,14 @@ class SoundReactiveGUI(QMainWindow):
         self.video_path = file_path
         video_name = os.path.basename(file_path)
         self.video_path_label.setText(f"Video: {video_name}")
-        self.status_label.setText(f"Loading video: {video_name}...")
+        self._set_status(f"Loading video: {video_name}...")
         self.processing_signals.progress_update.emit(5, f"Loading video file...")
         
-        # Release previous video if open
-        if self.video_cap:
-            self.video_cap.release()
+        self._stop_frame_prefetcher()
         
-        # Open video file
+        # Open video file (the previous one stays in the capture pool)
         self.processing_signals.progress_update.emit(10, "Opening video file...")
-        self.video_cap = cv2.VideoCapture(file_path)
+        self.video_cap = self._open_video_capture(file_path)
         
         if not self.video_cap.isOpened():
             QMessageBox.critical(
@@ -1883,7 +2510,7 @@ class SoundReactiveGUI(QMainWindow):
             )
             self.video_path = None
             self.video_path_label.setText("No video loaded")
-            self.status_label.setText("Ready - Load a video to begin")
+            self._set_status("Ready - Load a video to begin")
             return
         
         # Get video properties
@@ -1902,11 +2529,11 @@ class SoundReactiveGUI(QMainWindow):
                 "Could not read video properties.\n"
                 "The file may be corrupted or in an unsupported format."
             )
-            self.video_cap.release()
+            self._release_video_capture(self.video_cap)
             self.video_cap = None
             self.video_path = None
             self.video_path_label.setText("No video loaded")
-            self.status_label.setText("Ready - Load a video to begin")
+            self._set_status("Ready - Load a video to begin")
             return
         
         if self.fps <= 0:
@@ -1923,17 +2550,18 @@ class SoundReactiveGUI(QMainWindow):
         
         # Update frame slider
         self.processing_signals.progress_update.emit(30, "Initializing video player...")
-        self.frame_slider.setMaximum(max(0, self.total_frames - 1))
         self.current_frame_idx = 0
-        self.frame_slider.setValue(0)
-        self.update_frame_label()
+        self._reset_frame_slider()
         
         # Load first frame
         self.processing_signals.progress_update.emit(40, "Loading first frame...")
         ret, frame = self.video_cap.read()
+        self._last_decoded_idx = 0 if ret else None
         if ret:
             self.current_frame = frame
             self.update_preview()
+            self._frame_prefetcher = FramePrefetcher(self, file_path, 1)
+            self._frame_prefetcher.start()
         else:
             QMessageBox.warning(
                 self,
@@ -1955,7 +2583,7 @@ class SoundReactiveGUI(QMainWindow):
         
         # Start audio analysis in background
         self.processing_signals.progress_update.emit(50, "Extracting audio and analyzing frequencies...")
-        self.status_label.setText("Extracting audio and analyzing frequencies... This may take a moment.")
+        self._set_status("Extracting audio and analyzing frequencies... This may take a moment.")
         threading.Thread(target=self.analyze_audio, daemon=True).start()
     
     def load_image(self):
@@ -1984,7 +2612,7 @@ class SoundReactiveGUI(QMainWindow):
         self.height = h
         
         if self.audio_path:
-            self.status_label.setText("Analyzing audio frequencies...")
+            self._set_status("Analyzing audio frequencies...")
             threading.Thread(target=self.analyze_audio_image_mode, daemon=True).start()
         else:
             self.update_preview()
@@ -1999,12 +2627,11 @@ class SoundReactiveGUI(QMainWindow):
         
         self.processing_signals.progress_update.emit(10, self._get_random_message('folder_loading'))
         
-        # Get all image files from folder
-        image_extensions = {'.png', '.jpg', '.jpeg', '.bmp', '.tiff', '.webp', '.PNG', '.JPG', '.JPEG', '.BMP', '.TIFF', '.WEBP'}
-        image_files = []
-        for file in os.listdir(folder_path):
-            if any(file.endswith(ext) for ext in image_extensions):
-                image_files.append(os.path.join(folder_path, file))
+        # Get all image files from folder (one set lookup per entry, any case)
+        with os.scandir(folder_path) as entries:
+            image_files = [entry.path for entry in entries
+                           if os.path.splitext(entry.name)[1].lower() in FOLDER_IMAGE_EXTENSIONS
+                           and entry.is_file()]
         
         if not image_files:
             QMessageBox.warning(self, "No Images Found", "No image files found in the selected folder.")
@@ -2044,9 +2671,12 @@ class SoundReactiveGUI(QMainWindow):
         self.processing_signals.progress_update.emit(100, f"Loaded {len(image_files)} images from folder")
         self.update_preview()
         
+        # Decode and fit the rest in the background for scrubbing and rendering
+        threading.Thread(target=self._load_folder_images, daemon=True).start()
+        
         # If audio is already loaded, analyze it
         if self.audio_path:
-            self.status_label.setText("Analyzing audio frequencies...")
+            self._set_status("Analyzing audio frequencies...")
             threading.Thread(target=self.analyze_audio_image_mode, daemon=True).start()
     
     def load_audio(self):
@@ -2067,49 +2697,125 @@ class SoundReactiveGUI(QMainWindow):
             self.audio_path_label.setText(f"Audio: {os.path.basename(file_path)}")
         
         if (self.mode == "image" and self.image_path) or (self.mode == "folder" and self.image_list) or (self.mode == "webcam"):
-            self.status_label.setText("Analyzing audio frequencies...")
+            self._set_status("Analyzing audio frequencies...")
             threading.Thread(target=self.analyze_audio_image_mode, daemon=True).start()
     
     def _update_progress(self, percent, message):
-        """Thread-safe progress update"""
-        self.progress_bar.setValue(percent)
-        self.progress_label.setText(f"{percent}%")
+        """Thread-safe progress update (coalesced, see _flush_status)"""
+        self._pending_percent = percent
         if message:
-            self.status_label.setText(message)
+            self._pending_message = message
+        self._schedule_status_flush()
     
     def _update_frame_preview(self, frame):
-        """Thread-safe frame preview update"""
+        """Thread-safe frame preview update (coalesced, see _flush_status)"""
         if frame is not None:
-            # Convert BGR to RGB
-            display_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            
-            # Resize for display
-            h, w = display_frame.shape[:2]
-            label_size = self.preview_label.size()
-            scale = min(label_size.width() / w, label_size.height() / h, 1.0)
-            new_w = int(w * scale)
-            new_h = int(h * scale)
-            
-            display_frame = cv2.resize(display_frame, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
-            
-            # Convert to QPixmap
-            q_image = QImage(display_frame.data, new_w, new_h, new_w * 3, QImage.Format_RGB888)
-            pixmap = QPixmap.fromImage(q_image)
-            self.preview_label.setPixmap(pixmap)
+            self._pending_preview_frame = frame
+            self._schedule_status_flush()
+    
+    def _schedule_status_flush(self):
+        # The first update after a quiet period is shown right away
+        if not self._status_flush_timer.isActive():
+            self._flush_status()
+    
+    def _flush_status(self):
+        """
+        Apply the latest pending progress, status text and processing frame
+        
+        Render loops report every few frames, faster than anyone can read.
+        After a flush, updates arriving within STATUS_FLUSH_MS only replace
+        the pending values; the timer then applies the latest ones and keeps
+        going until a period passes without updates.
+        """
+        applied = False
+        if self._pending_percent is not None:
+            self.progress_bar.setValue(self._pending_percent)
+            self.progress_label.setText(f"{self._pending_percent}%")
+            self._pending_percent = None
+            applied = True
+        if self._pending_message is not None:
+            self.status_label.setText(self._pending_message)
+            self._pending_message = None
+            applied = True
+        if self._pending_preview_frame is not None:
+            frame, self._pending_preview_frame = self._pending_preview_frame, None
+            self._show_preview_frame(frame)
+            applied = True
+        if applied:
+            self._status_flush_timer.start()
+    
+    def _set_status(self, text):
+        """Show status text now, superseding progress messages not yet flushed"""
+        self._pending_message = None
+        self.status_label.setText(text)
+    
+    def _show_preview_frame(self, frame, max_scale=1.0):
+        """
+        Scale a BGR frame to the preview label and display it
+        
+        The display buffer and the QImage wrapping it are kept between calls
+        and only reallocated when the display size changes, so steady-state
+        previews don't allocate per frame. On Qt >= 5.14 the QImage reads the
+        BGR pixels directly; older Qt gets an extra RGB buffer.
+        
+        Args:
+            frame: BGR frame, or a tuple of equally sized frames shown side by side
+            max_scale: Largest magnification (above 1.0 only for draft frames)
+        """
+        # Resize for display
+        panes = frame if isinstance(frame, tuple) else (frame,)
+        h, w = panes[0].shape[:2]
+        label_size = self.preview_label.size()
+        self._preview_shown_frame = frame
+        self._preview_shown_size = label_size
+        scale = min(label_size.width() / (w * len(panes)), label_size.height() / h, max_scale)
+        pane_w = int(w * scale)
+        new_w = pane_w * len(panes)
+        new_h = int(h * scale)
+        
+        if self._preview_display is None or self._preview_display.shape[:2] != (new_h, new_w):
+            self._preview_scaled = np.empty((new_h, new_w, 3), dtype=np.uint8)
+            if QIMAGE_HAS_BGR888:
+                self._preview_display = self._preview_scaled
+                image_format = QImage.Format_BGR888
+            else:
+                self._preview_display = np.empty((new_h, new_w, 3), dtype=np.uint8)
+                image_format = QImage.Format_RGB888
+            self._preview_qimage = QImage(self._preview_display.data, new_w, new_h, new_w * 3, image_format)
+        
+        # Scale first (fewer pixels to convert), then fill the QImage buffer;
+        # side-by-side panes are written into their slices, no hstack
+        if len(panes) > 1 or (pane_w, new_h) != (w, h):
+            for i, pane in enumerate(panes):
+                target = self._preview_scaled[:, i * pane_w:(i + 1) * pane_w]
+                if (pane_w, new_h) != (w, h):
+                    cv2.resize(pane, (pane_w, new_h), dst=target, interpolation=cv2.INTER_LINEAR)
+                else:
+                    np.copyto(target, pane)
+            frame = self._preview_scaled
+        if not QIMAGE_HAS_BGR888:
+            cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._preview_display)
+        elif frame is not self._preview_scaled:
+            np.copyto(self._preview_display, frame)
+        
+        # fromImage copies the pixels, so the buffer is free to be reused next frame;
+        # the frame is already display-sized, so skip Qt's format conversion pass
+        self.preview_label.setPixmap(QPixmap.fromImage(self._preview_qimage, Qt.NoFormatConversion))
     
     def _update_analysis_status(self, message):
         """Thread-safe analysis status update"""
-        self.status_label.setText(message)
+        self._set_status(message)
     
     def _get_random_message(self, category):
         """Get a random message from a category"""
-        return random.choice(self.status_messages.get(category, ["Processing..."]))
+        return random.choice(self.status_messages.get(category, ("Processing...",)))
     
     def analyze_audio(self):
         """Analyze audio in background thread (video mode)"""
         try:
-            self.processing_signals.analysis_progress.emit(self._get_random_message('audio_extraction'))
-            self.processing_signals.progress_update.emit(10, self._get_random_message('audio_extraction'))
+            message = self._get_random_message('audio_extraction')
+            self.processing_signals.analysis_progress.emit(message)
+            self.processing_signals.progress_update.emit(10, message)
             
             with tempfile.TemporaryDirectory() as tmpdir:
                 audio_path = os.path.join(tmpdir, 'audio.wav')
@@ -2126,15 +2832,15 @@ class SoundReactiveGUI(QMainWindow):
                     self.processing_signals.progress_update.emit(0, "Error extracting audio")
                     return
                 
-                self.processing_signals.progress_update.emit(30, self._get_random_message('audio_analysis'))
-                self.processing_signals.analysis_progress.emit(self._get_random_message('audio_analysis'))
+                message = self._get_random_message('audio_analysis')
+                self.processing_signals.analysis_progress.emit(message)
+                self.processing_signals.progress_update.emit(30, message)
                 
+                from audio_analysis import AudioAnalyzer
                 analyzer = AudioAnalyzer(audio_path, sr=22050)
                 self.processing_signals.progress_update.emit(60, "Computing spectrogram...")
                 
-                self.energy_curves, self.frame_times = analyzer.analyze_enhanced()
-                self.bass_beat_frames = analyzer.bass_beat_frames if hasattr(analyzer, 'bass_beat_frames') else None
-                self.snare_hit_frames = analyzer.snare_hit_frames if hasattr(analyzer, 'snare_hit_frames') else None
+                self._bind_analysis(analyzer, *analyzer.analyze_enhanced())
                 
                 self.processing_signals.progress_update.emit(100, f"Ready - {self.total_frames} frames @ {self.fps:.1f} FPS")
                 QTimer.singleShot(0, self.update_preview)
@@ -2148,29 +2854,21 @@ class SoundReactiveGUI(QMainWindow):
                 self.processing_signals.progress_update.emit(0, "Error: Invalid audio file path")
                 return
             
-            self.processing_signals.progress_update.emit(20, self._get_random_message('audio_analysis'))
-            self.processing_signals.analysis_progress.emit(self._get_random_message('audio_analysis'))
+            message = self._get_random_message('audio_analysis')
+            self.processing_signals.analysis_progress.emit(message)
+            self.processing_signals.progress_update.emit(20, message)
             
+            from audio_analysis import AudioAnalyzer, get_audio_info
             analyzer = AudioAnalyzer(self.audio_path, sr=22050)
-            self.processing_signals.progress_update.emit(40, "Loading audio file...")
-            analyzer.load_audio()
+            # analyze_enhanced only decodes the audio on a cache miss
+            self.processing_signals.progress_update.emit(40, "Analyzing frequency bands...")
+            self._bind_analysis(analyzer, *analyzer.analyze_enhanced())
             
-            self.processing_signals.progress_update.emit(60, "Computing spectrogram...")
-            analyzer.compute_spectrogram()
-            
-            self.processing_signals.progress_update.emit(80, "Analyzing frequency bands...")
-            self.energy_curves, self.frame_times = analyzer.analyze_enhanced()
-            self.bass_beat_frames = analyzer.bass_beat_frames if hasattr(analyzer, 'bass_beat_frames') else None
-            self.snare_hit_frames = analyzer.snare_hit_frames if hasattr(analyzer, 'snare_hit_frames') else None
-            
-            import librosa
-            y, sr = librosa.load(self.audio_path, sr=None)
-            self.audio_duration = len(y) / sr
+            self.audio_duration, _ = get_audio_info(self.audio_path)
             self.total_frames = int(self.audio_duration * self.fps)
             
-            QTimer.singleShot(0, lambda: self.frame_slider.setMaximum(max(0, self.total_frames - 1)))
-            QTimer.singleShot(0, lambda: self.frame_slider.setValue(0))
             self.current_frame_idx = 0
+            QTimer.singleShot(0, self._reset_frame_slider)
             
             if self.mode == "folder":
                 mode_text = f"Folder mode ({len(self.image_list)} images)"
@@ -2207,11 +2905,13 @@ class SoundReactiveGUI(QMainWindow):
         if not output_path:
             return
         
-        self.status_label.setText("Generating preview sequence...")
+        self._set_status("Generating preview sequence...")
         threading.Thread(target=self._generate_preview_sequence, args=(output_path,), daemon=True).start()
     
     def _generate_preview_sequence(self, output_path):
         """Generate preview sequence in background"""
+        from video_processor import FFmpegPipeWriter
+        
         try:
             start_frame = self.current_frame_idx
             num_frames = int(self.fps)
@@ -2219,37 +2919,37 @@ class SoundReactiveGUI(QMainWindow):
             
             self.processing_signals.progress_update.emit(0, "Generating preview sequence...")
             
-            fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-            out = cv2.VideoWriter(output_path, fourcc, self.fps,
-                                (self.current_frame.shape[1], self.current_frame.shape[0]))
-            
             self.video_cap.set(cv2.CAP_PROP_POS_FRAMES, start_frame)
             
             frames_to_process = end_frame - start_frame
             original_frame_idx = self.current_frame_idx
             
-            for i, frame_idx in enumerate(range(start_frame, end_frame)):
-                ret, frame = self.video_cap.read()
-                if not ret:
-                    break
-                
-                # Set current frame index for effect calculation
-                self.current_frame_idx = frame_idx
-                
-                processed = self.apply_effects_to_frame(frame.copy())
-                out.write(processed)
-                
-                progress = int((i + 1) / frames_to_process * 100.0)
-                message = f"Processing preview frame {i + 1}/{frames_to_process}"
-                self.processing_signals.progress_update.emit(progress, message)
-                
-                # Show frame preview every few frames
-                if i % 5 == 0 or i == frames_to_process - 1:
-                    self.processing_signals.frame_update.emit(processed)
-            
-            # Restore original frame index
-            self.current_frame_idx = original_frame_idx
-            out.release()
+            out = BackgroundFrameWriter(FFmpegPipeWriter(
+                output_path, self.fps,
+                (self.current_frame.shape[1], self.current_frame.shape[0]),
+                ffmpeg_bin=get_ffmpeg_path()))
+            try:
+                # Decode, effects and encode overlap on three threads
+                for i, frame in enumerate(iter_frames_ahead(self.video_cap, frames_to_process)):
+                    # Set current frame index for effect calculation
+                    self.current_frame_idx = start_frame + i
+                    
+                    processed = self.apply_effects_to_frame(frame)
+                    out.write(processed)
+                    
+                    progress = int((i + 1) / frames_to_process * 100.0)
+                    message = f"Processing preview frame {i + 1}/{frames_to_process}"
+                    self.processing_signals.progress_update.emit(progress, message)
+                    
+                    # Show frame preview every few frames
+                    if i % 5 == 0 or i == frames_to_process - 1:
+                        self.processing_signals.frame_update.emit(processed)
+            finally:
+                # Restore original frame index; the capture position moved, so the
+                # next scrub has to seek
+                self.current_frame_idx = original_frame_idx
+                self._last_decoded_idx = None
+                out.release()
             
             self.processing_signals.progress_update.emit(100, f"Preview sequence saved to {os.path.basename(output_path)}")
             QTimer.singleShot(1000, lambda: self.processing_signals.progress_update.emit(0, "Ready"))
@@ -2283,9 +2983,37 @@ class SoundReactiveGUI(QMainWindow):
         if not output_path:
             return
         
-        self.status_label.setText("Processing full video... This may take a while.")
+        self._set_status("Processing full video... This may take a while.")
         threading.Thread(target=self._process_full_video_thread, args=(output_path,), daemon=True).start()
     
+    def _folder_images_key(self):
+        return (tuple(self.image_list), self.width, self.height)
+    
+    def _load_folder_images(self):
+        """
+        Folder images decoded and fitted to width x height, in image_list order
+        
+        Decoding and resizing release the GIL, so the images are loaded on
+        FOLDER_LOAD_WORKERS threads. The result is kept until the folder or
+        the output size changes; concurrent callers wait for one load.
+        
+        Returns:
+            List of BGR images (None where a file could not be decoded)
+        """
+        with self._folder_images_lock:
+            key = self._folder_images_key()
+            if self._folder_images[0] != key:
+                _, width, height = key
+                
+                def load(path):
+                    img = cv2.imread(path)
+                    return self._resize_image_to_fit(img, width, height) if img is not None else None
+                
+                with ThreadPoolExecutor(max_workers=FOLDER_LOAD_WORKERS) as pool:
+                    images = list(pool.map(load, key[0]))
+                self._folder_images = (key, images)
+            return self._folder_images[1]
+    
     def _resize_image_to_fit(self, image, target_width, target_height):
         """Resize image to fit target dimensions while maintaining aspect ratio, then center it"""
         h, w = image.shape[:2]
@@ -2296,7 +3024,8 @@ class SoundReactiveGUI(QMainWindow):
         new_h = int(h * scale)
         
         # Resize image
-        resized = cv2.resize(image, (new_w, new_h), interpolation=cv2.INTER_LANCZOS4)
+        from video_processor import resize_interpolation
+        resized = cv2.resize(image, (new_w, new_h), interpolation=resize_interpolation(scale))
         
         # Create canvas and center the image
         canvas = np.zeros((target_height, target_width, 3), dtype=np.uint8)
@@ -2306,21 +3035,19 @@ class SoundReactiveGUI(QMainWindow):
         
         return canvas
     
-    def _crossfade_images(self, img1, img2, alpha):
-        """Blend two images with crossfade (alpha: 0.0 = img1, 1.0 = img2)"""
+    def _crossfade_images(self, img1, img2, alpha, dst=None):
+        """Blend two images with crossfade (alpha: 0.0 = img1, 1.0 = img2), into dst if given"""
         alpha = np.clip(alpha, 0.0, 1.0)
-        return cv2.addWeighted(img1, 1.0 - alpha, img2, alpha, 0)
+        return cv2.addWeighted(img1, 1.0 - alpha, img2, alpha, 0, dst=dst)
     
     def _process_image_to_video_with_progress(self, processor, output_path, energy_curves, frame_times, 
                                                bass_beat_frames, snare_hit_frames):
         """Process image to video with progress reporting and frame-by-frame visualization"""
+        from video_processor import FFmpegPipeWriter
+        
         # Get total frames
         total_frames = processor.total_frames
         
-        # Setup video writer
-        fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-        out = cv2.VideoWriter(output_path, fourcc, self.fps, (self.width, self.height))
-        
         # Interpolate energy curves for all frames
         video_frame_times = np.linspace(0, processor.audio_duration, total_frames)
         sub_bass_interp = np.interp(video_frame_times, frame_times, energy_curves.get('sub_bass', np.zeros(len(frame_times))))
@@ -2329,101 +3056,100 @@ class SoundReactiveGUI(QMainWindow):
         treble_interp = np.interp(video_frame_times, frame_times, energy_curves.get('treble', np.zeros(len(frame_times))))
         high_treble_interp = np.interp(video_frame_times, frame_times, energy_curves.get('high_treble', np.zeros(len(frame_times))))
         
-        # Get beat times
-        if bass_beat_frames is not None and len(bass_beat_frames) > 0:
-            bass_beat_times = frame_times[bass_beat_frames]
-        else:
-            bass_beat_times = np.array([])
+        # One status message for the whole render; only the counters change per tick
+        frame_message = self._get_random_message('processing_frame')
         
-        if snare_hit_frames is not None and len(snare_hit_frames) > 0:
-            snare_hit_times = frame_times[snare_hit_frames]
-        else:
-            snare_hit_times = np.array([])
-        
-        # Handle folder mode vs single image mode
-        if self.mode == "folder" and len(self.image_list) > 1:
-            # Folder mode: multiple images with crossfade
-            num_images = len(self.image_list)
-            duration_per_image = processor.audio_duration / num_images
-            frames_per_image = int(duration_per_image * self.fps)
-            crossfade_duration = 1.0  # 1 second crossfade
-            crossfade_frames = int(crossfade_duration * self.fps)
-            
-            # Load and resize all images
-            loaded_images = []
-            for img_path in self.image_list:
-                img = cv2.imread(img_path)
-                if img is not None:
-                    resized = self._resize_image_to_fit(img, self.width, self.height)
-                    loaded_images.append(resized)
-            
-            if not loaded_images:
-                self.processing_signals.progress_update.emit(0, "Error: No valid images loaded")
-                out.release()
-                return
-            
-            # Process each frame
-            for frame_idx in range(total_frames):
-                self.current_frame_idx = frame_idx
-                current_time = frame_idx / self.fps
-                
-                # Determine which image(s) to use
-                image_index = int(current_time / duration_per_image)
-                image_index = min(image_index, len(loaded_images) - 1)
-                
-                # Calculate position within current image segment
-                segment_start_time = image_index * duration_per_image
-                segment_time = current_time - segment_start_time
-                
-                # Get base frame (with crossfade if transitioning)
-                if image_index < len(loaded_images) - 1 and segment_time > (duration_per_image - crossfade_duration):
-                    # In crossfade zone
-                    next_image_index = image_index + 1
-                    fade_progress = (segment_time - (duration_per_image - crossfade_duration)) / crossfade_duration
-                    fade_progress = np.clip(fade_progress, 0.0, 1.0)
-                    base_frame = self._crossfade_images(
-                        loaded_images[image_index],
-                        loaded_images[next_image_index],
-                        fade_progress
-                    )
-                else:
-                    # Normal image display
-                    base_frame = loaded_images[image_index].copy()
-                
-                # Apply effects
-                processed_frame = self.apply_effects_to_frame(base_frame)
-                out.write(processed_frame)
+        # Setup video writer
+        out = FFmpegPipeWriter(output_path, self.fps, (self.width, self.height),
+                               ffmpeg_bin=get_ffmpeg_path())
+        try:
+            # Handle folder mode vs single image mode
+            if self.mode == "folder" and len(self.image_list) > 1:
+                # Folder mode: multiple images with crossfade
+                num_images = len(self.image_list)
+                duration_per_image = processor.audio_duration / num_images
+                frames_per_image = int(duration_per_image * self.fps)
+                crossfade_duration = 1.0  # 1 second crossfade
+                crossfade_frames = int(crossfade_duration * self.fps)
                 
-                # Update progress
-                if frame_idx % 3 == 0 or frame_idx == total_frames - 1:
-                    progress = int((frame_idx + 1) / total_frames * 85)
-                    message = f"{self._get_random_message('processing_frame')} ({frame_idx + 1}/{total_frames}) - Image {image_index + 1}/{len(loaded_images)}"
-                    self.processing_signals.progress_update.emit(progress, message)
-                    self.processing_signals.frame_update.emit(processed_frame)
-        else:
-            # Single image mode (original behavior)
-            for frame_idx in range(total_frames):
-                self.current_frame_idx = frame_idx
+                # Images fitted to the output size (usually preloaded by load_image_folder)
+                loaded_images = [img for img in self._load_folder_images() if img is not None]
                 
-                # Start with base image
-                frame = self.base_image.copy()
+                if not loaded_images:
+                    self.processing_signals.progress_update.emit(0, "Error: No valid images loaded")
+                    return
                 
-                # Apply effects
-                processed_frame = self.apply_effects_to_frame(frame)
-                out.write(processed_frame)
+                # Crossfades are blended into one buffer reused for the whole render
+                crossfade_buf = np.empty_like(loaded_images[0])
                 
-                # Update progress
-                if frame_idx % 3 == 0 or frame_idx == total_frames - 1:
-                    progress = int((frame_idx + 1) / total_frames * 85)
-                    message = f"{self._get_random_message('processing_frame')} ({frame_idx + 1}/{total_frames})"
-                    self.processing_signals.progress_update.emit(progress, message)
-                    self.processing_signals.frame_update.emit(processed_frame)
-        
-        out.release()
+                # Process each frame
+                for frame_idx in range(total_frames):
+                    self.current_frame_idx = frame_idx
+                    current_time = frame_idx / self.fps
+                    
+                    # Determine which image(s) to use
+                    image_index = int(current_time / duration_per_image)
+                    image_index = min(image_index, len(loaded_images) - 1)
+                    
+                    # Calculate position within current image segment
+                    segment_start_time = image_index * duration_per_image
+                    segment_time = current_time - segment_start_time
+                    
+                    # Get base frame (with crossfade if transitioning)
+                    if image_index < len(loaded_images) - 1 and segment_time > (duration_per_image - crossfade_duration):
+                        # In crossfade zone
+                        next_image_index = image_index + 1
+                        fade_progress = (segment_time - (duration_per_image - crossfade_duration)) / crossfade_duration
+                        fade_progress = np.clip(fade_progress, 0.0, 1.0)
+                        base_frame = self._crossfade_images(
+                            loaded_images[image_index],
+                            loaded_images[next_image_index],
+                            fade_progress,
+                            dst=crossfade_buf
+                        )
+                    else:
+                        # Normal image display (effects don't modify their input)
+                        base_frame = loaded_images[image_index]
+                    
+                    # Apply effects
+                    processed_frame = self.apply_effects_to_frame(base_frame)
+                    out.write(processed_frame)
+                    
+                    # Update progress
+                    if frame_idx % 3 == 0 or frame_idx == total_frames - 1:
+                        progress = int((frame_idx + 1) / total_frames * 85)
+                        message = f"{frame_message} ({frame_idx + 1}/{total_frames}) - Image {image_index + 1}/{len(loaded_images)}"
+                        self.processing_signals.progress_update.emit(progress, message)
+                        # Without effects the frame is the crossfade buffer, which the next frame overwrites
+                        if processed_frame is crossfade_buf:
+                            processed_frame = processed_frame.copy()
+                        self.processing_signals.frame_update.emit(processed_frame)
+            else:
+                # Single image mode (original behavior)
+                for frame_idx in range(total_frames):
+                    self.current_frame_idx = frame_idx
+                    
+                    # Start with base image (effects don't modify their input)
+                    frame = self.base_image
+                    
+                    # Apply effects
+                    processed_frame = self.apply_effects_to_frame(frame)
+                    out.write(processed_frame)
+                    
+                    # Update progress
+                    if frame_idx % 3 == 0 or frame_idx == total_frames - 1:
+                        progress = int((frame_idx + 1) / total_frames * 85)
+                        message = f"{frame_message} ({frame_idx + 1}/{total_frames})"
+                        self.processing_signals.progress_update.emit(progress, message)
+                        self.processing_signals.frame_update.emit(processed_frame)
+        finally:
+            out.release()
     
     def _process_video_with_progress(self, video_path, output_path, energy_curves, frame_times,
                                      bass_beat_frames=None, snare_hit_frames=None):
         """Process video with progress reporting and frame-by-frame visualization"""
+        from video_processor import VideoProcessor, FFmpegPipeWriter
+        
         # Open video
         cap = cv2.VideoCapture(video_path)
         if not cap.isOpened():
@@ -2440,235 +3166,166 @@ class SoundReactiveGUI(QMainWindow):
             raise RuntimeError("Video has no frames")
         
         # Setup video writer
-        fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-        out = cv2.VideoWriter(output_path, fourcc, fps, (width, height))
-        
-        if not out.isOpened():
-            cap.release()
-            raise RuntimeError("Could not create output video writer")
+        out = BackgroundFrameWriter(FFmpegPipeWriter(output_path, fps, (width, height),
+                                                     ffmpeg_bin=get_ffmpeg_path()))
         
-        # Interpolate energy curves for all frames
-        video_duration = total_frames / fps
-        video_frame_times = np.linspace(0, video_duration, total_frames)
-        
-        # Interpolate energy curves to video frame times
-        sub_bass_interp = np.interp(video_frame_times, frame_times, energy_curves.get('sub_bass', np.zeros(len(frame_times))))
-        bass_interp = np.interp(video_frame_times, frame_times, energy_curves.get('bass', np.zeros(len(frame_times))))
-        mid_interp = np.interp(video_frame_times, frame_times, energy_curves.get('mid', np.zeros(len(frame_times))))
-        treble_interp = np.interp(video_frame_times, frame_times, energy_curves.get('treble', np.zeros(len(frame_times))))
-        high_treble_interp = np.interp(video_frame_times, frame_times, energy_curves.get('high_treble', np.zeros(len(frame_times))))
-        
-        # Get beat times
-        if bass_beat_frames is not None and len(bass_beat_frames) > 0:
-            bass_beat_times = frame_times[bass_beat_frames]
-        else:
-            bass_beat_times = np.array([])
-        
-        if snare_hit_frames is not None and len(snare_hit_frames) > 0:
-            snare_hit_times = frame_times[snare_hit_frames]
-        else:
-            snare_hit_times = np.array([])
-        
-        # Process each frame
-        # Natural motion persistent state
-        _vp_nm_ad_smooth_x = 0.0
-        _vp_nm_ad_smooth_y = 0.0
-        _vp_nm_params = self.get_natural_motion_params()
-
-        frame_idx = 0
-        while True:
-            ret, frame = cap.read()
-            if not ret:
-                break
+        try:
+            if not out.isOpened():
+                raise RuntimeError("Could not create output video writer")
+            
+            # Interpolate energy curves for all frames
+            video_duration = total_frames / fps
+            video_frame_times = np.linspace(0, video_duration, total_frames)
+            
+            # Interpolate energy curves to video frame times
+            sub_bass_interp = np.interp(video_frame_times, frame_times, energy_curves.get('sub_bass', np.zeros(len(frame_times))))
+            bass_interp = np.interp(video_frame_times, frame_times, energy_curves.get('bass', np.zeros(len(frame_times))))
+            mid_interp = np.interp(video_frame_times, frame_times, energy_curves.get('mid', np.zeros(len(frame_times))))
+            treble_interp = np.interp(video_frame_times, frame_times, energy_curves.get('treble', np.zeros(len(frame_times))))
+            high_treble_interp = np.interp(video_frame_times, frame_times, energy_curves.get('high_treble', np.zeros(len(frame_times))))
+            
+            # Get beat times
+            if bass_beat_frames is not None and len(bass_beat_frames) > 0:
+                bass_beat_times = np.sort(frame_times[bass_beat_frames])
+            else:
+                bass_beat_times = np.array([])
             
-            # Update current frame index for effect calculation
-            self.current_frame_idx = frame_idx
-            current_time = frame_idx / fps
-            
-            # Get effect parameters for this frame
-            intensity_sens = self.intensity_slider.value() / 100.0
-            zoom_val = self.zoom_slider.value() / 100.0
-            rotation_val = self.rotation_slider.value() / 10.0
-            
-            # Get energy values for this frame
-            sub_bass_val = sub_bass_interp[frame_idx]
-            bass_val = bass_interp[frame_idx]
-            mid_val = mid_interp[frame_idx]
-            treble_val = treble_interp[frame_idx]
-            high_treble_val = high_treble_interp[frame_idx]
-            
-            # Calculate zoom (beat-triggered)
-            zoom = 1.0
-            if self.bass_beat_frames is not None and len(self.bass_beat_frames) > 0 and len(bass_beat_times) > 0:
-                time_distances = np.abs(bass_beat_times - current_time)
-                nearest_beat_distance = np.min(time_distances) if len(time_distances) > 0 else float('inf')
-                beat_window = 0.2
-                if nearest_beat_distance <= beat_window:
-                    beat_proximity = 1.0 - (nearest_beat_distance / beat_window)
-                    beat_proximity = np.clip(beat_proximity, 0.0, 1.0)
-                    bass_intensity = (sub_bass_val * 0.2 + bass_val * 1.0) / 1.2
-                    bass_intensity = np.clip(bass_intensity, 0.0, 1.0)
-                    zoom_intensity = beat_proximity * 0.7 + bass_intensity * 0.3
-                    zoom_intensity = (1.0 - intensity_sens) + (intensity_sens * zoom_intensity)
-                    zoom = 1.0 + (zoom_val - 1.0) * zoom_intensity
+            if snare_hit_frames is not None and len(snare_hit_frames) > 0:
+                snare_hit_times = np.sort(frame_times[snare_hit_frames])
             else:
-                zoom_intensity = (sub_bass_val * 0.2 + bass_val * 1.0) / 1.2
-                zoom_intensity = (1.0 - intensity_sens) + (intensity_sens * zoom_intensity)
-                zoom = 1.0 + (zoom_val - 1.0) * zoom_intensity
+                snare_hit_times = np.array([])
             
-            # Calculate rotation
-            rotation_intensity = (treble_val * 1.0 + high_treble_val * 0.5) / 1.5
-            rotation_intensity = (1.0 - intensity_sens) + (intensity_sens * rotation_intensity)
-            rotation = rotation_val * rotation_intensity
-            
-            # Calculate hue shift, saturation, brightness
-            hue_shift = mid_val * (self.hue_slider.value()) if self.color_grading_check.isChecked() else 0.0
-            saturation = 1.0 + (treble_val * 0.3) if self.color_grading_check.isChecked() else 1.0
-            brightness = 1.0 + ((bass_val + mid_val) * 0.3) if self.brightness_check.isChecked() else 1.0
-            
-            # Snare flash
-            if snare_hit_frames is not None and len(snare_hit_frames) > 0 and len(snare_hit_times) > 0:
-                snare_time_distances = np.abs(snare_hit_times - current_time)
-                nearest_snare_distance = np.min(snare_time_distances) if len(snare_time_distances) > 0 else float('inf')
-                snare_window = 0.15
-                if nearest_snare_distance <= snare_window:
-                    snare_proximity = 1.0 - (nearest_snare_distance / snare_window)
-                    snare_proximity = np.clip(snare_proximity, 0.0, 1.0)
-                    flash_intensity = snare_proximity * 0.8
-                    brightness = brightness + flash_intensity
-                    brightness = np.clip(brightness, 1.0, 2.0)
-            
-            blur_intensity = bass_val * 0.5 if self.blur_check.isChecked() else 0.0
-            
-            # Calculate artistic effect intensities
-            pixel_sort_intensity = 0.0
-            if self.effect_checks['pixel_sort'].isChecked():
-                base_intensity = self.mix_frequency_bands(sub_bass_val, bass_val, mid_val, treble_val, high_treble_val, self.pixel_sort_weights)
-                if base_intensity > 1e-8:
-                    pixel_sort_intensity = base_intensity * (0.5 + intensity_sens * 0.5)
-                    pixel_sort_intensity = np.clip(pixel_sort_intensity, 0.0, 1.0)
-                    pixel_sort_intensity = self.apply_temporal_smoothing('pixel_sort', pixel_sort_intensity)
-            
-            kaleidoscope_intensity = 0.0
-            if self.effect_checks['kaleidoscope'].isChecked():
-                base_intensity = self.mix_frequency_bands(sub_bass_val, bass_val, mid_val, treble_val, high_treble_val, self.kaleidoscope_weights)
-                if base_intensity > 1e-8:
-                    kaleidoscope_intensity = base_intensity * (0.5 + intensity_sens * 0.5)
-                    kaleidoscope_intensity = np.clip(kaleidoscope_intensity, 0.0, 1.0)
-                    kaleidoscope_intensity = self.apply_temporal_smoothing('kaleidoscope', kaleidoscope_intensity)
-            
-            wave_distortion_intensity = 0.0
-            if self.effect_checks['wave_distortion'].isChecked():
-                base_intensity = self.mix_frequency_bands(sub_bass_val, bass_val, mid_val, treble_val, high_treble_val, self.wave_distortion_weights)
-                if base_intensity > 1e-8:
-                    wave_distortion_intensity = base_intensity * (0.5 + intensity_sens * 0.5)
-                    wave_distortion_intensity = np.clip(wave_distortion_intensity, 0.0, 1.0)
-                    wave_distortion_intensity = self.apply_temporal_smoothing('wave_distortion', wave_distortion_intensity)
-            
-            vhs_intensity = 0.0
-            if self.effect_checks['vhs'].isChecked():
-                base_intensity = self.mix_frequency_bands(sub_bass_val, bass_val, mid_val, treble_val, high_treble_val, self.vhs_weights)
-                if base_intensity > 1e-8:
-                    vhs_intensity = base_intensity * (0.5 + intensity_sens * 0.5)
-                    vhs_intensity = np.clip(vhs_intensity, 0.0, 1.0)
-                    vhs_intensity = self.apply_temporal_smoothing('vhs', vhs_intensity)
-            
-            posterization_intensity = 0.0
-            if self.effect_checks['posterization'].isChecked():
-                base_intensity = self.mix_frequency_bands(sub_bass_val, bass_val, mid_val, treble_val, high_treble_val, self.posterization_weights)
-                if base_intensity > 1e-8:
-                    posterization_intensity = base_intensity * (0.5 + intensity_sens * 0.5)
-                    posterization_intensity = np.clip(posterization_intensity, 0.0, 1.0)
-                    posterization_intensity = self.apply_temporal_smoothing('posterization', posterization_intensity)
-            
-            edge_detection_intensity = 0.0
-            if self.effect_checks['edge_detection'].isChecked():
-                base_intensity = self.mix_frequency_bands(sub_bass_val, bass_val, mid_val, treble_val, high_treble_val, self.edge_detection_weights)
-                if base_intensity > 1e-8:
-                    edge_detection_intensity = base_intensity * (0.5 + intensity_sens * 0.5)
-                    edge_detection_intensity = np.clip(edge_detection_intensity, 0.0, 1.0)
-                    edge_detection_intensity = self.apply_temporal_smoothing('edge_detection', edge_detection_intensity)
-            
-            data_corruption_intensity = 0.0
-            if self.effect_checks['data_corruption'].isChecked():
-                base_intensity = self.mix_frequency_bands(sub_bass_val, bass_val, mid_val, treble_val, high_treble_val, self.data_corruption_weights)
-                if base_intensity > 1e-8:
-                    data_corruption_intensity = base_intensity * (0.5 + intensity_sens * 0.5)
-                    data_corruption_intensity = np.clip(data_corruption_intensity, 0.0, 1.0)
-                    data_corruption_intensity = self.apply_temporal_smoothing('data_corruption', data_corruption_intensity)
-            
-            scan_lines_intensity = 0.0
-            if self.effect_checks['scan_lines'].isChecked():
-                base_intensity = self.mix_frequency_bands(sub_bass_val, bass_val, mid_val, treble_val, high_treble_val, self.scan_lines_weights)
-                if base_intensity > 1e-8:
-                    scan_lines_intensity = base_intensity * (0.5 + intensity_sens * 0.5)
-                    scan_lines_intensity = np.clip(scan_lines_intensity, 0.0, 1.0)
-                    scan_lines_intensity = self.apply_temporal_smoothing('scan_lines', scan_lines_intensity)
-            
-            # Natural motion for this frame
-            _vp_nm = VideoProcessor.compute_natural_motion(
-                frame_idx=frame_idx,
-                total_frames=total_frames,
-                fps=fps,
-                audio_drift_bass=bass_val,
-                audio_drift_treble=treble_val,
-                audio_drift_smoothed_x=_vp_nm_ad_smooth_x,
-                audio_drift_smoothed_y=_vp_nm_ad_smooth_y,
-                **_vp_nm_params,
-            )
-            _vp_nm_ad_smooth_x = _vp_nm['audio_drift_smoothed_x']
-            _vp_nm_ad_smooth_y = _vp_nm['audio_drift_smoothed_y']
-
-            # Get blend mode and opacity
-            blend_mode = self.blend_mode_combo.currentText().lower()
-            layer_opacity = self.opacity_slider.value() / 100.0
+            # Distance from every frame to its nearest beat/snare, looked up per frame
+            beat_distances = VideoProcessor.nearest_event_distances(bass_beat_times, total_frames, fps)
+            snare_distances = VideoProcessor.nearest_event_distances(snare_hit_times, total_frames, fps)
+            
+            # Process each frame
+            # Natural motion persistent state
+            _vp_nm_ad_smooth_x = 0.0
+            _vp_nm_ad_smooth_y = 0.0
+            _vp_nm_params = self.get_natural_motion_params()
             
-            # Apply effects using VideoProcessor
+            # One effects processor for the whole render
             processor = VideoProcessor.__new__(VideoProcessor)
             processor.fps = fps
+
+            # One status message for the whole render; only the counters change per tick
+            frame_message = self._get_random_message('processing_frame')
             
-            processed_frame = processor.apply_effects(
-                frame,
-                zoom=zoom,
-                rotation=rotation,
-                hue_shift=hue_shift,
-                saturation=saturation,
-                brightness=brightness,
-                blur_intensity=blur_intensity,
-                glitch_intensity=0.0,
-                artifacts_intensity=0.0,
-                pixel_sort_intensity=pixel_sort_intensity,
-                kaleidoscope_intensity=kaleidoscope_intensity,
-                wave_distortion_intensity=wave_distortion_intensity,
-                vhs_intensity=vhs_intensity,
-                posterization_intensity=posterization_intensity,
-                edge_detection_intensity=edge_detection_intensity,
-                data_corruption_intensity=data_corruption_intensity,
-                scan_lines_intensity=scan_lines_intensity,
-                effect_mode="direct",
-                blend_mode=blend_mode,
-                layer_opacity=layer_opacity,
-                natural_zoom_offset=_vp_nm['zoom_offset'],
-                natural_pan_x=_vp_nm['pan_x'],
-                natural_pan_y=_vp_nm['pan_y'],
-                natural_rotation_offset=_vp_nm['rotation_offset'],
-            )
-            
-            # Write frame
-            out.write(processed_frame)
-            
-            # Update progress
-            if frame_idx % 3 == 0 or frame_idx == total_frames - 1:
-                progress = int((frame_idx + 1) / total_frames * 85)
-                message = f"{self._get_random_message('processing_frame')} ({frame_idx + 1}/{total_frames})"
-                self.processing_signals.progress_update.emit(progress, message)
-                self.processing_signals.frame_update.emit(processed_frame)
-            
-            frame_idx += 1
-        
-        # Cleanup
-        cap.release()
-        out.release()
+            # Decode, effects and encode overlap on three threads
+            for frame_idx, frame in enumerate(iter_frames_ahead(cap)):
+                # Update current frame index for effect calculation
+                self.current_frame_idx = frame_idx
+                
+                # Get effect parameters for this frame
+                intensity_sens = self.intensity_slider.value() / 100.0
+                zoom_val = self.zoom_slider.value() / 100.0
+                rotation_val = self.rotation_slider.value() / 10.0
+                
+                # Get energy values for this frame
+                sub_bass_val = sub_bass_interp[frame_idx]
+                bass_val = bass_interp[frame_idx]
+                mid_val = mid_interp[frame_idx]
+                treble_val = treble_interp[frame_idx]
+                high_treble_val = high_treble_interp[frame_idx]
+                
+                # Calculate zoom (beat-triggered)
+                zoom = 1.0
+                if self.bass_beat_frames is not None and len(self.bass_beat_frames) > 0 and len(bass_beat_times) > 0:
+                    nearest_beat_distance = beat_distances[frame_idx]
+                    beat_window = 0.2
+                    if nearest_beat_distance <= beat_window:
+                        beat_proximity = 1.0 - (nearest_beat_distance / beat_window)
+                        beat_proximity = np.clip(beat_proximity, 0.0, 1.0)
+                        bass_intensity = (sub_bass_val * 0.2 + bass_val * 1.0) / 1.2
+                        bass_intensity = np.clip(bass_intensity, 0.0, 1.0)
+                        zoom_intensity = beat_proximity * 0.7 + bass_intensity * 0.3
+                        zoom_intensity = (1.0 - intensity_sens) + (intensity_sens * zoom_intensity)
+                        zoom = 1.0 + (zoom_val - 1.0) * zoom_intensity
+                else:
+                    zoom_intensity = (sub_bass_val * 0.2 + bass_val * 1.0) / 1.2
+                    zoom_intensity = (1.0 - intensity_sens) + (intensity_sens * zoom_intensity)
+                    zoom = 1.0 + (zoom_val - 1.0) * zoom_intensity
+                
+                # Calculate rotation
+                rotation_intensity = (treble_val * 1.0 + high_treble_val * 0.5) / 1.5
+                rotation_intensity = (1.0 - intensity_sens) + (intensity_sens * rotation_intensity)
+                rotation = rotation_val * rotation_intensity
+                
+                # Calculate hue shift, saturation, brightness
+                hue_shift = mid_val * (self.hue_slider.value()) if self.color_grading_check.isChecked() else 0.0
+                saturation = 1.0 + (treble_val * 0.3) if self.color_grading_check.isChecked() else 1.0
+                brightness = 1.0 + ((bass_val + mid_val) * 0.3) if self.brightness_check.isChecked() else 1.0
+                
+                # Snare flash
+                if snare_hit_frames is not None and len(snare_hit_frames) > 0 and len(snare_hit_times) > 0:
+                    nearest_snare_distance = snare_distances[frame_idx]
+                    snare_window = 0.15
+                    if nearest_snare_distance <= snare_window:
+                        snare_proximity = 1.0 - (nearest_snare_distance / snare_window)
+                        snare_proximity = np.clip(snare_proximity, 0.0, 1.0)
+                        flash_intensity = snare_proximity * 0.8
+                        brightness = brightness + flash_intensity
+                        brightness = np.clip(brightness, 1.0, 2.0)
+                
+                blur_intensity = bass_val * 0.5 if self.blur_check.isChecked() else 0.0
+                
+                # Calculate artistic effect intensities
+                artistic = self.mix_artistic_intensities(
+                    (sub_bass_val, bass_val, mid_val, treble_val, high_treble_val), intensity_sens)
+                
+                # Natural motion for this frame
+                _vp_nm = VideoProcessor.compute_natural_motion(
+                    frame_idx=frame_idx,
+                    total_frames=total_frames,
+                    fps=fps,
+                    audio_drift_bass=bass_val,
+                    audio_drift_treble=treble_val,
+                    audio_drift_smoothed_x=_vp_nm_ad_smooth_x,
+                    audio_drift_smoothed_y=_vp_nm_ad_smooth_y,
+                    **_vp_nm_params,
+                )
+                _vp_nm_ad_smooth_x = _vp_nm['audio_drift_smoothed_x']
+                _vp_nm_ad_smooth_y = _vp_nm['audio_drift_smoothed_y']
+
+                # Get blend mode and opacity
+                blend_mode = self.blend_mode_combo.currentText().lower()
+                layer_opacity = self.opacity_slider.value() / 100.0
+                
+                # Apply effects using VideoProcessor
+                processed_frame = processor.apply_effects(
+                    frame,
+                    zoom=zoom,
+                    rotation=rotation,
+                    hue_shift=hue_shift,
+                    saturation=saturation,
+                    brightness=brightness,
+                    blur_intensity=blur_intensity,
+                    glitch_intensity=0.0,
+                    artifacts_intensity=0.0,
+                    **artistic,
+                    effect_mode="direct",
+                    blend_mode=blend_mode,
+                    layer_opacity=layer_opacity,
+                    natural_zoom_offset=_vp_nm['zoom_offset'],
+                    natural_pan_x=_vp_nm['pan_x'],
+                    natural_pan_y=_vp_nm['pan_y'],
+                    natural_rotation_offset=_vp_nm['rotation_offset'],
+                )
+                
+                # Write frame
+                out.write(processed_frame)
+                
+                # Update progress
+                if frame_idx % 3 == 0 or frame_idx == total_frames - 1:
+                    progress = int((frame_idx + 1) / total_frames * 85)
+                    message = f"{frame_message} ({frame_idx + 1}/{total_frames})"
+                    self.processing_signals.progress_update.emit(progress, message)
+                    self.processing_signals.frame_update.emit(processed_frame)
+        finally:
+            # Cleanup (also finishes a partial file if an effect failed)
+            cap.release()
+            out.release()
         self.current_frame_idx = 0
     
     def _process_full_video_thread(self, output_path):
@@ -2683,6 +3340,7 @@ class SoundReactiveGUI(QMainWindow):
                     # For folder mode, use first image path for processor initialization
                     # (processor only needs audio duration, we handle images separately)
                     image_path = self.image_path if self.mode == "image" else self.image_list[0]
+                    from image_to_video import ImageToVideoProcessor
                     processor = ImageToVideoProcessor(
                         image_path, self.audio_path, fps=self.fps,
                         width=self.width, height=self.height
@@ -2748,13 +3406,32 @@ class SoundReactiveGUI(QMainWindow):
         try:
             self.processing_signals.progress_update.emit(10, self._get_random_message('webcam_starting'))
             
-            self.webcam_cap = cv2.VideoCapture(0)
+            if sys.platform == 'darwin':
+                backend = cv2.CAP_AVFOUNDATION
+            elif sys.platform == 'win32':
+                backend = cv2.CAP_DSHOW
+            else:
+                backend = cv2.CAP_ANY
+            self.webcam_cap = cv2.VideoCapture(0, backend)
             if not self.webcam_cap.isOpened():
                 QMessageBox.critical(self, "Error", "Could not open webcam. Please check if it's available.")
                 self.processing_signals.progress_update.emit(0, "Webcam not available")
                 return
             
-            # Get webcam properties
+            # Ask for MJPEG so the camera sends compressed frames instead of raw
+            # YUY2, which otherwise saturates USB bandwidth and caps the frame rate.
+            # Cameras that don't support it just keep their default format.
+            self.webcam_cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+            # Keep at most one frame in the driver queue so reads return the newest
+            # frame; backends that ignore this get stale frames drained by the worker
+            buffer_bounded = (self.webcam_cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+                              and self.webcam_cap.get(cv2.CAP_PROP_BUFFERSIZE) == 1)
+            resolution = self.webcam_resolution_combo.currentData()
+            if resolution:
+                self.webcam_cap.set(cv2.CAP_PROP_FRAME_WIDTH, resolution[0])
+                self.webcam_cap.set(cv2.CAP_PROP_FRAME_HEIGHT, resolution[1])
+            
+            # Get webcam properties (what the camera actually agreed to)
             self.width = int(self.webcam_cap.get(cv2.CAP_PROP_FRAME_WIDTH))
             self.height = int(self.webcam_cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
             self.fps = self.webcam_cap.get(cv2.CAP_PROP_FPS)
@@ -2762,6 +3439,7 @@ class SoundReactiveGUI(QMainWindow):
                 self.fps = 30.0  # Default if webcam doesn't report FPS
             
             self.start_webcam_btn.setEnabled(False)
+            self.webcam_resolution_combo.setEnabled(False)
             self.stop_webcam_btn.setEnabled(True)
             self.record_webcam_btn.setEnabled(True)
             
@@ -2774,8 +3452,11 @@ class SoundReactiveGUI(QMainWindow):
             self.processing_signals.progress_update.emit(100, status_msg)
             
             # Start webcam capture thread
-            self.webcam_thread = threading.Thread(target=self._webcam_capture_loop, daemon=True)
-            self.webcam_thread.start()
+            self.webcam_worker = WebcamWorker(self, self.webcam_cap, self.width, self.height,
+                                              drain_stale=not buffer_bounded)
+            self.webcam_worker.frame_ready.connect(self._on_webcam_frame)
+            self._update_webcam_effects()
+            self.webcam_worker.start()
             
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to start webcam: {str(e)}")
@@ -2789,11 +3470,18 @@ class SoundReactiveGUI(QMainWindow):
         # Stop audio playback
         self._stop_audio_playback()
         
+        # Let the capture loop finish its current frame before the camera goes away
+        if self.webcam_worker:
+            self.webcam_worker.stop()
+            self.webcam_worker.wait()
+            self.webcam_worker = None
+        
         if self.webcam_cap:
             self.webcam_cap.release()
             self.webcam_cap = None
         
         self.start_webcam_btn.setEnabled(True)
+        self.webcam_resolution_combo.setEnabled(True)
         self.stop_webcam_btn.setEnabled(False)
         self.record_webcam_btn.setEnabled(False)
         
@@ -2803,7 +3491,7 @@ class SoundReactiveGUI(QMainWindow):
         
         self.current_frame = None
         self.update_preview()
-        self.status_label.setText("Webcam stopped")
+        self._set_status("Webcam stopped")
     
     def _start_audio_playback(self):
         """Start audio playback for webcam recording"""
@@ -2832,6 +3520,7 @@ class SoundReactiveGUI(QMainWindow):
             
             # Start playback
             self.audio_player.play()
+            self._audio_t0 = time.monotonic()
             
         except Exception as e:
             print(f"Error starting audio playback: {e}")
@@ -2839,6 +3528,7 @@ class SoundReactiveGUI(QMainWindow):
     
     def _stop_audio_playback(self):
         """Stop audio playback"""
+        self._audio_t0 = None
         if self.audio_player:
             self.audio_player.stop()
         
@@ -2867,6 +3557,16 @@ class SoundReactiveGUI(QMainWindow):
             
             self.audio_time_label.setText(f"{current_min}:{current_sec:02d} / {total_min}:{total_sec:02d}")
             
+            # Re-anchor the local audio clock when it drifts from the player
+            # (startup latency, loop restarts)
+            if self._audio_t0 is not None:
+                now = time.monotonic()
+                expected_ms = (now - self._audio_t0) * 1000.0 % self.audio_player.duration()
+                drift_ms = abs(expected_ms - position)
+                drift_ms = min(drift_ms, self.audio_player.duration() - drift_ms)
+                if drift_ms > AUDIO_RESYNC_MS:
+                    self._audio_t0 = now - position / 1000.0
+            
             # Detect loop (position resets to near 0)
             if position < 100 and self.audio_loop_count > 0:
                 # This might be a new loop, but we'll detect it in status changed
@@ -2924,18 +3624,28 @@ class SoundReactiveGUI(QMainWindow):
                 QMessageBox.critical(self, "Error", "Could not initialize video writer")
                 return
             
+            # Encode on a separate thread fed by a bounded queue of preallocated
+            # frames, so the capture/preview loop never waits on the encoder
+            self._rec_queue = queue.Queue()
+            self._rec_free = queue.Queue()
+            for _ in range(RECORDING_QUEUE_SIZE):
+                self._rec_free.put(np.empty((self.height, self.width, 3), dtype=np.uint8))
+            self._rec_thread = threading.Thread(target=self._recording_drain, daemon=True)
+            self._rec_thread.start()
+            
             self.is_recording = True
             self.record_webcam_btn.setText("Stop Recording")
             self.recording_output_path = output_path
             self.recording_start_time = time.time()
             self.recording_frame_count = 0
+            self.recording_status_message = self._get_random_message('webcam_recording')
             
             # Start audio playback if audio is loaded
             if self.audio_path and os.path.exists(self.audio_path):
                 self._start_audio_playback()
-                message = f"{self._get_random_message('webcam_recording')} - Audio playing - {os.path.basename(output_path)}"
+                message = f"{self.recording_status_message} - Audio playing - {os.path.basename(output_path)}"
             else:
-                message = f"{self._get_random_message('webcam_recording')} - No audio (effects disabled) - {os.path.basename(output_path)}"
+                message = f"{self.recording_status_message} - No audio (effects disabled) - {os.path.basename(output_path)}"
             
             self.processing_signals.progress_update.emit(0, message)
         else:
@@ -2945,6 +3655,12 @@ class SoundReactiveGUI(QMainWindow):
             # Stop audio playback first
             self._stop_audio_playback()
             
+            # Let the encoder drain the queued frames
+            if self._rec_thread:
+                self._rec_queue.put(None)
+                self._rec_thread.join()
+                self._rec_thread = None
+            
             # Release video writer and ensure file is finalized
             if self.recording_writer:
                 self.recording_writer.release()
@@ -2979,64 +3695,86 @@ class SoundReactiveGUI(QMainWindow):
                     self.processing_signals.progress_update.emit(100, f"Recording saved: {os.path.basename(self.recording_output_path)}")
                     QMessageBox.information(self, "Success", f"Recording saved!\n{self.recording_output_path}")
     
-    def _webcam_capture_loop(self):
-        """Webcam capture loop running in background thread"""
-        import time
+    def _on_webcam_frame(self, idx):
+        """Show a webcam slot published by WebcamWorker"""
+        worker = self.webcam_worker
+        if worker is None:
+            return
+        with worker.lock:
+            # Queued signals can lag behind the worker; only the newest slot is safe to read
+            if idx == worker.latest_idx:
+                self._show_preview_frame(worker.buffers[idx])
+        if self.current_frame is None:
+            # Effect parameters need a frame; later ones are copied per preview render
+            self._snapshot_webcam_frame()
+        self._update_webcam_effects()
+    
+    def _snapshot_webcam_frame(self):
+        """
+        Copy the newest raw webcam frame into current_frame
         
-        webcam_start_time = time.time()
+        Taken on demand (first frame, preview renders) rather than per
+        capture; the copy also keeps the preview caches, which key on frame
+        identity, from seeing a buffer the worker is still writing.
+        """
+        worker = self.webcam_worker
+        if worker is None:
+            return
+        with worker.lock:
+            if worker.latest_idx >= 0:
+                self.current_frame = worker.raw_frame.copy()
+    
+    def _update_webcam_effects(self):
+        """
+        Send WebcamWorker the effect parameters for the current audio time
         
-        while self.webcam_cap and self.webcam_cap.isOpened():
-            ret, frame = self.webcam_cap.read()
-            if not ret:
+        Runs on the GUI thread once per published frame, so widgets and the
+        effect smoothing state are only ever touched here.
+        """
+        worker = self.webcam_worker
+        if worker is None:
+            return
+        if self.energy_curves is None or not self.audio_duration:
+            worker.set_effect_kwargs(None)
+            return
+        
+        # Follow the audio clock while playback runs (kept in sync with the
+        # player by _on_audio_position_changed). Otherwise use elapsed time
+        if self._audio_t0 is not None:
+            current_time = (time.monotonic() - self._audio_t0) % self.audio_duration
+        else:
+            current_time = (time.time() - worker.start_time) % self.audio_duration
+        
+        # Update frame index for effect calculation
+        self.current_frame_idx = int(current_time * self.fps)
+        worker.set_effect_kwargs(self._effect_kwargs())
+    
+    def _queue_recording_frame(self, frame):
+        """
+        Queue a copy of frame for the recording thread
+        
+        Returns False (frame dropped) when all preallocated frames are still
+        waiting for the encoder.
+        """
+        try:
+            buf = self._rec_free.get_nowait()
+        except queue.Empty:
+            return False
+        if buf.shape != frame.shape:
+            buf = frame.copy()
+        else:
+            np.copyto(buf, frame)
+        self._rec_queue.put(buf)
+        return True
+    
+    def _recording_drain(self):
+        """Recording thread: write queued frames until the None sentinel"""
+        while True:
+            frame = self._rec_queue.get()
+            if frame is None:
                 break
-            
-            # Update current frame
-            self.current_frame = frame
-            
-            # Apply effects if audio is loaded and analyzed
-            if self.energy_curves is not None and self.audio_duration:
-                # Calculate current time based on audio player position if available
-                # Otherwise use elapsed time
-                if self.audio_player and self.audio_player.duration() > 0:
-                    # Use actual audio playback position for perfect sync
-                    audio_pos_ms = self.audio_player.position()
-                    current_time = (audio_pos_ms / 1000.0) % self.audio_duration
-                else:
-                    # Fallback: calculate from elapsed time
-                    elapsed = time.time() - webcam_start_time
-                    current_time = elapsed % self.audio_duration
-                
-                # Update frame index for effect calculation
-                self.current_frame_idx = int(current_time * self.fps)
-                
-                # Apply effects
-                try:
-                    processed_frame = self.apply_effects_to_frame(frame.copy())
-                except Exception as e:
-                    # If effects fail, use original frame
-                    processed_frame = frame.copy()
-            else:
-                # No audio or effects - just show webcam feed
-                processed_frame = frame.copy()
-            
-            # Update preview (thread-safe)
-            self.processing_signals.frame_update.emit(processed_frame)
-            
-            # Write to recording if active
-            if self.is_recording and self.recording_writer:
-                self.recording_writer.write(processed_frame)
-                self.recording_frame_count += 1
-                
-                # Update status with recording info
-                if self.recording_frame_count % 30 == 0:  # Every second
-                    duration = self.recording_frame_count / self.fps
-                    message = f"{self._get_random_message('webcam_recording')} - {duration:.1f}s"
-                    QTimer.singleShot(0, lambda m=message: self.processing_signals.progress_update.emit(
-                        int((duration / 60) * 100) if duration < 60 else 99, m
-                    ))
-            
-            # Control frame rate (roughly)
-            time.sleep(max(0.001, 1.0 / self.fps - 0.01))  # Small buffer for processing time
+            self.recording_writer.write(frame)
+            self._rec_free.put(frame)
     
     def _merge_audio_video(self, video_path, audio_path, output_path):
         """Merge audio and video using ffmpeg"""
@@ -3054,9 +3792,8 @@ class SoundReactiveGUI(QMainWindow):
                 raise FileNotFoundError(f"Audio file not found: {audio_path}")
             
             # First, get audio duration
-            import librosa
-            y, sr = librosa.load(audio_path, sr=None)
-            audio_duration = len(y) / sr
+            from audio_analysis import get_audio_info
+            audio_duration, _ = get_audio_info(audio_path)
             
             print(f"Merging audio: video={video_duration:.2f}s, audio={audio_duration:.2f}s")
             
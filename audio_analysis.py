@@ -4,11 +4,272 @@ Detects bass drum hits and high-pitched frequencies in audio
 Enhanced with multi-band analysis and intensity-based reactivity
 """
 
+import functools
+import hashlib
+import os
+import pickle
+import tempfile
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
-import librosa
-from scipy import signal
+import soundfile as sf
+from numba import njit, prange
+from scipy import fft, signal
 from typing import Dict, Tuple, Optional
 
+try:
+    # Optional: FFTW's SIMD codelets beat pocketfft on the fixed-size STFT
+    import pyfftw
+    import pyfftw.interfaces.scipy_fft as fftw_fft
+except ImportError:
+    pyfftw = None
+
+
+# Target size of one streamed STFT block (keeps analysis memory bounded on long files)
+STFT_BLOCK_BYTES = 64 * 1024 * 1024
+
+# Energy curves longer than this use a histogram for the peak threshold
+HISTOGRAM_PERCENTILE_MIN_LEN = 50000
+
+# Bands returned by analyze_multiple_bands / analyze_enhanced
+DISPLAY_BANDS = ('sub_bass', 'bass', 'mid', 'treble', 'high_treble')
+
+# Analysis cache: bump CACHE_VERSION whenever the analysis output changes
+CACHE_VERSION = 4
+# In-memory sources are hashed in chunks of this size
+CACHE_HASH_CHUNK_BYTES = 1024 * 1024
+
+
+def get_cache_dir() -> str:
+    """Directory for cached analysis results (respects XDG_CACHE_HOME)"""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'audioreactive')
+
+
+_fftw_wisdom_loaded = False
+# Wisdom as last read from or written to disk; saving is skipped while unchanged
+_fftw_wisdom_on_disk = None
+
+
+def get_audio_info(audio_path: str) -> Tuple[float, int]:
+    """
+    Get duration and native sample rate of an audio file without decoding it
+    
+    Args:
+        audio_path: Path to audio file
+        
+    Returns:
+        Tuple of (duration_seconds, sample_rate)
+    """
+    try:
+        info = sf.info(audio_path)
+        return info.frames / info.samplerate, info.samplerate
+    except RuntimeError:
+        # libsndfile can't read this container - decode with librosa instead
+        import librosa
+        y, sr = librosa.load(audio_path, sr=None)
+        return len(y) / sr, sr
+
+
+def _fftw_wisdom_path() -> str:
+    return os.path.join(get_cache_dir(), 'fftw_wisdom')
+
+
+def _load_fftw_wisdom():
+    """Configure pyFFTW and import persisted plans (once per process)"""
+    global _fftw_wisdom_loaded, _fftw_wisdom_on_disk
+    if _fftw_wisdom_loaded:
+        return
+    _fftw_wisdom_loaded = True
+    
+    pyfftw.interfaces.cache.enable()
+    # Keep cached FFTW objects alive across analyses in the same process
+    # (batch CLI runs, repeated GUI analyses) rather than the 0.1s default
+    pyfftw.interfaces.cache.set_keepalive_time(60)
+    pyfftw.config.NUM_THREADS = os.cpu_count() or 1
+    pyfftw.config.PLANNER_EFFORT = 'FFTW_MEASURE'
+    try:
+        with open(_fftw_wisdom_path(), 'rb') as f:
+            pyfftw.import_wisdom(pickle.load(f))
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        pass
+    _fftw_wisdom_on_disk = pyfftw.export_wisdom()
+
+
+def _save_fftw_wisdom():
+    """
+    Persist FFTW plans so later runs skip the planning cost
+    
+    Only writes when new plans were made since the wisdom was loaded or last
+    saved. The file is written under a temporary name and renamed into place,
+    so concurrent analysis processes never leave a truncated file behind.
+    """
+    global _fftw_wisdom_on_disk
+    wisdom = pyfftw.export_wisdom()
+    if wisdom == _fftw_wisdom_on_disk:
+        return
+    try:
+        cache_dir = get_cache_dir()
+        os.makedirs(cache_dir, exist_ok=True)
+        with tempfile.NamedTemporaryFile('wb', dir=cache_dir, prefix='fftw_wisdom.', delete=False) as f:
+            pickle.dump(wisdom, f)
+        try:
+            os.replace(f.name, _fftw_wisdom_path())
+        except OSError:
+            os.unlink(f.name)
+            raise
+        _fftw_wisdom_on_disk = wisdom
+    except OSError as e:
+        print(f"Warning: could not save FFTW wisdom: {e}")
+
+
+def _rfft_frames(frames: np.ndarray, n_fft: int) -> np.ndarray:
+    """Real FFT along axis 1 using pyFFTW when installed, else scipy's pocketfft"""
+    if pyfftw is not None:
+        _load_fftw_wisdom()
+        return fftw_fft.rfft(frames, n=n_fft, axis=1, workers=pyfftw.config.NUM_THREADS)
+    return fft.rfft(frames, n=n_fft, axis=1, workers=-1)
+
+
+@njit(cache=True)
+def _find_peaks(energy, threshold, min_distance):
+    """
+    scipy.signal.find_peaks(energy, height=threshold, distance=min_distance)
+    
+    Local maxima (plateaus report their midpoint) at or above threshold are
+    visited tallest first; each kept peak suppresses the remaining peaks
+    closer than min_distance on either side, as scipy's
+    _select_by_peak_distance does. Only the order among exactly equal
+    heights is left to argsort, as it is in scipy.
+    """
+    n = len(energy)
+    peaks = np.empty(n, dtype=np.int64)
+    n_peaks = 0
+    i = 1
+    while i < n - 1:
+        if energy[i - 1] < energy[i]:
+            i_ahead = i + 1
+            while i_ahead < n - 1 and energy[i_ahead] == energy[i]:
+                i_ahead += 1
+            if energy[i_ahead] < energy[i]:
+                mid = (i + i_ahead - 1) // 2
+                if energy[mid] >= threshold:
+                    peaks[n_peaks] = mid
+                    n_peaks += 1
+                i = i_ahead
+        i += 1
+    peaks = peaks[:n_peaks]
+    
+    distance = int(np.ceil(min_distance))
+    if distance <= 1 or n_peaks < 2:
+        return peaks
+    keep = np.ones(n_peaks, dtype=np.bool_)
+    order = np.argsort(energy[peaks])
+    for r in range(n_peaks - 1, -1, -1):
+        j = order[r]
+        if not keep[j]:
+            continue
+        k = j - 1
+        while k >= 0 and peaks[j] - peaks[k] < distance:
+            keep[k] = False
+            k -= 1
+        k = j + 1
+        while k < n_peaks and peaks[k] - peaks[j] < distance:
+            keep[k] = False
+            k += 1
+    return peaks[keep]
+
+
+@njit(cache=True, parallel=True, fastmath=True)
+def _normalize_rows(energies, out):
+    """
+    Min/max normalize each row of a (n_bands, n_frames) matrix to 0.0-1.0
+    (out may alias energies); rows are processed in parallel
+    """
+    n_bands, n_frames = energies.shape
+    for i in prange(n_bands):
+        mn = energies[i, 0]
+        mx = energies[i, 0]
+        for j in range(1, n_frames):
+            v = energies[i, j]
+            if v < mn:
+                mn = v
+            elif v > mx:
+                mx = v
+        rng = mx - mn
+        if rng < 1e-8:
+            # If no variation, zeros
+            for j in range(n_frames):
+                out[i, j] = 0.0
+        else:
+            inv = 1.0 / rng
+            for j in range(n_frames):
+                out[i, j] = (energies[i, j] - mn) * inv
+
+
+@functools.lru_cache(maxsize=8)
+def _hann(n_fft):
+    """Periodic Hann window, built once per size and shared (read-only)"""
+    win = signal.windows.hann(n_fft, sym=False).astype(np.float32)
+    win.setflags(write=False)
+    return win
+
+
+@functools.lru_cache(maxsize=8)
+def _band_bins(sr, n_fft, bands_tuple):
+    """
+    [lo, hi) FFT bin ranges for each band - depends only on (sr, n_fft, bands),
+    so it is shared across analyzers and files
+    """
+    freqs = np.fft.rfftfreq(n_fft, 1.0 / sr)
+    fmins = np.array([fmin for fmin, _ in bands_tuple], dtype=np.float64)
+    fmaxs = np.array([fmax for _, fmax in bands_tuple], dtype=np.float64)
+    lo = np.searchsorted(freqs, fmins, side='left').astype(np.int64)
+    hi = np.searchsorted(freqs, fmaxs, side='right').astype(np.int64)
+    # Shared between callers, so guard against in-place modification
+    lo.setflags(write=False)
+    hi.setflags(write=False)
+    return lo, hi
+
+
+@functools.lru_cache(maxsize=8)
+def _band_matrix(sr, n_fft, bands_tuple):
+    """Band indicator matrix built from _band_bins (read-only, shared)"""
+    lo, hi = _band_bins(sr, n_fft, bands_tuple)
+    W = np.zeros((len(bands_tuple), n_fft // 2 + 1), dtype=np.float32)
+    for i in range(len(bands_tuple)):
+        W[i, lo[i]:hi[i]] = 1.0
+    W.setflags(write=False)
+    return W
+
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def _band_power(D, lo, hi):
+    """
+    Fused |z|^2 + band sum over an rfft block D shaped (k_frames, n_bins)
+    
+    Returns (n_bands, k_frames) energies without materializing the power block
+    """
+    n_frames = D.shape[0]
+    n_bands = lo.shape[0]
+    out = np.zeros((n_bands, n_frames), dtype=np.float32)
+    for f in range(n_frames):
+        for b in range(n_bands):
+            acc = np.float32(0.0)
+            for k in range(lo[b], hi[b]):
+                z = D[f, k]
+                acc += z.real * z.real + z.imag * z.imag
+            out[b, f] = acc
+    return out
+
+
+def _analyze_file(audio_path, sr=22050, **analyze_kwargs):
+    """Process-pool worker for AudioAnalyzer.analyze_batch"""
+    analyzer = AudioAnalyzer(audio_path, sr=sr)
+    energy_curves, times = analyzer.analyze_enhanced(**analyze_kwargs)
+    return audio_path, energy_curves, times
+
 
 class AudioAnalyzer:
     """
@@ -21,7 +282,8 @@ class AudioAnalyzer:
         Initialize audio analyzer
         
         Args:
-            audio_path: Path to audio file
+            audio_path: Path to audio file, or a file-like object (e.g. BytesIO)
+                holding an encoded audio file
             sr: Sample rate (default 22050 Hz)
         """
         self.audio_path = audio_path
@@ -31,37 +293,143 @@ class AudioAnalyzer:
         self.times = None
         self.hop_length = None
         self.n_fft = None
+        self.freqs = None
         
         # Legacy peak detection (for backward compatibility)
         self.bass_frames = None
         self.treble_frames = None
         
-        # Enhanced: Energy curves for all frequency bands
+        # Enhanced: Energy curves for all frequency bands. Multi-band analysis
+        # keeps them as rows of one (n_bands, n_frames) matrix; the dict values
+        # are views into those rows.
         self.energy_curves = {}
+        self._energy_matrix = None
+        self._band_index = {}
         
     def load_audio(self):
-        """Load audio file"""
-        print(f"Loading audio from {self.audio_path}...")
-        self.y, self.sr = librosa.load(self.audio_path, sr=self.sr)
+        """
+        Load audio file at its native rate and resample only if needed
+
+        Uses soundfile for decoding and a polyphase resampler instead of
+        librosa's kaiser resampler. Formats libsndfile cannot decode
+        (e.g. m4a/aac) fall back to librosa.
+        """
+        print(f"Loading audio from {self._source_name()}...")
+        if hasattr(self.audio_path, 'seek'):
+            self.audio_path.seek(0)
+        try:
+            y, sr_native = sf.read(self.audio_path, dtype='float32', always_2d=False)
+        except RuntimeError:
+            # libsndfile can't decode this container - let librosa/audioread decode
+            # it at its native rate; resampling (if any) happens once below
+            import librosa
+            y, sr_native = librosa.load(self.audio_path, sr=None)
+
+        # Collapse to mono
+        if y.ndim > 1:
+            y = y.mean(axis=1, dtype=np.float32)
+
+        if self.sr and self.sr != sr_native:
+            y = signal.resample_poly(y, self.sr, sr_native).astype(np.float32, copy=False)
+        else:
+            self.sr = sr_native
+
+        self.y = y
         print(f"Audio loaded: {len(self.y)} samples at {self.sr} Hz")
         
-    def compute_spectrogram(self, n_fft=2048, hop_length=512):
+    def setup_stft(self, n_fft=2048, hop_length=512):
         """
-        Compute STFT spectrogram
+        Set STFT parameters, frequency bins and frame times without
+        materializing the spectrogram (see iter_power_blocks)
         
         Args:
             n_fft: FFT window size
             hop_length: Number of samples between successive frames
         """
-        print("Computing spectrogram...")
-        D = librosa.stft(self.y, n_fft=n_fft, hop_length=hop_length)
-        self.S = np.abs(D)
+        self.S = None
         self.hop_length = hop_length
         self.n_fft = n_fft
-        self.times = librosa.frames_to_time(
-            np.arange(self.S.shape[1]), sr=self.sr, hop_length=hop_length
-        )
+        self.freqs = np.fft.rfftfreq(n_fft, 1.0 / self.sr)
+        n_frames = 1 + len(self.y) // hop_length
+        self.times = np.arange(n_frames, dtype=np.float32) * np.float32(hop_length / self.sr)
+    
+    def _iter_stft_blocks(self, block_frames: Optional[int] = None):
+        """
+        Stream the complex STFT in blocks of consecutive frames
+        
+        Yields:
+            Tuple of (start_frame, D) with D shaped (k, n_bins), complex64
+        """
+        n_fft = self.n_fft
+        if block_frames is None:
+            block_frames = max(1, STFT_BLOCK_BYTES // (n_fft * 8))
+        
+        # Real-input FFT over strided frames (centered like librosa.stft)
+        win = _hann(n_fft)
+        y_padded = np.pad(self.y, n_fft // 2)
+        frames = np.lib.stride_tricks.sliding_window_view(y_padded, n_fft)[::self.hop_length]
+        
+        for start in range(0, len(frames), block_frames):
+            D = _rfft_frames(frames[start:start + block_frames] * win, n_fft)
+            yield start, D.astype(np.complex64, copy=False)
+        
+        if pyfftw is not None:
+            _save_fftw_wisdom()
+    
+    def iter_power_blocks(self, block_frames: Optional[int] = None):
+        """
+        Stream the STFT power spectrogram in blocks of consecutive frames
+        
+        Args:
+            block_frames: Frames per block (default sized to ~STFT_BLOCK_BYTES)
+            
+        Yields:
+            Tuple of (start_frame, power_block) with power_block shaped (n_bins, k)
+        """
+        for start, D in self._iter_stft_blocks(block_frames):
+            # Power (|z|^2) rather than magnitude - skips a sqrt per bin, and the
+            # band sums are normalized to 0.0-1.0 afterwards anyway
+            yield start, (np.square(D.real) + np.square(D.imag)).T.astype(np.float32, copy=False)
+    
+    def compute_spectrogram(self, n_fft=2048, hop_length=512):
+        """
+        Compute STFT power spectrogram
+        
+        Args:
+            n_fft: FFT window size
+            hop_length: Number of samples between successive frames
+        """
+        print("Computing spectrogram...")
+        self.setup_stft(n_fft, hop_length)
+        self.S = np.empty((len(self.freqs), len(self.times)), dtype=np.float32)
+        for start, block in self.iter_power_blocks():
+            self.S[:, start:start + block.shape[1]] = block
         print(f"Spectrogram shape: {self.S.shape}")
+    
+    def compute_band_energies(self, band_ranges) -> np.ndarray:
+        """
+        Compute raw energy rows for several frequency ranges at once
+        
+        Uses the full spectrogram if it was computed, otherwise streams STFT
+        blocks through a compiled kernel that fuses the power computation with
+        the band sums, so neither the spectrogram nor a power block is ever
+        materialized.
+        
+        Args:
+            band_ranges: Sequence of (min_freq, max_freq) tuples in Hz
+            
+        Returns:
+            Array of shape (n_bands, n_frames)
+        """
+        if self.S is not None:
+            return self._band_weight_matrix(band_ranges) @ self.S
+        
+        bands_tuple = tuple((float(fmin), float(fmax)) for fmin, fmax in band_ranges)
+        lo, hi = _band_bins(self.sr, self.n_fft, bands_tuple)
+        energies = np.empty((len(band_ranges), len(self.times)), dtype=np.float32)
+        for start, D in self._iter_stft_blocks():
+            energies[:, start:start + D.shape[0]] = _band_power(D, lo, hi)
+        return energies
         
     def extract_frequency_band_energy(self, freq_range: Tuple[float, float]) -> np.ndarray:
         """
@@ -75,37 +443,55 @@ class AudioAnalyzer:
         """
         fmin, fmax = freq_range
         
-        # FIX: Get frequency bins directly in Hz (not mel-scale)
-        freqs = librosa.fft_frequencies(sr=self.sr, n_fft=self.n_fft)
-        
-        # Create mask for frequency range (direct Hz comparison)
-        freq_mask = (freqs >= fmin) & (freqs <= fmax)
+        # Bins are sorted, so the band is a contiguous slice [lo, hi)
+        lo = np.searchsorted(self.freqs, fmin, side='left')
+        hi = np.searchsorted(self.freqs, fmax, side='right')
         
-        # Sum energy across frequency bins in this range
-        energy = np.sum(self.S[freq_mask, :], axis=0)
+        # Sum power across frequency bins in this range
+        energy = self.S[lo:hi, :].sum(axis=0, dtype=np.float32)
         
         return energy
     
-    def normalize_energy(self, energy: np.ndarray) -> np.ndarray:
+    def _band_weight_matrix(self, band_ranges) -> np.ndarray:
+        """
+        Get the (n_bands, n_bins) 0/1 indicator matrix for the given ranges
+        
+        Args:
+            band_ranges: Sequence of (min_freq, max_freq) tuples in Hz
+            
+        Returns:
+            Read-only weight matrix so that W @ S yields one energy row per band
+        """
+        bands_tuple = tuple((float(fmin), float(fmax)) for fmin, fmax in band_ranges)
+        return _band_matrix(self.sr, self.n_fft, bands_tuple)
+    
+    def normalize_energy(self, energy: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Normalize energy curve to 0.0-1.0 range
         
         Args:
             energy: Raw energy values
+            out: Optional float32 buffer to write into (may be energy itself)
             
         Returns:
             Normalized energy curve
         """
+        energy = np.asarray(energy, dtype=np.float32)
         energy_min = np.min(energy)
         energy_max = np.max(energy)
         energy_range = energy_max - energy_min
         
+        if out is None:
+            out = np.empty_like(energy)
+        
         if energy_range < 1e-8:
             # If no variation, return zeros
-            return np.zeros_like(energy)
+            out.fill(0.0)
+            return out
         
-        # Normalize to 0.0-1.0
-        normalized = (energy - energy_min) / energy_range
+        # Normalize to 0.0-1.0 in place on a single output buffer
+        normalized = np.subtract(energy, energy_min, out=out)
+        normalized *= np.float32(1.0 / energy_range)
         
         return normalized
     
@@ -122,9 +508,21 @@ class AudioAnalyzer:
         Returns:
             Array of frame indices where peaks occur
         """
-        threshold = np.percentile(energy, threshold_percentile)
-        peaks, _ = signal.find_peaks(energy, height=threshold, distance=min_distance)
-        return peaks
+        if len(energy) == 0:
+            return np.array([], dtype=np.int64)
+        
+        if len(energy) > HISTOGRAM_PERCENTILE_MIN_LEN:
+            # Long curves: energy is bounded to 0.0-1.0, so a histogram CDF
+            # lookup gives the threshold in one linear pass
+            hist, edges = np.histogram(energy, bins=1024, range=(0.0, 1.0))
+            cdf = np.cumsum(hist)
+            k = int(cdf[-1] * threshold_percentile / 100.0)
+            threshold = edges[min(np.searchsorted(cdf, k), len(edges) - 1)]
+        else:
+            # O(N) selection instead of the full sort np.percentile does
+            k = min(int(len(energy) * threshold_percentile / 100.0), len(energy) - 1)
+            threshold = np.partition(energy, k)[k]
+        return _find_peaks(energy, threshold, min_distance)
     
     def detect_bass_drums(self, bass_freq_range=(40, 100), threshold_percentile=75):
         """
@@ -207,24 +605,48 @@ class AudioAnalyzer:
         """
         print("Analyzing multiple frequency bands...")
         
+        # Display bands, plus a narrower snare band inside the mid range
+        # (200-500 Hz is typical snare range) used only for hit detection
         bands = {
             'sub_bass': sub_bass_range,
             'bass': bass_range,
             'mid': mid_range,
             'treble': treble_range,
-            'high_treble': high_treble_range
+            'high_treble': high_treble_range,
+            'snare': (200, 500)
         }
         
+        # Bands that also get peak detection: (threshold_percentile, min_distance)
+        peak_bands = {
+            'bass': (75, 10),
+            'snare': (70, 8)
+        }
+        
+        # One GEMM per spectrogram block for every band instead of a separate
+        # reduction per band
+        band_energies = self.compute_band_energies(list(bands.values()))
+        if not band_energies.flags.writeable:
+            band_energies = band_energies.copy()
+        
+        # Normalize every band in place; curves live as rows of one matrix
+        if band_energies.shape[1] > 0:
+            _normalize_rows(band_energies, band_energies)
+        self._set_energy_matrix(band_energies, list(bands.keys()))
+        
         energy_curves = {}
+        peaks = {}
         
-        for band_name, freq_range in bands.items():
-            print(f"  Processing {band_name} band ({freq_range[0]}-{freq_range[1]} Hz)...")
+        for i, (band_name, freq_range) in enumerate(bands.items()):
+            normalized = band_energies[i]
             
-            # Extract energy
-            energy = self.extract_frequency_band_energy(freq_range)
+            if band_name in peak_bands:
+                threshold_percentile, min_distance = peak_bands[band_name]
+                peaks[band_name] = self.detect_peaks(normalized, threshold_percentile, min_distance)
             
-            # Normalize
-            normalized = self.normalize_energy(energy)
+            if band_name not in DISPLAY_BANDS:
+                continue
+            
+            print(f"  Processing {band_name} band ({freq_range[0]}-{freq_range[1]} Hz)...")
             
             # Store
             energy_curves[band_name] = normalized
@@ -234,20 +656,10 @@ class AudioAnalyzer:
             max_energy = np.max(normalized)
             print(f"    Mean energy: {mean_energy:.3f}, Max energy: {max_energy:.3f}")
         
-        # Store for later use
-        self.energy_curves.update(energy_curves)
-        
-        # Detect beats (peaks) in bass energy for beat-triggered effects
-        bass_energy = energy_curves.get('bass', np.zeros(len(self.times)))
-        bass_peaks = self.detect_peaks(bass_energy, threshold_percentile=75, min_distance=10)
+        # Beat frames for beat-triggered effects, snare frames for snare-triggered ones
+        bass_peaks = peaks['bass']
+        snare_peaks = peaks['snare']
         self.bass_beat_frames = bass_peaks  # Store beat frame indices
-        
-        # Detect snare hits in mid-range (200-500 Hz is typical snare range)
-        # Use a narrower range within mid for better snare detection
-        snare_freq_range = (200, 500)
-        snare_energy = self.extract_frequency_band_energy(snare_freq_range)
-        snare_energy_normalized = self.normalize_energy(snare_energy)
-        snare_peaks = self.detect_peaks(snare_energy_normalized, threshold_percentile=70, min_distance=8)
         self.snare_hit_frames = snare_peaks  # Store snare hit frame indices
         
         print(f"Multi-band analysis complete. Energy curves available for: {list(energy_curves.keys())}")
@@ -260,6 +672,29 @@ class AudioAnalyzer:
         """Get time values for each frame"""
         return self.times
     
+    def _set_energy_matrix(self, energy_matrix: np.ndarray, band_names):
+        """
+        Adopt a (n_bands, n_frames) matrix as the backing store for energy curves
+        
+        Args:
+            energy_matrix: One row per band
+            band_names: Band name for each row
+        """
+        self._energy_matrix = energy_matrix
+        self._band_index = {name: i for i, name in enumerate(band_names)}
+        for name, i in self._band_index.items():
+            self.energy_curves[name] = energy_matrix[i]
+    
+    def get_energy_matrix(self) -> Tuple[Optional[np.ndarray], Dict[str, int]]:
+        """
+        Get all multi-band energy curves as one contiguous matrix
+        
+        Returns:
+            Tuple of (energy_matrix, band_index) where energy_matrix has shape
+            (n_bands, n_frames) and band_index maps band names to rows
+        """
+        return self._energy_matrix, self._band_index
+    
     def get_energy_curve(self, band_name: str) -> Optional[np.ndarray]:
         """
         Get stored energy curve for a specific band
@@ -270,6 +705,8 @@ class AudioAnalyzer:
         Returns:
             Normalized energy curve (0.0-1.0) or None if not found
         """
+        if band_name in self._band_index:
+            return self._energy_matrix[self._band_index[band_name]]
         return self.energy_curves.get(band_name)
     
     def analyze(self, bass_freq_range=(40, 100), treble_freq_range=(3000, 8000)):
@@ -292,18 +729,35 @@ class AudioAnalyzer:
         bass_range: Tuple[float, float] = (60, 250),
         mid_range: Tuple[float, float] = (250, 2000),
         treble_range: Tuple[float, float] = (2000, 6000),
-        high_treble_range: Tuple[float, float] = (6000, 12000)
+        high_treble_range: Tuple[float, float] = (6000, 12000),
+        use_cache: bool = True
     ) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
         """
         Enhanced analysis with multiple frequency bands and continuous energy curves
         
+        Args:
+            use_cache: Reuse/store results in the on-disk analysis cache
+        
         Returns:
             Tuple of (energy_curves_dict, frame_times)
             energy_curves_dict: Dictionary with keys: 'sub_bass', 'bass', 'mid', 'treble', 'high_treble'
             Each value is a normalized energy curve (0.0-1.0) with one value per spectrogram frame
         """
-        self.load_audio()
-        self.compute_spectrogram()
+        band_ranges = (sub_bass_range, bass_range, mid_range, treble_range, high_treble_range)
+        n_fft, hop_length = 2048, 512
+        
+        cache_path = None
+        if use_cache:
+            cache_path = self._cache_path(band_ranges, n_fft, hop_length)
+            energy_curves = self._load_cache(cache_path)
+            if energy_curves is not None:
+                print(f"Loaded cached analysis from {cache_path}")
+                return energy_curves, self.times
+        
+        # Reuse audio the caller already loaded instead of decoding it again
+        if self.y is None:
+            self.load_audio()
+        self.setup_stft(n_fft, hop_length)
         
         # Analyze all frequency bands
         energy_curves = self.analyze_multiple_bands(
@@ -314,4 +768,156 @@ class AudioAnalyzer:
             high_treble_range=high_treble_range
         )
         
+        if cache_path is not None:
+            self._save_cache(cache_path)
+        
         return energy_curves, self.times
+    
+    def _cache_path(self, band_ranges, n_fft: int, hop_length: int) -> Optional[str]:
+        """
+        Build the cache file path for this audio file and analysis parameters
+        
+        Files on disk are keyed by absolute path, size and st_mtime_ns, so an
+        edited or replaced file misses without being read; in-memory sources
+        hash their whole content. Every analysis parameter is part of the key.
+        
+        Returns:
+            Path to the .npz cache file, or None if the audio can't be read
+        """
+        h = hashlib.sha1()
+        try:
+            if hasattr(self.audio_path, 'seek'):
+                size = self._hash_file(self.audio_path, h)
+            else:
+                st = os.stat(self.audio_path)
+                size = st.st_size
+                h.update(repr((os.path.abspath(self.audio_path), st.st_mtime_ns)).encode())
+        except OSError:
+            return None
+        
+        params = (CACHE_VERSION, size, self.sr, n_fft, hop_length,
+                  tuple(tuple(float(f) for f in r) for r in band_ranges))
+        h.update(repr(params).encode())
+        return os.path.join(get_cache_dir(), f"{h.hexdigest()}.npz")
+    
+    @staticmethod
+    def _hash_file(f, h) -> int:
+        """
+        Feed the whole content of a seekable binary file into h
+        
+        Returns:
+            Size of the file in bytes
+        """
+        f.seek(0)
+        size = 0
+        while True:
+            chunk = f.read(CACHE_HASH_CHUNK_BYTES)
+            if not chunk:
+                break
+            h.update(chunk)
+            size += len(chunk)
+        f.seek(0)
+        return size
+    
+    def _source_name(self) -> str:
+        """Printable name of the audio source"""
+        if hasattr(self.audio_path, 'read'):
+            return "in-memory audio"
+        return str(self.audio_path)
+    
+    def _load_cache(self, cache_path: Optional[str]) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Populate analysis results from a cache file
+        
+        Returns:
+            Display-band energy curves, or None on a cache miss
+        """
+        if cache_path is None or not os.path.exists(cache_path):
+            return None
+        
+        try:
+            with np.load(cache_path) as data:
+                self.sr = int(data['sr'])
+                self.n_fft = int(data['n_fft'])
+                self.hop_length = int(data['hop_length'])
+                self.times = data['times']
+                self.bass_beat_frames = data['bass_beat_frames']
+                self.snare_hit_frames = data['snare_hit_frames']
+                energy_matrix = data['energy_matrix']
+                band_names = [str(name) for name in data['band_names']]
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile) as e:
+            print(f"Ignoring unreadable analysis cache {cache_path}: {e}")
+            return None
+        
+        self.freqs = np.fft.rfftfreq(self.n_fft, 1.0 / self.sr)
+        self._set_energy_matrix(energy_matrix, band_names)
+        return {name: self.energy_curves[name] for name in DISPLAY_BANDS if name in self._band_index}
+    
+    def _save_cache(self, cache_path: Optional[str]):
+        """Write the current analysis results to the cache file"""
+        if cache_path is None:
+            return
+        
+        try:
+            cache_dir = os.path.dirname(cache_path)
+            os.makedirs(cache_dir, exist_ok=True)
+            # Write to a unique temp file first so an interrupted run or a
+            # concurrent writer never leaves a partial cache behind
+            f = tempfile.NamedTemporaryFile('wb', dir=cache_dir, suffix='.npz', delete=False)
+            try:
+                with f:
+                    np.savez_compressed(
+                        f,
+                        sr=self.sr,
+                        n_fft=self.n_fft,
+                        hop_length=self.hop_length,
+                        times=self.times,
+                        bass_beat_frames=self.bass_beat_frames,
+                        snare_hit_frames=self.snare_hit_frames,
+                        energy_matrix=self._energy_matrix,
+                        band_names=np.array(list(self._band_index.keys()))
+                    )
+                os.replace(f.name, cache_path)
+            except OSError:
+                os.unlink(f.name)
+                raise
+        except OSError as e:
+            print(f"Warning: could not write analysis cache: {e}")
+    
+    @classmethod
+    def analyze_batch(cls, audio_paths, sr=22050, max_workers: Optional[int] = None, **analyze_kwargs):
+        """
+        Run analyze_enhanced on several files in parallel worker processes
+        
+        Args:
+            audio_paths: Iterable of audio file paths
+            sr: Sample rate for every analyzer
+            max_workers: Number of worker processes (default: CPU count)
+            **analyze_kwargs: Passed through to analyze_enhanced (band ranges, use_cache)
+            
+        Returns:
+            List of (audio_path, energy_curves, frame_times) in input order
+        """
+        audio_paths = list(audio_paths)
+        if len(audio_paths) <= 1:
+            return [_analyze_file(path, sr=sr, **analyze_kwargs) for path in audio_paths]
+        
+        worker = functools.partial(_analyze_file, sr=sr, **analyze_kwargs)
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            # map() preserves input order
+            return list(executor.map(worker, audio_paths))
+
+
+if __name__ == '__main__':
+    # Regression check: _find_peaks must pick the same peaks as scipy
+    rng = np.random.default_rng(0)
+    cases = [(np.array([0, 1, 0, 0, 0, 0, 0, 0, 0, 2, 0, 0, 0, 0, 0, 0, 0, 3, 0], dtype=np.float32), 0.0, 10)]
+    for _ in range(200):
+        values = rng.random(1000).astype(np.float32)
+        # Repeats create plateaus; heights stay distinct so ties don't depend on argsort
+        curve = np.repeat(values, rng.integers(1, 4, len(values)))
+        cases.append((curve, float(np.percentile(curve, 75)), float(rng.choice([1, 2.5, 5, 10]))))
+    for curve, threshold, min_distance in cases:
+        expected, _ = signal.find_peaks(curve, height=threshold, distance=min_distance)
+        assert np.array_equal(_find_peaks(curve, threshold, min_distance), expected)
+    print(f"_find_peaks matches scipy.signal.find_peaks on {len(cases)} curves")
@@ -16,28 +16,104 @@ Usage:
 """
 
 import argparse
+import functools
+import io
 import sys
 import os
 from pathlib import Path
-from audio_analysis import AudioAnalyzer
-from video_processor import VideoProcessor
-from image_to_video import ImageToVideoProcessor
 import tempfile
+import multiprocessing
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 
 
-def extract_audio(video_path: str, audio_path: str) -> None:
-    """Extract audio from video using ffmpeg"""
+IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.bmp', '.tiff', '.webp'}
+AUDIO_EXTENSIONS = {'.mp3', '.wav', '.flac', '.ogg', '.m4a', '.aac'}
+
+
+# Seconds run_batch waits for a result before checking that workers are alive
+BATCH_POLL_SECONDS = 1.0
+
+# Parameter checks as (is_valid, error message); the mode-specific list is
+# chosen by --enhanced (batch jobs always use the enhanced parameters)
+_COMMON_VALIDATORS = [
+    (lambda a: a.zoom >= 1.0, "Zoom factor must be >= 1.0"),
+]
+_LEGACY_VALIDATORS = [
+    (lambda a: a.duration > 0, "Effect duration must be > 0"),
+    (lambda a: a.bass_range[0] < a.bass_range[1], "Bass range min must be less than max"),
+    (lambda a: a.treble_range[0] < a.treble_range[1], "Treble range min must be less than max"),
+]
+_ENHANCED_VALIDATORS = [
+    (lambda a: 0.0 <= a.intensity_sensitivity <= 1.0, "Intensity sensitivity must be between 0.0 and 1.0"),
+    (lambda a: 0.0 <= a.smoothness <= 1.0, "Smoothness must be between 0.0 and 1.0"),
+]
+
+
+def enhanced_band_ranges(args: argparse.Namespace) -> dict:
+    """Band range keyword arguments for AudioAnalyzer.analyze_enhanced"""
+    return {
+        'sub_bass_range': tuple(args.sub_bass_range),
+        'bass_range': tuple(args.bass_range_enhanced),
+        'mid_range': tuple(args.mid_range),
+        'treble_range': tuple(args.treble_range_enhanced),
+        'high_treble_range': tuple(args.high_treble_range),
+    }
+
+
+def probe_audio_codec(media_path: str):
+    """Return the codec name of the first audio stream (e.g. 'aac'), or None"""
+    import subprocess
+    
+    cmd = [
+        'ffprobe', '-v', 'error', '-select_streams', 'a:0',
+        '-show_entries', 'stream=codec_name', '-of', 'default=nw=1:nk=1', media_path
+    ]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True)
+    except FileNotFoundError:
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
+
+
+def extract_audio(video_path: str, sr: int, track_path: Optional[str] = None) -> io.BytesIO:
+    """
+    Extract audio from video using ffmpeg
+    
+    The WAV is streamed through ffmpeg's stdout into memory instead of being
+    written to (and read back from) a temp file. ffmpeg also downmixes to mono
+    and resamples to sr, so the analyzer doesn't have to.
+    
+    Args:
+        video_path: Input video file
+        sr: Target sample rate in Hz
+        track_path: If set, the original audio track is also stream-copied here
+            in the same demux pass, so muxing later reads this small file
+            instead of scanning the whole video again
+        
+    Returns:
+        BytesIO holding the extracted WAV
+    """
     import subprocess
     
     print(f"Extracting audio from video...")
+    # -vn: never decode the video stream, only the audio is needed
     cmd = [
-        'ffmpeg', '-i', video_path, '-q:a', '9', '-n', audio_path
+        'ffmpeg', '-i', video_path,
+        '-map', '0:a:0', '-vn', '-ac', '1', '-ar', str(sr), '-f', 'wav', 'pipe:1'
     ]
+    if track_path is not None:
+        # Second output of the same invocation: untouched copy of the audio track
+        cmd += ['-map', '0:a:0', '-vn', '-c:a', 'copy', '-f', 'matroska', '-y', track_path]
     
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    result = subprocess.run(cmd, capture_output=True)
     if result.returncode != 0:
-        print(f"Error extracting audio: {result.stderr}")
+        print(f"Error extracting audio: {result.stderr.decode(errors='replace')}")
         raise RuntimeError("Failed to extract audio")
+    return io.BytesIO(result.stdout)
 
 
 def merge_audio_video(video_path: str, audio_path: str, output_path: str) -> None:
@@ -45,9 +121,11 @@ def merge_audio_video(video_path: str, audio_path: str, output_path: str) -> Non
     import subprocess
     
     print(f"Merging video with original audio...")
+    # Video is stream-copied; audio only needs re-encoding if it isn't AAC already
+    audio_codec = 'copy' if probe_audio_codec(audio_path) == 'aac' else 'aac'
     cmd = [
         'ffmpeg', '-i', video_path, '-i', audio_path,
-        '-c:v', 'copy', '-c:a', 'aac', '-map', '0:v:0', '-map', '1:a:0',
+        '-c:v', 'copy', '-c:a', audio_codec, '-map', '0:v:0', '-map', '1:a:0',
         '-y', output_path
     ]
     
@@ -57,7 +135,186 @@ def merge_audio_video(video_path: str, audio_path: str, output_path: str) -> Non
         raise RuntimeError("Failed to merge audio")
 
 
-def main():
+def render_image_to_video(image_path: str, audio_path: str, output_path: str,
+                          args: argparse.Namespace, tmpdir: str) -> None:
+    """Run the image-to-video pipeline (analyze, render, merge) for one image"""
+    # Heavy imports (numpy/scipy/cv2/numba) deferred until actually rendering
+    from audio_analysis import AudioAnalyzer
+    from image_to_video import ImageToVideoProcessor
+    
+    video_no_audio_path = os.path.join(tmpdir, 'video_no_audio.mp4')
+    
+    # Step 1: Analyze audio
+    print("\n--- Audio Analysis ---")
+    analyzer = AudioAnalyzer(audio_path, sr=args.sr)
+    energy_curves, frame_times = analyzer.analyze_enhanced(**enhanced_band_ranges(args))
+    
+    bass_beat_frames = analyzer.bass_beat_frames if hasattr(analyzer, 'bass_beat_frames') else None
+    snare_hit_frames = analyzer.snare_hit_frames if hasattr(analyzer, 'snare_hit_frames') else None
+    
+    print(f"Energy curves computed for {len(energy_curves)} frequency bands")
+    
+    # Step 2: Process image to video
+    print("\n--- Image-to-Video Processing ---")
+    processor = ImageToVideoProcessor(
+        image_path,
+        audio_path,
+        fps=args.fps,
+        width=args.width,
+        height=args.height
+    )
+    processor.process_image_to_video(
+        video_no_audio_path,
+        energy_curves,
+        frame_times,
+        bass_beat_frames=bass_beat_frames,
+        snare_hit_frames=snare_hit_frames,
+        zoom_factor=args.zoom,
+        rotation_angle=args.rotation,
+        sub_bass_zoom=args.sub_bass_zoom,
+        bass_zoom=args.bass_zoom,
+        treble_rotation=args.treble_rotation,
+        high_treble_rotation=args.high_treble_rotation,
+        mid_hue_shift=args.mid_hue_shift,
+        enable_color_grading=args.enable_color_grading,
+        enable_blur=args.enable_blur,
+        enable_brightness=args.enable_brightness,
+        enable_glitch=args.enable_glitch if hasattr(args, 'enable_glitch') else False,
+        enable_artifacts=args.enable_artifacts if hasattr(args, 'enable_artifacts') else False,
+        beat_triggered_zoom=True,
+        beat_window=0.2,
+        snare_triggered_flash=True,
+        snare_window=0.15,
+        intensity_sensitivity=args.intensity_sensitivity,
+        smoothness=args.smoothness
+    )
+    
+    # Step 3: Merge audio with video
+    print("\n--- Audio Merge ---")
+    merge_audio_video(video_no_audio_path, audio_path, output_path)
+
+
+def find_batch_jobs(batch_dir: str):
+    """
+    Pair images with audio files of the same name in a directory
+    
+    Args:
+        batch_dir: Directory containing e.g. song.png + song.mp3
+        
+    Returns:
+        List of (image_path, audio_path, output_path) tuples; outputs are
+        written next to the inputs as <name>_reactive.mp4
+    """
+    images = {}
+    audios = {}
+    for name in sorted(os.listdir(batch_dir)):
+        stem, ext = os.path.splitext(name)
+        ext = ext.lower()
+        if ext in IMAGE_EXTENSIONS:
+            images.setdefault(stem, os.path.join(batch_dir, name))
+        elif ext in AUDIO_EXTENSIONS:
+            audios.setdefault(stem, os.path.join(batch_dir, name))
+    
+    jobs = []
+    for stem, image_path in images.items():
+        if stem not in audios:
+            print(f"Skipping '{image_path}': no matching audio file")
+            continue
+        output_path = os.path.join(batch_dir, f"{stem}_reactive.mp4")
+        if os.path.exists(output_path):
+            print(f"Skipping '{image_path}': '{output_path}' already exists")
+            continue
+        jobs.append((image_path, audios[stem], output_path))
+    return jobs
+
+
+class BatchWorker(multiprocessing.Process):
+    """Worker process that renders image-mode jobs from a shared queue"""
+    
+    def __init__(self, job_queue, result_queue, args):
+        super().__init__()
+        self.job_queue = job_queue
+        self.result_queue = result_queue
+        self.args = args
+    
+    def run(self):
+        # Lower priority so a batch doesn't starve the desktop
+        if hasattr(os, 'nice'):
+            os.nice(5)
+        
+        while True:
+            job = self.job_queue.get()
+            if job is None:
+                break
+            image_path, audio_path, output_path = job
+            try:
+                with tempfile.TemporaryDirectory() as tmpdir:
+                    render_image_to_video(image_path, audio_path, output_path, self.args, tmpdir)
+                self.result_queue.put((output_path, None))
+            except Exception as e:
+                self.result_queue.put((output_path, str(e)))
+
+
+def run_batch(args: argparse.Namespace) -> int:
+    """
+    Render every image/audio pair in args.batch_dir across worker processes
+    
+    Returns:
+        Number of failed jobs
+    """
+    jobs = find_batch_jobs(args.batch_dir)
+    if not jobs:
+        print(f"No image/audio pairs found in '{args.batch_dir}'")
+        return 0
+    
+    n_workers = min(len(jobs), multiprocessing.cpu_count())
+    print(f"Rendering {len(jobs)} image(s) with {n_workers} worker process(es)...")
+    
+    job_queue = multiprocessing.Queue()
+    result_queue = multiprocessing.Queue()
+    for job in jobs:
+        job_queue.put(job)
+    for _ in range(n_workers):
+        job_queue.put(None)
+    
+    workers = [BatchWorker(job_queue, result_queue, args) for _ in range(n_workers)]
+    for worker in workers:
+        worker.start()
+    
+    failures = 0
+    pending = {output_path for _, _, output_path in jobs}
+    while pending:
+        try:
+            output_path, error = result_queue.get(timeout=BATCH_POLL_SECONDS)
+        except queue.Empty:
+            # A worker killed mid-job (OOM, crash in native code) never reports;
+            # once every worker has exited, the jobs still pending are lost
+            if any(worker.is_alive() for worker in workers):
+                continue
+            try:
+                output_path, error = result_queue.get(timeout=BATCH_POLL_SECONDS)
+            except queue.Empty:
+                exit_codes = sorted({worker.exitcode for worker in workers if worker.exitcode})
+                for output_path in sorted(pending):
+                    failures += 1
+                    print(f"FAILED: {output_path}: not rendered, worker process died (exit codes {exit_codes})")
+                break
+        pending.discard(output_path)
+        if error:
+            failures += 1
+            print(f"FAILED: {output_path}: {error}")
+        else:
+            print(f"Done: {output_path}")
+    
+    for worker in workers:
+        worker.join()
+    
+    return failures
+
+
+@functools.lru_cache(maxsize=1)
+def _get_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser (once per process)"""
     parser = argparse.ArgumentParser(
         description="Generate audio-reactive video with dynamic visual effects",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -80,11 +337,19 @@ Examples:
   
   # Enhanced with custom intensity sensitivity
   python3 audio_reactive_video.py input.mp4 output.mp4 --enhanced --intensity-sensitivity 0.9 --smoothness 0.8
+  
+  # Batch image mode: renders song.png + song.mp3 -> song_reactive.mp4 for every pair
+  python3 audio_reactive_video.py --batch-dir covers/
         """
     )
     
-    parser.add_argument('input', help='Input video file (MP4) or image file (PNG, JPG)')
-    parser.add_argument('output', help='Output video file (MP4)')
+    parser.add_argument('input', nargs='?', help='Input video file (MP4) or image file (PNG, JPG)')
+    parser.add_argument('output', nargs='?', help='Output video file (MP4)')
+    parser.add_argument(
+        '--batch-dir', type=str, default=None,
+        help='Image mode for a whole directory: renders every image with the audio '
+             'file of the same name to <name>_reactive.mp4, one process per CPU'
+    )
     parser.add_argument(
         '--audio', type=str, default=None,
         help='Audio file (MP3, WAV) - required when input is an image'
@@ -217,7 +482,36 @@ Examples:
         help='Audio sample rate in Hz (default: 22050)'
     )
     
-    args = parser.parse_args()
+    return parser
+
+
+def main(argv=None):
+    """
+    Run the CLI
+    
+    Args:
+        argv: Argument list (default: sys.argv[1:]); lets callers invoke the
+            pipeline programmatically without spawning a new interpreter
+    """
+    parser = _get_parser()
+    args = parser.parse_args(argv)
+    
+    if not args.batch_dir and (not args.input or not args.output):
+        parser.error("input and output are required unless --batch-dir is given")
+    
+    # Validate parameters
+    enhanced = args.enhanced or args.batch_dir
+    validators = _COMMON_VALIDATORS + (_ENHANCED_VALIDATORS if enhanced else _LEGACY_VALIDATORS)
+    for is_valid, message in validators:
+        if not is_valid(args):
+            print(f"Error: {message}")
+            sys.exit(1)
+    
+    if args.batch_dir:
+        if not os.path.isdir(args.batch_dir):
+            print(f"Error: Batch directory '{args.batch_dir}' not found")
+            sys.exit(1)
+        sys.exit(1 if run_batch(args) else 0)
     
     # Validate inputs
     if not os.path.exists(args.input):
@@ -225,9 +519,8 @@ Examples:
         sys.exit(1)
     
     # Check if input is an image
-    image_extensions = {'.png', '.jpg', '.jpeg', '.bmp', '.tiff', '.webp'}
     input_ext = os.path.splitext(args.input.lower())[1]
-    is_image = input_ext in image_extensions
+    is_image = input_ext in IMAGE_EXTENSIONS
     
     # If image, require audio file
     if is_image or args.image_mode:
@@ -244,34 +537,6 @@ Examples:
             print("Cancelled.")
             sys.exit(0)
     
-    # Validate parameters
-    if args.zoom < 1.0:
-        print("Error: Zoom factor must be >= 1.0")
-        sys.exit(1)
-    
-    if not args.enhanced:
-        # Legacy mode validations
-        if args.duration <= 0:
-            print("Error: Effect duration must be > 0")
-            sys.exit(1)
-        
-        if args.bass_range[0] >= args.bass_range[1]:
-            print("Error: Bass range min must be less than max")
-            sys.exit(1)
-        
-        if args.treble_range[0] >= args.treble_range[1]:
-            print("Error: Treble range min must be less than max")
-            sys.exit(1)
-    else:
-        # Enhanced mode validations
-        if args.intensity_sensitivity < 0.0 or args.intensity_sensitivity > 1.0:
-            print("Error: Intensity sensitivity must be between 0.0 and 1.0")
-            sys.exit(1)
-        
-        if args.smoothness < 0.0 or args.smoothness > 1.0:
-            print("Error: Smoothness must be between 0.0 and 1.0")
-            sys.exit(1)
-    
     try:
         # Create temporary directory for intermediate files
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -286,63 +551,7 @@ Examples:
             
             # Handle image mode
             if is_image or args.image_mode:
-                audio_path = args.audio
-                video_no_audio_path = os.path.join(tmpdir, 'video_no_audio.mp4')
-                
-                # Step 1: Analyze audio
-                print("\n--- Audio Analysis ---")
-                analyzer = AudioAnalyzer(audio_path, sr=args.sr)
-                energy_curves, frame_times = analyzer.analyze_enhanced(
-                    sub_bass_range=tuple(args.sub_bass_range),
-                    bass_range=tuple(args.bass_range_enhanced),
-                    mid_range=tuple(args.mid_range),
-                    treble_range=tuple(args.treble_range_enhanced),
-                    high_treble_range=tuple(args.high_treble_range)
-                )
-                
-                bass_beat_frames = analyzer.bass_beat_frames if hasattr(analyzer, 'bass_beat_frames') else None
-                snare_hit_frames = analyzer.snare_hit_frames if hasattr(analyzer, 'snare_hit_frames') else None
-                
-                print(f"Energy curves computed for {len(energy_curves)} frequency bands")
-                
-                # Step 2: Process image to video
-                print("\n--- Image-to-Video Processing ---")
-                processor = ImageToVideoProcessor(
-                    args.input,
-                    audio_path,
-                    fps=args.fps,
-                    width=args.width,
-                    height=args.height
-                )
-                processor.process_image_to_video(
-                    video_no_audio_path,
-                    energy_curves,
-                    frame_times,
-                    bass_beat_frames=bass_beat_frames,
-                    snare_hit_frames=snare_hit_frames,
-                    zoom_factor=args.zoom,
-                    rotation_angle=args.rotation,
-                    sub_bass_zoom=args.sub_bass_zoom,
-                    bass_zoom=args.bass_zoom,
-                    treble_rotation=args.treble_rotation,
-                    high_treble_rotation=args.high_treble_rotation,
-                    mid_hue_shift=args.mid_hue_shift,
-                    enable_color_grading=args.enable_color_grading,
-                    enable_blur=args.enable_blur,
-                    enable_brightness=args.enable_brightness,
-                    enable_glitch=args.enable_glitch if hasattr(args, 'enable_glitch') else False,
-                    enable_artifacts=args.enable_artifacts if hasattr(args, 'enable_artifacts') else False,
-                    beat_triggered_zoom=True,
-                    beat_window=0.2,
-                    snare_triggered_flash=True,
-                    snare_window=0.15,
-                    intensity_sensitivity=args.intensity_sensitivity,
-                    smoothness=args.smoothness
-                )
-                
-                # Step 3: Merge audio with video
-                print("\n--- Audio Merge ---")
-                merge_audio_video(video_no_audio_path, audio_path, args.output)
+                render_image_to_video(args.input, args.audio, args.output, args, tmpdir)
                 
                 print("\n" + "="*60)
                 print("SUCCESS!")
@@ -351,25 +560,32 @@ Examples:
                 return
             
             # Video mode (existing code)
-            audio_path = os.path.join(tmpdir, 'extracted_audio.wav')
-            video_no_audio_path = os.path.join(tmpdir, 'video_no_audio.mp4')
+            from audio_analysis import AudioAnalyzer
+            from video_processor import VideoProcessor
             
-            # Step 1: Extract audio
-            extract_audio(args.input, audio_path)
+            # Step 1: Extract audio (ffmpeg subprocess) while the video is
+            # opened on another thread. The same ffmpeg pass keeps a copy of
+            # the original audio track for the final mux.
+            audio_track_path = os.path.join(tmpdir, 'audio_track.mka')
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                extract_future = executor.submit(extract_audio, args.input, args.sr, audio_track_path)
+                processor_future = executor.submit(VideoProcessor, args.input)
+                try:
+                    audio_data = extract_future.result()
+                except Exception:
+                    # Don't leak the capture opened alongside the failed extraction
+                    if processor_future.exception() is None:
+                        processor_future.result().cap.release()
+                    raise
             
             # Step 2: Analyze audio
             print("\n--- Audio Analysis ---")
-            analyzer = AudioAnalyzer(audio_path, sr=args.sr)
+            # Already mono at args.sr, so load_audio skips its own resample
+            analyzer = AudioAnalyzer(audio_data, sr=args.sr)
             
             if args.enhanced:
                 # Enhanced mode: Multi-band analysis with continuous energy curves
-                energy_curves, frame_times = analyzer.analyze_enhanced(
-                    sub_bass_range=tuple(args.sub_bass_range),
-                    bass_range=tuple(args.bass_range_enhanced),
-                    mid_range=tuple(args.mid_range),
-                    treble_range=tuple(args.treble_range_enhanced),
-                    high_treble_range=tuple(args.high_treble_range)
-                )
+                energy_curves, frame_times = analyzer.analyze_enhanced(**enhanced_band_ranges(args))
                 
                 # Get beat frames
                 bass_beat_frames = analyzer.bass_beat_frames if hasattr(analyzer, 'bass_beat_frames') else None
@@ -384,14 +600,16 @@ Examples:
                     treble_freq_range=tuple(args.treble_range)
                 )
             
-            # Step 3: Process video
+            # Step 3: Process video, piping frames into ffmpeg which muxes the
+            # input's audio in the same pass (an AAC track is copied as-is)
             print("\n--- Video Processing ---")
-            processor = VideoProcessor(args.input)
+            processor = processor_future.result()
+            audio_codec = 'copy' if probe_audio_codec(audio_track_path) == 'aac' else 'aac'
             
             if args.enhanced:
                 # Enhanced mode: Continuous reactivity with beat-triggered zoom
                 processor.process_video_enhanced(
-                    video_no_audio_path,
+                    args.output,
                     energy_curves,
                     frame_times,
                     bass_beat_frames=bass_beat_frames,
@@ -413,26 +631,26 @@ Examples:
                     snare_triggered_flash=True,  # Default: snare-triggered flash
                     snare_window=0.15,
                     intensity_sensitivity=args.intensity_sensitivity,
-                    smoothness=args.smoothness
+                    smoothness=args.smoothness,
+                    audio_path=audio_track_path,
+                    audio_codec=audio_codec
                 )
             else:
                 # Legacy mode: Peak-based effects
                 processor.process_video(
-                    video_no_audio_path,
+                    args.output,
                     bass_frames,
                     treble_frames,
                     frame_times,
                     zoom_factor=args.zoom,
                     rotation_angle=args.rotation,
-                    effect_duration=args.duration
+                    effect_duration=args.duration,
+                    audio_path=audio_track_path,
+                    audio_codec=audio_codec
                 )
             
             processor.close()
             
-            # Step 4: Merge audio back
-            print("\n--- Audio Merge ---")
-            merge_audio_video(video_no_audio_path, audio_path, args.output)
-            
             print("\n" + "="*60)
             print("SUCCESS!")
             print(f"Output video saved to: {args.output}")
@@ -7,9 +7,37 @@ import tkinter as tk
 from tkinter import ttk
 
 
+class _HoverBinder:
+    """
+    Shared hover handlers for buttons
+    
+    The colors live on the button itself, so every dialog binds the same two
+    bound methods instead of allocating a pair of closures per button.
+    """
+    
+    def bind(self, button, hover_bg, normal_bg):
+        """Swap button background to hover_bg while the pointer is over it"""
+        button._hover_colors = (hover_bg, normal_bg)
+        button.bind("<Enter>", self.on_enter)
+        button.bind("<Leave>", self.on_leave)
+    
+    def on_enter(self, event):
+        event.widget.config(bg=event.widget._hover_colors[0])
+    
+    def on_leave(self, event):
+        event.widget.config(bg=event.widget._hover_colors[1])
+
+
+_hover = _HoverBinder()
+
+
 class CustomModal:
     """Base class for custom modal dialogs"""
     
+    # Closed dialogs are withdrawn and kept here for reuse - creating a new
+    # Toplevel is the expensive part of opening a dialog
+    _pool = []
+    
     def __init__(self, parent, title, message, modal_type="info"):
         """
         Create a custom modal dialog
@@ -23,16 +51,16 @@ class CustomModal:
         self.parent = parent
         self.result = None
         
-        # Create modal window
-        self.window = tk.Toplevel(parent)
+        # Create modal window (or reuse a pooled one)
+        self.window = self._acquire_window(parent)
+        self._closed = tk.BooleanVar(self.window, value=False)
+        self.window.protocol("WM_DELETE_WINDOW", self._close)
         self.window.title(title)
-        self.window.geometry("400x200")
         self.window.resizable(False, False)
         self.window.transient(parent)
         self.window.grab_set()
         
-        # Center the window
-        self.window.update_idletasks()
+        # Center the window (screen size needs no layout flush)
         x = (self.window.winfo_screenwidth() // 2) - (400 // 2)
         y = (self.window.winfo_screenheight() // 2) - (200 // 2)
         self.window.geometry(f"400x200+{x}+{y}")
@@ -126,23 +154,43 @@ class CustomModal:
         button.pack(side=tk.RIGHT)
         
         # Hover effect
-        def on_enter(e):
-            button.config(bg=self.colors["fg"])
-        
-        def on_leave(e):
-            button.config(bg=self.colors["accent"])
+        _hover.bind(button, self.colors["fg"], self.colors["accent"])
+    
+    @staticmethod
+    def _acquire_window(parent):
+        """Get a cleared pooled window for this parent, or create a new one"""
+        while CustomModal._pool:
+            window = CustomModal._pool.pop()
+            if not window.winfo_exists():
+                continue
+            if window._modal_parent is not parent:
+                window.destroy()
+                continue
+            for child in window.winfo_children():
+                child.destroy()
+            window.deiconify()
+            return window
         
-        button.bind("<Enter>", on_enter)
-        button.bind("<Leave>", on_leave)
+        window = tk.Toplevel(parent)
+        window._modal_parent = parent
+        return window
+    
+    def _close(self):
+        """Hide the dialog, return its window to the pool and end show()"""
+        self.window.grab_release()
+        self.window.withdraw()
+        CustomModal._pool.append(self.window)
+        self._closed.set(True)
     
     def on_ok(self):
         """Handle OK button click"""
         self.result = "ok"
-        self.window.destroy()
+        self._close()
     
     def show(self):
         """Show modal and wait for result"""
-        self.window.wait_window()
+        if not self._closed.get():
+            self.window.wait_variable(self._closed)
         return self.result
 
 
@@ -214,32 +262,18 @@ class CustomQuestion(CustomModal):
         yes_button.pack(side=tk.LEFT)
         
         # Hover effects
-        def on_enter_no(e):
-            no_button.config(bg="#616161")
-        
-        def on_leave_no(e):
-            no_button.config(bg="#757575")
-        
-        def on_enter_yes(e):
-            yes_button.config(bg=self.colors["fg"])
-        
-        def on_leave_yes(e):
-            yes_button.config(bg=self.colors["accent"])
-        
-        no_button.bind("<Enter>", on_enter_no)
-        no_button.bind("<Leave>", on_leave_no)
-        yes_button.bind("<Enter>", on_enter_yes)
-        yes_button.bind("<Leave>", on_leave_yes)
+        _hover.bind(no_button, "#616161", "#757575")
+        _hover.bind(yes_button, self.colors["fg"], self.colors["accent"])
     
     def on_yes(self):
         """Handle Yes button click"""
         self.result = "yes"
-        self.window.destroy()
+        self._close()
     
     def on_no(self):
         """Handle No button click"""
         self.result = "no"
-        self.window.destroy()
+        self._close()
     
     @staticmethod
     def askyesno(parent, title, message):
@@ -7,10 +7,22 @@ Applies all audio-reactive effects to the image based on music frequencies
 import cv2
 import numpy as np
 from typing import Dict, Optional, Tuple
-from video_processor import VideoProcessor
-import librosa
+from video_processor import VideoProcessor, resize_interpolation
+from audio_analysis import get_audio_info
 
 
+# (band, weight) terms each artistic effect's intensity is mixed from
+ARTISTIC_BAND_MIXES = {
+    'pixel_sort': (('mid', 0.7), ('treble', 0.3)),  # Flowing, artistic
+    'kaleidoscope': (('treble', 0.5), ('high_treble', 0.5)),  # Symmetry on bright sounds
+    'wave_distortion': (('sub_bass', 0.3), ('bass', 0.7)),  # Organic bass warping
+    'vhs': (('bass', 0.3), ('mid', 0.3), ('treble', 0.4)),  # Overall energy, retro
+    'posterization': (('mid', 0.8), ('treble', 0.2)),  # Graphic art
+    'edge_detection': (('treble', 0.4), ('high_treble', 0.6)),  # Sharp, graphic
+    'data_corruption': (('treble', 0.5), ('high_treble', 0.5)),  # Digital aesthetic
+    'scan_lines': (('bass', 0.2), ('mid', 0.3), ('treble', 0.5)),  # Overall energy, CRT
+}
+
 class ImageToVideoProcessor:
     """
     Creates video from a single image by applying audio-reactive effects
@@ -52,12 +64,12 @@ class ImageToVideoProcessor:
         
         # Resize image if needed
         if width != img_w or height != img_h:
+            scale = min(width / img_w, height / img_h)
             self.base_image = cv2.resize(self.base_image, (width, height), 
-                                        interpolation=cv2.INTER_LANCZOS4)
+                                        interpolation=resize_interpolation(scale))
         
         # Get audio duration
-        y, sr = librosa.load(audio_path, sr=None)
-        self.audio_duration = len(y) / sr
+        self.audio_duration, sr = get_audio_info(audio_path)
         self.total_frames = int(self.audio_duration * fps)
         
         print(f"Image loaded: {img_w}x{img_h} (output: {width}x{height})")
@@ -236,28 +248,44 @@ class ImageToVideoProcessor:
         
         # Get beat information
         if bass_beat_frames is not None and len(bass_beat_frames) > 0:
-            bass_beat_times = frame_times[bass_beat_frames]
+            bass_beat_times = np.sort(frame_times[bass_beat_frames])
         else:
             bass_beat_times = np.array([])
         
         if snare_hit_frames is not None and len(snare_hit_frames) > 0:
-            snare_hit_times = frame_times[snare_hit_frames]
+            snare_hit_times = np.sort(frame_times[snare_hit_frames])
         else:
             snare_hit_times = np.array([])
         
+        # Distance from every frame to its nearest beat/snare, looked up per frame
+        beat_distances = VideoProcessor.nearest_event_distances(bass_beat_times, self.total_frames, self.fps)
+        snare_distances = VideoProcessor.nearest_event_distances(snare_hit_times, self.total_frames, self.fps)
+        
         # Setup video writer
         fourcc = cv2.VideoWriter_fourcc(*'mp4v')
         out = cv2.VideoWriter(output_path, fourcc, self.fps, (self.width, self.height))
 
+        # Band mixes of the enabled artistic effects; disabled ones keep apply_effects' 0.0
+        enabled_effects = {
+            'pixel_sort': enable_pixel_sort,
+            'kaleidoscope': enable_kaleidoscope,
+            'wave_distortion': enable_wave_distortion,
+            'vhs': enable_vhs,
+            'posterization': enable_posterization,
+            'edge_detection': enable_edge_detection,
+            'data_corruption': enable_data_corruption,
+            'scan_lines': enable_scan_lines,
+        }
+        enabled_band_mixes = [(effect, band_mix) for effect, band_mix in ARTISTIC_BAND_MIXES.items()
+                              if enabled_effects[effect]]
+        artistic_gain = 0.5 + intensity_sensitivity * 0.5
+        
         # Natural motion persistent state (audio drift smoothing)
         _ad_smooth_x = 0.0
         _ad_smooth_y = 0.0
         
         # Process each frame
         for frame_idx in range(self.total_frames):
-            # Get current time
-            current_time = frame_idx / self.fps
-            
             # Get energy values for this frame
             sub_bass_val = sub_bass_interp[frame_idx]
             bass_val = bass_interp[frame_idx]
@@ -301,8 +329,7 @@ class ImageToVideoProcessor:
             
             # Calculate zoom (beat-triggered or continuous)
             if beat_triggered_zoom and len(bass_beat_times) > 0:
-                time_distances = np.abs(bass_beat_times - current_time)
-                nearest_beat_distance = np.min(time_distances) if len(time_distances) > 0 else float('inf')
+                nearest_beat_distance = beat_distances[frame_idx]
                 
                 if nearest_beat_distance <= beat_window:
                     beat_proximity = 1.0 - (nearest_beat_distance / beat_window)
@@ -343,8 +370,7 @@ class ImageToVideoProcessor:
             
             # Snare-triggered brightness flash
             if snare_triggered_flash and len(snare_hit_times) > 0:
-                snare_time_distances = np.abs(snare_hit_times - current_time)
-                nearest_snare_distance = np.min(snare_time_distances) if len(snare_time_distances) > 0 else float('inf')
+                nearest_snare_distance = snare_distances[frame_idx]
                 
                 if nearest_snare_distance <= snare_window:
                     snare_proximity = 1.0 - (nearest_snare_distance / snare_window)
@@ -373,61 +399,12 @@ class ImageToVideoProcessor:
                 artifacts_intensity = np.clip(artifacts_intensity, 0.0, 1.0)
             
             # New artistic effects - mapped to different frequency bands for dynamic reactivity
-            pixel_sort_intensity = 0.0
-            if enable_pixel_sort:
-                # Pixel sorting reacts to mid frequencies (artistic, flowing)
-                base_intensity = mid_val * 0.7 + treble_val * 0.3
-                pixel_sort_intensity = base_intensity * (0.5 + intensity_sensitivity * 0.5)
-                pixel_sort_intensity = np.clip(pixel_sort_intensity, 0.0, 1.0)
-            
-            kaleidoscope_intensity = 0.0
-            if enable_kaleidoscope:
-                # Kaleidoscope reacts to treble (symmetrical patterns on bright sounds)
-                base_intensity = (treble_val * 0.5 + high_treble_val * 0.5)
-                kaleidoscope_intensity = base_intensity * (0.5 + intensity_sensitivity * 0.5)
-                kaleidoscope_intensity = np.clip(kaleidoscope_intensity, 0.0, 1.0)
-            
-            wave_distortion_intensity = 0.0
-            if enable_wave_distortion:
-                # Wave distortion reacts to bass (flowing, organic)
-                base_intensity = (sub_bass_val * 0.3 + bass_val * 0.7)
-                wave_distortion_intensity = base_intensity * (0.5 + intensity_sensitivity * 0.5)
-                wave_distortion_intensity = np.clip(wave_distortion_intensity, 0.0, 1.0)
-            
-            vhs_intensity = 0.0
-            if enable_vhs:
-                # VHS degradation reacts to overall energy (retro aesthetic)
-                base_intensity = (bass_val * 0.3 + mid_val * 0.3 + treble_val * 0.4)
-                vhs_intensity = base_intensity * (0.5 + intensity_sensitivity * 0.5)
-                vhs_intensity = np.clip(vhs_intensity, 0.0, 1.0)
-            
-            posterization_intensity = 0.0
-            if enable_posterization:
-                # Posterization reacts to mid frequencies (graphic art)
-                base_intensity = mid_val * 0.8 + treble_val * 0.2
-                posterization_intensity = base_intensity * (0.5 + intensity_sensitivity * 0.5)
-                posterization_intensity = np.clip(posterization_intensity, 0.0, 1.0)
-            
-            edge_detection_intensity = 0.0
-            if enable_edge_detection:
-                # Edge detection reacts to high frequencies (sharp, graphic)
-                base_intensity = (treble_val * 0.4 + high_treble_val * 0.6)
-                edge_detection_intensity = base_intensity * (0.5 + intensity_sensitivity * 0.5)
-                edge_detection_intensity = np.clip(edge_detection_intensity, 0.0, 1.0)
-            
-            data_corruption_intensity = 0.0
-            if enable_data_corruption:
-                # Data corruption reacts to high frequencies (digital divide aesthetic)
-                base_intensity = (treble_val * 0.5 + high_treble_val * 0.5)
-                data_corruption_intensity = base_intensity * (0.5 + intensity_sensitivity * 0.5)
-                data_corruption_intensity = np.clip(data_corruption_intensity, 0.0, 1.0)
-            
-            scan_lines_intensity = 0.0
-            if enable_scan_lines:
-                # Scan lines react to overall energy (CRT aesthetic)
-                base_intensity = (bass_val * 0.2 + mid_val * 0.3 + treble_val * 0.5)
-                scan_lines_intensity = base_intensity * (0.5 + intensity_sensitivity * 0.5)
-                scan_lines_intensity = np.clip(scan_lines_intensity, 0.0, 1.0)
+            band_values = {'sub_bass': sub_bass_val, 'bass': bass_val, 'mid': mid_val,
+                           'treble': treble_val, 'high_treble': high_treble_val}
+            artistic = {}
+            for effect, band_mix in enabled_band_mixes:
+                base_intensity = sum(band_values[band] * weight for band, weight in band_mix)
+                artistic[f"{effect}_intensity"] = np.clip(base_intensity * artistic_gain, 0.0, 1.0)
             
             # Apply effects to frame (always call so natural motion is applied even at silence)
             frame = self.effect_processor.apply_effects(
@@ -440,14 +417,7 @@ class ImageToVideoProcessor:
                 blur_intensity=blur_intensity,
                 glitch_intensity=glitch_intensity,
                 artifacts_intensity=artifacts_intensity,
-                pixel_sort_intensity=pixel_sort_intensity,
-                kaleidoscope_intensity=kaleidoscope_intensity,
-                wave_distortion_intensity=wave_distortion_intensity,
-                vhs_intensity=vhs_intensity,
-                posterization_intensity=posterization_intensity,
-                edge_detection_intensity=edge_detection_intensity,
-                data_corruption_intensity=data_corruption_intensity,
-                scan_lines_intensity=scan_lines_intensity,
+                **artistic,
                 effect_mode="direct",
                 blend_mode="normal",
                 layer_opacity=1.0,
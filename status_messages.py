@@ -0,0 +1,143 @@
+"""
+Status messages for SoundReactive GUI
+Randomly picked progress text, one tuple of messages per processing phase
+"""
+
+# ====================================================================
+# STATUS MESSAGES - Add your own custom messages here!
+# ====================================================================
+# These messages are randomly selected during processing to provide
+# engaging feedback. Add your own messages to any category by simply
+# adding them to the tuple. The more messages, the more variety!
+# ====================================================================
+STATUS_MESSAGES = {
+    'audio_extraction': (
+        "Extracting audio from video...",
+        "Separating audio track...",
+        "Preparing audio for analysis...",
+        "Isolating sound frequencies...",
+        "Extracting audio from video... gently, so it doesn’t scream.",
+        "Separating sound from vision like a very polite divorce.",
+        "Convincing the audio track to come out on its own.",
+        "Removing sound from pictures, which were clearly very attached.",
+        "Liberating audio from its visual obligations.",
+        "Peeling off the soundtrack without damaging the spacetime continuum.",
+        "Listening very carefully while pretending this is difficult.",
+    ),
+    'audio_analysis': (
+        "Analyzing frequency spectrum...",
+        "Detecting beats and rhythms...",
+        "Mapping audio to visual effects...",
+        "Computing energy curves...",
+        "Identifying bass drops and snare hits...",
+        "Breaking down frequency bands...",
+        "Calculating audio reactivity...",
+        "Finding the perfect sync points...",
+        "Analyzing frequency spectrum like it owes us money.",
+        "Listening to the music with a furrowed digital brow.",
+        "Detecting beats, rhythms, and questionable artistic decisions.",
+        "Mapping sound waves while nodding thoughtfully.",
+        "Identifying bass drops and moments of existential crisis.",
+        "Breaking audio into frequencies, none of which asked for this.",
+        "Calculating audio reactivity using advanced maths and mild optimism.",
+        "Searching for sync points where everything briefly makes sense.",
+        "Pretending to understand music theory.",
+        "Measuring vibes with highly scientific enthusiasm.",
+    ),
+    'processing_start': (
+        "Initializing video processing...",
+        "Setting up effect pipeline...",
+        "Preparing to transform your media...",
+        "Loading transformation engine...",
+        "Ready to create magic...",
+        "Initializing video processing. This may involve drama.",
+        "Starting the transformation engine. No refunds.",
+        "Preparing to bend reality slightly.",
+        "Booting up the creative machinery. Please stand back.",
+        "Aligning bits, bytes, and expectations.",
+        "Checking if the laws of physics are negotiable today.",
+        "Warming up the pixels. They respond better that way.",
+        "Everything is ready. Confidence is simulated.",
+    ),
+    'processing_frame': (
+        "Applying audio-reactive effects...",
+        "Syncing visuals with music...",
+        "Creating dynamic transformations...",
+        "Morphing frames to the beat...",
+        "Blending frequencies into visuals...",
+        "Transforming pixels to music...",
+        "Making your image dance...",
+        "Weaving audio into visuals...",
+        "Painting with sound waves...",
+        "Bringing static to life...",
+        "Channeling the rhythm...",
+        "Translating frequencies to motion...",
+        "Applying audio-reactive effects with reckless precision.",
+        "Syncing visuals to music, because silence is awkward.",
+        "Making pixels dance despite their lack of limbs.",
+        "Translating sound into motion using questionable logic.",
+        "Convincing frames to feel the rhythm.",
+        "Blending frequencies into visuals like a confused DJ.",
+        "Turning static images into overachievers.",
+        "Channeling rhythm through entirely innocent pixels.",
+        "Painting with sound, without a license.",
+        "Bending frames to the beat. They resist at first.",
+        "Creating motion where none was previously agreed upon.",
+        "Encouraging visuals to express themselves musically.",
+    ),
+    'merging': (
+        "Merging audio and video...",
+        "Synchronizing final output...",
+        "Combining audio-reactive visuals...",
+        "Finalizing your creation...",
+        "Putting it all together...",
+        "Merging audio and video in holy matrimony.",
+        "Reuniting sound and vision after their trial separation.",
+        "Synchronizing everything and hoping no one notices the seams.",
+        "Combining parts into something greater than their regrets.",
+        "Stitching reality back together.",
+        "Final assembly underway. Fingers crossed.",
+        "Aligning timelines like a responsible time traveller.",
+    ),
+    'complete': (
+        "Processing complete!",
+        "Your audio-reactive video is ready!",
+        "Transformation finished successfully!",
+        "Your masterpiece is complete!",
+        "Ready to share your creation!",
+        "Processing complete. Nobody panicked. Much.",
+        "Your audio-reactive video is ready and surprisingly coherent.",
+        "Transformation finished. Reality remains intact.",
+        "Your masterpiece is complete. Define masterpiece loosely.",
+        "All done. We are as surprised as you are.",
+        "Finished successfully. Please admire responsibly.",
+        "Creation complete. Applause is optional but encouraged.",
+    ),
+    'folder_loading': (
+        "Loading images from folder...",
+        "Preparing image gallery...",
+        "Scanning folder for images...",
+        "Organizing your image collection...",
+        "Loading images from folder. One by one, patiently.",
+        "Scanning folder for images and judging filenames silently.",
+        "Preparing image gallery with curatorial confidence.",
+        "Organizing images into something resembling order.",
+        "Counting images and pretending it matters.",
+        "Locating pictures that thought they were hidden.",
+        "Opening the folder of many visual possibilities.",
+    ),
+    'webcam_starting': (
+        "Starting webcam...",
+        "Awakening the camera...",
+        "Asking the webcam nicely to cooperate...",
+        "Initializing visual capture device...",
+        "Preparing to see what you see...",
+    ),
+    'webcam_recording': (
+        "Recording your performance...",
+        "Capturing the moment...",
+        "Saving frames for posterity...",
+        "Documenting reality with effects...",
+        "Creating your audio-reactive masterpiece...",
+    ),
+}
@@ -4,11 +4,261 @@ Applies zoom, rotation, and advanced visual effects to video frames based on aud
 Enhanced with intensity-based effects, color grading, blur, and smooth interpolation
 """
 
+import functools
+import subprocess
+import sys
+import tempfile
+import threading
+
 import cv2
 import numpy as np
+from numba import njit, prange
 from typing import List, Tuple, Dict, Optional
 
 
+@functools.lru_cache(maxsize=64)
+def _color_grade_lut(hue_shift: float, saturation_mult: float, brightness_mult: float) -> np.ndarray:
+    """
+    Per-channel (H, S, V) uint8 lookup table for apply_color_grade
+    
+    Uses the same float32 math apply_color_grade used per pixel, evaluated once
+    for each of the 256 possible channel values.
+    """
+    values = np.arange(256, dtype=np.float32)
+    lut = np.empty((256, 1, 3), dtype=np.uint8)
+    lut[:, 0, 0] = (values + hue_shift) % 180 if hue_shift != 0.0 else values
+    lut[:, 0, 1] = np.clip(values * saturation_mult, 0, 255) if saturation_mult != 1.0 else values
+    lut[:, 0, 2] = np.clip(values * brightness_mult, 0, 255) if brightness_mult != 1.0 else values
+    lut.flags.writeable = False
+    return lut
+
+
+@functools.lru_cache(maxsize=None)
+def _posterize_lut(num_levels: int) -> np.ndarray:
+    """uint8 lookup table quantizing 0-255 down to num_levels steps"""
+    step = 256 / num_levels
+    lut = np.clip((np.arange(256) / step).astype(np.uint8) * step, 0, 255).astype(np.uint8)
+    lut.flags.writeable = False
+    return lut
+
+
+@functools.lru_cache(maxsize=8)
+def _barrel_grid(h: int, w: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Centered pixel coordinates and squared normalized radius for a frame size
+    
+    Returns the X, Y grids (float32, relative to the frame center) and
+    (r / max_r) ** 2 that apply_scan_lines_crt's barrel distortion scales
+    by intensity, so only the per-frame division is left per call.
+    """
+    center_x, center_y = w / 2, h / 2
+    x = np.arange(w, dtype=np.float32) - center_x
+    y = np.arange(h, dtype=np.float32) - center_y
+    X, Y = np.meshgrid(x, y)
+    r = np.sqrt(X**2 + Y**2)
+    max_r = np.sqrt(center_x**2 + center_y**2)
+    radius_sq = (r / max_r)**2
+    for grid in (X, Y, radius_sq):
+        grid.flags.writeable = False
+    return X, Y, radius_sq
+
+
+def resize_interpolation(scale: float) -> int:
+    """
+    cv2 interpolation flag for resizing an image by scale
+    
+    Shrinking uses INTER_AREA (box filter: every source pixel contributes,
+    so no aliasing); enlarging uses INTER_CUBIC, close to LANCZOS4 in
+    quality at a fraction of its cost.
+    """
+    return cv2.INTER_AREA if scale < 1.0 else cv2.INTER_CUBIC
+
+
+# Serializes the parallel kernel launches below. Numba's workqueue threading
+# layer (used when neither TBB nor OpenMP is available) aborts the process if
+# two threads launch parallel kernels at once, and the GUI runs effects on its
+# preview, webcam and render threads
+_PARALLEL_KERNEL_LOCK = threading.Lock()
+
+
+def start_parallel_runtime():
+    """
+    Launch numba's parallel runtime on the calling thread
+    
+    Call once from the main thread before effects run on other threads: the
+    TBB threading layer started from a secondary thread keeps the interpreter
+    from exiting. Also loads the cached kernel so the first effect doesn't.
+    """
+    frame = np.zeros((1, 1, 3), dtype=np.uint8)
+    with _PARALLEL_KERNEL_LOCK:
+        _scale_rows(frame, np.ones(1, dtype=np.float32), np.empty_like(frame))
+
+
+@njit(cache=True, parallel=True)
+def _sort_lines_by_key(src, key, out, lines, start, stop):
+    """
+    Pixel-sort helper: for every column x in lines, reorder src[start:stop, x]
+    by ascending key[start:stop, x] (stable) into out; columns run in parallel.
+    Pass transposed views to sort along rows instead.
+    """
+    for j in prange(lines.shape[0]):
+        x = lines[j]
+        order = np.argsort(key[start:stop, x], kind='mergesort')
+        for k in range(order.shape[0]):
+            y = start + order[k]
+            for c in range(src.shape[2]):
+                out[start + k, x, c] = src[y, x, c]
+
+
+@njit(cache=True, parallel=True)
+def _scale_rows(frame, row_gain, out):
+    """
+    out = uint8(clip(frame * row_gain[y], 0, 255)) in float32, rows in parallel
+    (rows with gain 1.0 are copied as-is)
+    """
+    h, w, n_ch = frame.shape
+    for y in prange(h):
+        g = row_gain[y]
+        if g == np.float32(1.0):
+            out[y] = frame[y]
+            continue
+        for x in range(w):
+            for c in range(n_ch):
+                v = np.float32(frame[y, x, c]) * g
+                if v > 255.0:
+                    v = 255.0
+                out[y, x, c] = np.uint8(v)
+
+
+@njit(cache=True, parallel=True)
+def _vhs_scan_bleed(frame, row_gain, bleed, out):
+    """
+    VHS scan lines + color bleeding in one pass into float32 out: each row is
+    scaled by row_gain[y], the blue channel is sampled bleed pixels to the right
+    and the red channel bleed pixels to the left (edges replicated)
+    """
+    h, w = frame.shape[:2]
+    for y in prange(h):
+        g = row_gain[y]
+        for x in range(w):
+            xb = min(x + bleed, w - 1)
+            xr = max(x - bleed, 0)
+            out[y, x, 0] = np.float32(frame[y, xb, 0]) * g
+            out[y, x, 1] = np.float32(frame[y, x, 1]) * g
+            out[y, x, 2] = np.float32(frame[y, xr, 2]) * g
+
+
+@functools.lru_cache(maxsize=None)
+def _h264_encoder(ffmpeg_bin: str) -> str:
+    """
+    Fastest H.264 encoder this ffmpeg build can use
+    
+    VideoToolbox encodes on the Apple media engine instead of the CPU, so
+    it is preferred on macOS when ffmpeg was built with it; everywhere else
+    (or if the encoder list can't be read) this falls back to libx264.
+    """
+    if sys.platform == 'darwin':
+        try:
+            result = subprocess.run([ffmpeg_bin, '-hide_banner', '-encoders'],
+                                    capture_output=True, text=True, timeout=10)
+            if 'h264_videotoolbox' in result.stdout:
+                return 'h264_videotoolbox'
+        except (OSError, subprocess.SubprocessError):
+            pass
+    return 'libx264'
+
+
+class FFmpegPipeWriter:
+    """
+    Drop-in replacement for cv2.VideoWriter that streams raw BGR frames into
+    ffmpeg's stdin, so encoding and audio muxing happen in the same pass as
+    frame processing (no intermediate silent MP4 to merge afterwards)
+    
+    yuv420p needs even dimensions, so odd-sized frames are padded by one
+    black row/column. If ffmpeg exits early, the next write() or release()
+    raises RuntimeError carrying ffmpeg's error output.
+    """
+    
+    def __init__(self, output_path: str, fps: float, frame_size: Tuple[int, int],
+                 audio_path: Optional[str] = None, audio_codec: str = 'aac',
+                 ffmpeg_bin: str = 'ffmpeg'):
+        """
+        Start the ffmpeg encoder process
+        
+        Args:
+            output_path: Path to output video
+            fps: Frame rate of the written frames
+            frame_size: (width, height) of every frame
+            audio_path: Optional file whose first audio stream is muxed in
+            audio_codec: ffmpeg audio codec for the muxed track ('copy' for AAC sources)
+            ffmpeg_bin: ffmpeg executable to run
+        """
+        width, height = frame_size
+        cmd = [
+            ffmpeg_bin, '-y', '-loglevel', 'error',
+            '-f', 'rawvideo', '-pix_fmt', 'bgr24', '-s', f'{width}x{height}', '-r', str(fps),
+            '-i', '-'
+        ]
+        if audio_path is not None:
+            cmd += ['-i', audio_path, '-map', '0:v:0', '-map', '1:a:0', '-c:a', audio_codec]
+        if width % 2 or height % 2:
+            cmd += ['-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2']
+        if _h264_encoder(ffmpeg_bin) == 'h264_videotoolbox':
+            # Hardware encoder has no CRF; ~0.15 bits per pixel is visually close to CRF 23
+            bitrate = int(width * height * fps * 0.15)
+            cmd += ['-c:v', 'h264_videotoolbox', '-b:v', str(bitrate)]
+        else:
+            cmd += ['-c:v', 'libx264', '-preset', 'fast', '-crf', '23']
+        cmd += ['-pix_fmt', 'yuv420p', output_path]
+        
+        # stderr goes to a temp file so a chatty ffmpeg can never fill a pipe and stall us
+        self._stderr = tempfile.TemporaryFile()
+        self._proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stderr=self._stderr)
+        self._error = None  # ffmpeg's error output once it has failed
+        self._error_raised = False
+    
+    def isOpened(self) -> bool:
+        """True while ffmpeg is running and accepting frames (cv2.VideoWriter API)"""
+        return not self._proc.stdin.closed and self._proc.poll() is None
+    
+    def write(self, frame: np.ndarray):
+        """Send one BGR frame to the encoder"""
+        if self._proc.stdin.closed:
+            self._raise_error()
+            raise RuntimeError("write to a released FFmpegPipeWriter")
+        try:
+            self._proc.stdin.write(np.ascontiguousarray(frame, dtype=np.uint8).data)
+        except BrokenPipeError:
+            self._finish()
+            self._raise_error()
+            raise RuntimeError("ffmpeg stopped reading frames")
+    
+    def release(self):
+        """Close stdin, wait for ffmpeg to finish writing the file"""
+        if not self._proc.stdin.closed:
+            self._finish()
+        if not self._error_raised:
+            self._raise_error()
+    
+    def _finish(self):
+        """Close stdin, wait for ffmpeg and keep its error output if it failed"""
+        try:
+            self._proc.stdin.close()
+        except BrokenPipeError:
+            pass
+        returncode = self._proc.wait()
+        self._stderr.seek(0)
+        error = self._stderr.read().decode(errors='replace').strip()
+        self._stderr.close()
+        if returncode != 0:
+            self._error = error or f"ffmpeg exited with code {returncode}"
+    
+    def _raise_error(self):
+        if self._error is not None:
+            self._error_raised = True
+            raise RuntimeError(f"ffmpeg failed to encode video: {self._error}")
+
+
 class VideoProcessor:
     """
     Processes video frames with dynamic effects based on audio frequency analysis
@@ -35,6 +285,20 @@ class VideoProcessor:
         print(f"Video loaded: {self.width}x{self.height} @ {self.fps} FPS")
         print(f"Total frames: {self.total_frames}, Duration: {self.duration:.2f}s")
     
+    def _open_writer(self, output_path: str, audio_path: Optional[str] = None,
+                     audio_codec: str = 'aac'):
+        """
+        Open the frame writer for output_path
+        
+        Without audio this is a plain cv2.VideoWriter. With audio, frames are
+        piped straight into ffmpeg, which muxes the audio in the same pass.
+        """
+        if audio_path is not None:
+            return FFmpegPipeWriter(output_path, self.fps, (self.width, self.height),
+                                    audio_path=audio_path, audio_codec=audio_codec)
+        fourcc = cv2.VideoWriter_fourcc(*'mp4v')
+        return cv2.VideoWriter(output_path, fourcc, self.fps, (self.width, self.height))
+    
     def time_to_frame(self, time_seconds: float) -> int:
         """Convert time in seconds to frame index"""
         return int(time_seconds * self.fps)
@@ -101,6 +365,58 @@ class VideoProcessor:
             return 2 * t * t
         return 1 - pow(-2 * t + 2, 2) / 2
     
+    @staticmethod
+    def nearest_event_distance(sorted_times: np.ndarray, t: float) -> float:
+        """
+        Distance from t to the closest event time
+        
+        Binary search on the sorted times, so per-frame beat/snare lookups
+        cost O(log n) and allocate nothing.
+        
+        Args:
+            sorted_times: Event times in seconds, ascending
+            t: Query time in seconds
+        
+        Returns:
+            Absolute distance in seconds (inf when there are no events)
+        """
+        n = len(sorted_times)
+        if n == 0:
+            return float('inf')
+        i = int(np.searchsorted(sorted_times, t))
+        if i == 0:
+            return abs(float(sorted_times[0]) - t)
+        if i == n:
+            return abs(t - float(sorted_times[n - 1]))
+        return min(float(sorted_times[i]) - t, t - float(sorted_times[i - 1]))
+    
+    @staticmethod
+    def nearest_event_distances(sorted_times: np.ndarray, n_frames: int, fps: float) -> np.ndarray:
+        """
+        nearest_event_distance for every frame time frame_idx / fps at once
+        
+        One vectorized searchsorted before a render replaces a binary search
+        per frame, so the frame loop only indexes the result.
+        
+        Args:
+            sorted_times: Event times in seconds, ascending
+            n_frames: Number of frames
+            fps: Frames per second
+        
+        Returns:
+            float64 array of n_frames distances in seconds (inf when there are no events)
+        """
+        t = np.arange(n_frames) / fps
+        if len(sorted_times) == 0:
+            return np.full(n_frames, np.inf)
+        times = np.asarray(sorted_times, dtype=np.float64)
+        i = np.searchsorted(times, t)
+        after = times[np.minimum(i, len(times) - 1)] - t
+        before = t - times[np.maximum(i - 1, 0)]
+        after[i == len(times)] = np.inf
+        before[i == 0] = np.inf
+        return np.minimum(after, before)
+    
     # ==================== Natural Motion Engine ====================
 
     @staticmethod
@@ -341,22 +657,14 @@ class VideoProcessor:
             return frame
         
         # Convert BGR to HSV
-        hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV).astype(np.float32)
-        
-        # Shift hue (OpenCV uses 0-179 for hue)
-        if hue_shift != 0.0:
-            hsv[:, :, 0] = (hsv[:, :, 0] + hue_shift) % 180
-        
-        # Adjust saturation
-        if saturation_mult != 1.0:
-            hsv[:, :, 1] = np.clip(hsv[:, :, 1] * saturation_mult, 0, 255)
+        hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
         
-        # Adjust brightness (value channel)
-        if brightness_mult != 1.0:
-            hsv[:, :, 2] = np.clip(hsv[:, :, 2] * brightness_mult, 0, 255)
+        # Hue shift (OpenCV uses 0-179 for hue), saturation and brightness
+        # (value channel) are all per-channel maps of 0-255, so apply them as
+        # a single table lookup
+        hsv = cv2.LUT(hsv, _color_grade_lut(hue_shift, saturation_mult, brightness_mult))
         
         # Convert back to BGR
-        hsv = hsv.astype(np.uint8)
         graded = cv2.cvtColor(hsv, cv2.COLOR_HSV2BGR)
         
         return graded
@@ -579,8 +887,8 @@ class VideoProcessor:
         h, w = frame.shape[:2]
         sorted_frame = frame.copy()
         
-        # Convert to HSV for better brightness-based sorting
-        hsv = cv2.cvtColor(sorted_frame, cv2.COLOR_BGR2HSV)
+        # Convert to HSV for better brightness-based sorting (V channel)
+        brightness = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)[:, :, 2]
         
         # Number of rows/columns to sort based on intensity
         # Scale more gradually: 0.0 = 0 strips, 0.1 = 1 strip, 1.0 = 15 strips
@@ -601,31 +909,16 @@ class VideoProcessor:
                 if y_end - y_start < 2:
                     continue
                 
-                # Get strip
-                strip = sorted_frame[y_start:y_end, :].copy()
-                strip_hsv = hsv[y_start:y_end, :].copy()
-                
                 # Sort pixels by brightness (V channel) within each column
                 # At lower intensity, only sort a percentage of columns
                 columns_to_sort = max(1, int(w * min(1.0, intensity * 3.0)))  # Scale columns with intensity
                 if columns_to_sort < w:
                     column_indices = np.random.choice(w, columns_to_sort, replace=False)
                 else:
-                    column_indices = range(w)
+                    column_indices = np.arange(w)
                 
-                for x in column_indices:
-                    column = strip[:, x]
-                    column_hsv = strip_hsv[:, x]
-                    
-                    # Get brightness values
-                    brightness = column_hsv[:, 2]
-                    
-                    # Create sorting indices based on brightness
-                    sort_indices = np.argsort(brightness)
-                    
-                    # Apply sorting
-                    sorted_column = column[sort_indices]
-                    sorted_frame[y_start:y_end, x] = sorted_column
+                with _PARALLEL_KERNEL_LOCK:
+                    _sort_lines_by_key(frame, brightness, sorted_frame, column_indices, y_start, y_end)
         else:
             # Vertical pixel sorting (sort columns)
             strip_width = w // max(1, num_strips)
@@ -636,31 +929,18 @@ class VideoProcessor:
                 if x_end - x_start < 2:
                     continue
                 
-                # Get strip
-                strip = sorted_frame[:, x_start:x_end].copy()
-                strip_hsv = hsv[:, x_start:x_end].copy()
-                
                 # Sort pixels by brightness within each row
                 # At lower intensity, only sort a percentage of rows
                 rows_to_sort = max(1, int(h * min(1.0, intensity * 3.0)))  # Scale rows with intensity
                 if rows_to_sort < h:
                     row_indices = np.random.choice(h, rows_to_sort, replace=False)
                 else:
-                    row_indices = range(h)
+                    row_indices = np.arange(h)
                 
-                for y in row_indices:
-                    row = strip[y, :]
-                    row_hsv = strip_hsv[y, :]
-                    
-                    # Get brightness values
-                    brightness = row_hsv[:, 2]
-                    
-                    # Create sorting indices
-                    sort_indices = np.argsort(brightness)
-                    
-                    # Apply sorting
-                    sorted_row = row[sort_indices]
-                    sorted_frame[y, x_start:x_end] = sorted_row
+                # Same kernel on transposed views: rows become columns
+                with _PARALLEL_KERNEL_LOCK:
+                    _sort_lines_by_key(frame.transpose(1, 0, 2), brightness.T,
+                                       sorted_frame.transpose(1, 0, 2), row_indices, x_start, x_end)
         
         return sorted_frame
     
@@ -738,23 +1018,23 @@ class VideoProcessor:
         
         h, w = frame.shape[:2]
         
-        # Create coordinate grids
+        # Pixel coordinates along each axis
         x = np.arange(w, dtype=np.float32)
         y = np.arange(h, dtype=np.float32)
-        X, Y = np.meshgrid(x, y)
         
         # Wave parameters based on intensity
         wave_amplitude = intensity * 30  # Max 30 pixels displacement
         wave_frequency = 0.02 + intensity * 0.05  # Wave frequency
         
-        # Create wave distortions
-        # Horizontal waves
-        wave_x = X + wave_amplitude * np.sin(Y * wave_frequency + np.random.random() * np.pi)
-        wave_y = Y + wave_amplitude * 0.5 * np.cos(X * wave_frequency + np.random.random() * np.pi)
+        # Create wave distortions. The x shift depends only on the row and the
+        # y shift only on the column, so the waves are evaluated per row/column
+        # and broadcast into the remap grids instead of over a full meshgrid
+        row_shift = wave_amplitude * np.sin(y * wave_frequency + np.random.random() * np.pi)
+        col_shift = wave_amplitude * 0.5 * np.cos(x * wave_frequency + np.random.random() * np.pi)
         
         # Remap image using wave distortion
-        map_x = wave_x.astype(np.float32)
-        map_y = wave_y.astype(np.float32)
+        map_x = np.add(x[np.newaxis, :], row_shift[:, np.newaxis], dtype=np.float32)
+        map_y = np.add(y[:, np.newaxis], col_shift[np.newaxis, :], dtype=np.float32)
         
         distorted = cv2.remap(frame, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
         
@@ -776,9 +1056,9 @@ class VideoProcessor:
             return frame
         
         h, w = frame.shape[:2]
-        vhs_frame = frame.copy().astype(np.float32)
         
-        # Scan lines (horizontal lines)
+        # Scan lines (horizontal lines) as a per-row gain
+        row_gain = np.ones(h, dtype=np.float32)
         if intensity > 0.2:
             num_lines = int(2 + intensity * 15)  # 2-17 lines
             line_spacing = h // (num_lines + 1)
@@ -788,21 +1068,14 @@ class VideoProcessor:
                 line_height = max(1, int(intensity * 3))
                 
                 # Darken scan lines
-                vhs_frame[line_y:line_y+line_height, :] *= 0.6
+                row_gain[line_y:line_y+line_height] *= 0.6
         
-        # Color bleeding (chromatic aberration)
-        if intensity > 0.3:
-            bleed_amount = int(intensity * 8)
-            b, g, r = cv2.split(vhs_frame)
-            
-            # Shift channels to create color bleeding
-            M_r = np.float32([[1, 0, bleed_amount], [0, 1, 0]])
-            M_b = np.float32([[1, 0, -bleed_amount], [0, 1, 0]])
-            
-            r_shifted = cv2.warpAffine(r, M_r, (w, h), borderMode=cv2.BORDER_REPLICATE)
-            b_shifted = cv2.warpAffine(b, M_b, (w, h), borderMode=cv2.BORDER_REPLICATE)
-            
-            vhs_frame = cv2.merge([b_shifted, g, r_shifted])
+        # Color bleeding (chromatic aberration): red shifted right, blue left,
+        # applied together with the scan lines in one pass
+        bleed_amount = int(intensity * 8) if intensity > 0.3 else 0
+        vhs_frame = np.empty((h, w, 3), dtype=np.float32)
+        with _PARALLEL_KERNEL_LOCK:
+            _vhs_scan_bleed(frame, row_gain, bleed_amount, vhs_frame)
         
         # Tape noise (random noise)
         if intensity > 0.4:
@@ -840,18 +1113,8 @@ class VideoProcessor:
         # High intensity = fewer levels (more artistic)
         num_levels = max(2, int(256 / (1 + intensity * 20)))  # 256 to ~12 levels
         
-        # Quantize each channel
-        posterized = frame.copy()
-        
-        for c in range(3):
-            channel = posterized[:, :, c]
-            # Create quantization levels
-            step = 256 / num_levels
-            quantized = (channel / step).astype(np.uint8) * step
-            quantized = np.clip(quantized, 0, 255)
-            posterized[:, :, c] = quantized
-        
-        return posterized
+        # Quantize each channel through a cached lookup table
+        return cv2.LUT(frame, _posterize_lut(num_levels))
     
     def apply_edge_detection_overlay(self, frame: np.ndarray, intensity: float) -> np.ndarray:
         """
@@ -971,37 +1234,32 @@ class VideoProcessor:
             return frame
         
         h, w = frame.shape[:2]
-        crt_frame = frame.copy().astype(np.float32)
         
         # Create scan line pattern (every other line darker)
         scan_line_spacing = max(2, int(3 - intensity * 2))  # 3-1 pixel spacing
+        row_gain = np.ones(h, dtype=np.float32)
         
         for y in range(0, h, scan_line_spacing * 2):
             line_end = min(y + scan_line_spacing, h)
             # Darken scan lines
-            crt_frame[y:line_end, :] *= (0.7 - intensity * 0.3)  # 0.7 to 0.4 brightness
+            row_gain[y:line_end] *= (0.7 - intensity * 0.3)  # 0.7 to 0.4 brightness
+        
+        crt_frame = np.empty_like(frame)
+        with _PARALLEL_KERNEL_LOCK:
+            _scale_rows(frame, row_gain, crt_frame)
         
         # Add slight curvature (CRT screen curve)
         if intensity > 0.5:
-            # Subtle barrel distortion
+            # Subtle barrel distortion (coordinate grids cached per frame size)
             center_x, center_y = w / 2, h / 2
-            x = np.arange(w, dtype=np.float32) - center_x
-            y = np.arange(h, dtype=np.float32) - center_y
-            X, Y = np.meshgrid(x, y)
-            
-            # Barrel distortion
-            r = np.sqrt(X**2 + Y**2)
-            max_r = np.sqrt(center_x**2 + center_y**2)
-            distortion = 1.0 + intensity * 0.1 * (r / max_r)**2
+            X, Y, radius_sq = _barrel_grid(h, w)
+            distortion = 1.0 + intensity * 0.1 * radius_sq
             
             map_x = (X / distortion + center_x).astype(np.float32)
             map_y = (Y / distortion + center_y).astype(np.float32)
             
-            crt_frame = cv2.remap(crt_frame.astype(np.uint8), map_x, map_y, 
-                                 cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE).astype(np.float32)
-        
-        # Convert back to uint8
-        crt_frame = np.clip(crt_frame, 0, 255).astype(np.uint8)
+            crt_frame = cv2.remap(crt_frame, map_x, map_y, 
+                                 cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
         
         return crt_frame
     
@@ -1103,6 +1361,7 @@ class VideoProcessor:
         natural_pan_x: float = 0.0,
         natural_pan_y: float = 0.0,
         natural_rotation_offset: float = 0.0,
+        stage_cache: Optional[dict] = None,
     ) -> np.ndarray:
         """
         Apply all effects to a frame in optimal order
@@ -1128,6 +1387,9 @@ class VideoProcessor:
             effect_mode: "direct" to apply effects directly, "layer" to apply as overlay layer
             blend_mode: Blending mode for layer mode (normal, multiply, screen, overlay, etc.)
             layer_opacity: Opacity of effects layer (0.0-1.0)
+            stage_cache: Optional dict reused across calls on the same input frame;
+                stages whose inputs and parameters are unchanged are not re-run
+                (see _run_stages)
             
         Returns:
             Processed frame
@@ -1156,47 +1418,51 @@ class VideoProcessor:
         else:
             original_transformed = None
         
-        frame = self.zoom_frame_with_pan(frame, combined_zoom, natural_pan_x, natural_pan_y)
-        frame = self.rotate_frame(frame, combined_rotation)
-        frame = self.apply_color_grade(frame, hue_shift, saturation, brightness)
+        stages = [
+            ('zoom', self.zoom_frame_with_pan, (combined_zoom, natural_pan_x, natural_pan_y)),
+            ('rotation', self.rotate_frame, (combined_rotation,)),
+            ('color_grade', self.apply_color_grade, (hue_shift, saturation, brightness)),
+        ]
         
         # Artistic effects (applied early to preserve detail)
         if pixel_sort_intensity > 0.0:
-            frame = self.apply_pixel_sorting(frame, pixel_sort_intensity)
+            stages.append(('pixel_sort', self.apply_pixel_sorting, (pixel_sort_intensity,)))
         
         if kaleidoscope_intensity > 0.0:
-            frame = self.apply_kaleidoscope(frame, kaleidoscope_intensity)
+            stages.append(('kaleidoscope', self.apply_kaleidoscope, (kaleidoscope_intensity,)))
         
         if wave_distortion_intensity > 0.0:
-            frame = self.apply_wave_distortion(frame, wave_distortion_intensity)
+            stages.append(('wave_distortion', self.apply_wave_distortion, (wave_distortion_intensity,)))
         
         # Corruption effects
         if glitch_intensity > 0.0:
-            frame = self.apply_glitch_effect(frame, glitch_intensity)
+            stages.append(('glitch', self.apply_glitch_effect, (glitch_intensity,)))
         
         if data_corruption_intensity > 0.0:
-            frame = self.apply_data_corruption(frame, data_corruption_intensity)
+            stages.append(('data_corruption', self.apply_data_corruption, (data_corruption_intensity,)))
         
         if artifacts_intensity > 0.0:
-            frame = self.apply_artifacts_effect(frame, artifacts_intensity)
+            stages.append(('artifacts', self.apply_artifacts_effect, (artifacts_intensity,)))
         
         # Stylization
         if posterization_intensity > 0.0:
-            frame = self.apply_posterization(frame, posterization_intensity)
+            stages.append(('posterization', self.apply_posterization, (posterization_intensity,)))
         
         if edge_detection_intensity > 0.0:
-            frame = self.apply_edge_detection_overlay(frame, edge_detection_intensity)
+            stages.append(('edge_detection', self.apply_edge_detection_overlay, (edge_detection_intensity,)))
         
         # Retro effects
         if vhs_intensity > 0.0:
-            frame = self.apply_vhs_degradation(frame, vhs_intensity)
+            stages.append(('vhs', self.apply_vhs_degradation, (vhs_intensity,)))
         
         if scan_lines_intensity > 0.0:
-            frame = self.apply_scan_lines_crt(frame, scan_lines_intensity)
+            stages.append(('scan_lines', self.apply_scan_lines_crt, (scan_lines_intensity,)))
         
         # Blur last
         if blur_intensity > 0.0:
-            frame = self.apply_motion_blur(frame, blur_intensity)
+            stages.append(('blur', self.apply_motion_blur, (blur_intensity,)))
+        
+        frame = self._run_stages(frame, stages, stage_cache)
         
         # Apply layer blending if in layer mode
         if effect_mode == "layer" and original_transformed is not None:
@@ -1204,6 +1470,40 @@ class VideoProcessor:
         
         return frame
     
+    @staticmethod
+    def _run_stages(frame: np.ndarray, stages: list, stage_cache: Optional[dict] = None) -> np.ndarray:
+        """
+        Run (name, fn, args) effect stages in order, frame = fn(frame, *args)
+        
+        With a stage_cache, the output of every stage is memoized under the
+        signature of the whole chain up to it. When the same input frame comes
+        back with only a later stage's parameters changed (e.g. one slider
+        dragged), the unchanged prefix is taken from the cache and only the
+        remaining stages run. Effect functions never modify their input, so
+        cached outputs are safe to reuse.
+        """
+        if stage_cache is None:
+            for _, fn, args in stages:
+                frame = fn(frame, *args)
+            return frame
+        
+        if stage_cache.get('source') is not frame:
+            stage_cache['source'] = frame
+            stage_cache['outputs'] = []
+        outputs = stage_cache['outputs']
+        
+        signature = ()
+        for i, (name, fn, args) in enumerate(stages):
+            signature += ((name, args),)
+            if i < len(outputs) and outputs[i][0] == signature:
+                frame = outputs[i][1]
+                continue
+            # Everything downstream depends on this stage, so drop it
+            del outputs[i:]
+            frame = fn(frame, *args)
+            outputs.append((signature, frame))
+        return frame
+    
     # ==================== Legacy Processing (Backward Compatible) ====================
     
     def process_video(
@@ -1214,7 +1514,9 @@ class VideoProcessor:
         frame_times: np.ndarray,
         zoom_factor: float = 1.3,
         rotation_angle: float = 5.0,
-        effect_duration: float = 0.5
+        effect_duration: float = 0.5,
+        audio_path: Optional[str] = None,
+        audio_codec: str = 'aac'
     ):
         """
         Process video with effects based on audio analysis (legacy method)
@@ -1227,6 +1529,8 @@ class VideoProcessor:
             zoom_factor: Zoom factor for bass effects
             rotation_angle: Rotation angle in degrees for treble effects
             effect_duration: Duration of each effect in seconds
+            audio_path: If set, frames are piped to ffmpeg and this file's audio is muxed in
+            audio_codec: ffmpeg codec for the muxed audio track
         """
         print(f"Processing video with effects...")
         print(f"  Zoom factor: {zoom_factor}x")
@@ -1285,8 +1589,7 @@ class VideoProcessor:
                         effect_map[frame_idx] = (current_zoom, current_rotation + rotation)
         
         # Setup video writer
-        fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-        out = cv2.VideoWriter(output_path, fourcc, self.fps, (self.width, self.height))
+        out = self._open_writer(output_path, audio_path, audio_codec)
         
         # Process frames
         frame_idx = 0
@@ -1348,7 +1651,10 @@ class VideoProcessor:
         # Intensity sensitivity (how much to scale effects by intensity)
         intensity_sensitivity: float = 0.7,
         # Smoothness (interpolation curve strength)
-        smoothness: float = 0.8
+        smoothness: float = 0.8,
+        # Optional audio muxed in while encoding
+        audio_path: Optional[str] = None,
+        audio_codec: str = 'aac'
     ):
         """
         Enhanced video processing with continuous frequency reactivity
@@ -1375,6 +1681,8 @@ class VideoProcessor:
             snare_window: Time window around snares to trigger flash (seconds)
             intensity_sensitivity: How sensitive effects are to intensity (0.0-1.0)
             smoothness: Interpolation smoothness (0.0=linear, 1.0=very smooth)
+            audio_path: If set, frames are piped to ffmpeg and this file's audio is muxed in
+            audio_codec: ffmpeg codec for the muxed audio track
         """
         print(f"Processing video with enhanced effects...")
         print(f"  Zoom factor: {zoom_factor}x")
@@ -1391,13 +1699,13 @@ class VideoProcessor:
         
         # Get beat information if available
         if bass_beat_frames is not None and len(bass_beat_frames) > 0:
-            bass_beat_times = frame_times[bass_beat_frames]
+            bass_beat_times = np.sort(frame_times[bass_beat_frames])
         else:
             bass_beat_times = np.array([])
         
         # Get snare information if available
         if snare_hit_frames is not None and len(snare_hit_frames) > 0:
-            snare_hit_times = frame_times[snare_hit_frames]
+            snare_hit_times = np.sort(frame_times[snare_hit_frames])
         else:
             snare_hit_times = np.array([])
         
@@ -1408,6 +1716,10 @@ class VideoProcessor:
         treble_energy = energy_curves.get('treble', np.zeros(len(frame_times)))
         high_treble_energy = energy_curves.get('high_treble', np.zeros(len(frame_times)))
         
+        # Distance from every frame to its nearest beat/snare, looked up per frame
+        beat_distances = self.nearest_event_distances(bass_beat_times, self.total_frames, self.fps)
+        snare_distances = self.nearest_event_distances(snare_hit_times, self.total_frames, self.fps)
+        
         # Interpolate energy curves to video frame rate
         # (spectrogram frames may not match video frames exactly)
         video_frame_times = np.linspace(0, self.duration, self.total_frames)
@@ -1432,8 +1744,7 @@ class VideoProcessor:
                 high_treble_interp = np.convolve(high_treble_interp, kernel, mode='same')
         
         # Setup video writer
-        fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-        out = cv2.VideoWriter(output_path, fourcc, self.fps, (self.width, self.height))
+        out = self._open_writer(output_path, audio_path, audio_codec)
         
         # Process frames
         frame_idx = 0
@@ -1451,13 +1762,10 @@ class VideoProcessor:
             
             # Calculate effect intensities (combine bands with contributions)
             # Zoom: beat-triggered or continuous
-            current_time = frame_idx / self.fps
-            
             if beat_triggered_zoom and len(bass_beat_times) > 0:
                 # Beat-triggered zoom: only activate near detected beats
                 # Find nearest beat
-                time_distances = np.abs(bass_beat_times - current_time)
-                nearest_beat_distance = np.min(time_distances) if len(time_distances) > 0 else float('inf')
+                nearest_beat_distance = beat_distances[frame_idx]
                 
                 if nearest_beat_distance <= beat_window:
                     # Within beat window - calculate zoom based on distance from beat
@@ -1513,8 +1821,7 @@ class VideoProcessor:
             # Snare-triggered brightness flash
             if snare_triggered_flash and len(snare_hit_times) > 0:
                 # Find nearest snare
-                snare_time_distances = np.abs(snare_hit_times - current_time)
-                nearest_snare_distance = np.min(snare_time_distances) if len(snare_time_distances) > 0 else float('inf')
+                nearest_snare_distance = snare_distances[frame_idx]
                 
                 if nearest_snare_distance <= snare_window:
                     # Within snare window - add quick brightness flash